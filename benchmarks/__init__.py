@@ -0,0 +1 @@
+"""Performance benchmarks for the bridge (run with `python -m benchmarks.run`)."""
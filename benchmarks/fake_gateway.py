@@ -0,0 +1,266 @@
+"""In-process stand-in for hc-http-gw, for benchmarks.
+
+Serves the gateway contract the bridge relies on:
+
+    GET /{dna_hash}/{app_id}/{zome}/{fn_name}?payload=<base64 JSON>
+
+backed by in-memory dicts instead of a conductor. Hashes are returned as
+39-byte arrays, as hc-http-gw v0.3.x does, so responses exercise the same
+decoding path as the real gateway. Latency and error injection are
+configurable so the client-side machinery (pooling, retries, metrics) can
+be measured under realistic conditions:
+
+    with FakeGateway(latency=0.005, error_rate=0.01) as gateway:
+        client = HolochainGatewayClient(gateway.config())
+        ...
+
+Only the zome_resource functions used by sync and discovery are
+implemented; anything else answers 500 like an unknown zome function.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from bridge.config import GatewayConfig
+
+ACTION_HASH_PREFIX = bytes([0x84, 0x29, 0x24])
+AGENT_PUB_KEY_PREFIX = bytes([0x84, 0x20, 0x24])
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class ZomeError(Exception):
+    """A zome call failure, answered with HTTP 500 like hc-http-gw does."""
+
+
+class FakeGateway:
+    """Threaded HTTP server emulating hc-http-gw over an in-memory DHT.
+
+    Args:
+        latency: Seconds added to every request (conductor + network time).
+        jitter: Extra uniformly random delay in [0, jitter) seconds.
+        error_rate: Fraction of requests answered with `error_status`
+            instead of being processed.
+        error_status: HTTP status of injected errors.
+        seed: Seed for jitter and error injection.
+        dna_hash: DNA hash accepted in request paths.
+        app_id: App id accepted in request paths.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+        dna_hash: str = "uhC0kBenchmarkDna",
+        app_id: str = "nondominium",
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.dna_hash = dna_hash
+        self.app_id = app_id
+        self.agent = make_hash(AGENT_PUB_KEY_PREFIX, b"agent")
+        self.requests = 0
+        self.injected_errors = 0
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._specs: dict[bytes, dict[str, Any]] = {}
+        self._resources: dict[bytes, dict[str, Any]] = {}
+        self._spec_resources: dict[bytes, list[bytes]] = {}
+        self._by_category: dict[str, list[bytes]] = {}
+        self._functions: dict[str, Callable[[Any], Any]] = {
+            "create_resource_specification": self._create_resource_specification,
+            "get_all_resource_specifications": self._get_all_resource_specifications,
+            "get_latest_resource_specification": self._get_latest_resource_specification,
+            "get_resource_specifications_by_category": self._get_specs_by_category,
+            "create_economic_resource": self._create_economic_resource,
+            "get_all_economic_resources": self._get_all_economic_resources,
+            "get_latest_economic_resource": self._get_latest_economic_resource,
+            "get_resources_by_specification": self._get_resources_by_specification,
+            "update_resource_state": self._update_resource_state,
+        }
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        handler = type("Handler", (_Handler,), {"gateway": self})
+        self._server = _Server(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> FakeGateway:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("FakeGateway is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def config(self, timeout: int = 30) -> GatewayConfig:
+        """A GatewayConfig pointing at this server."""
+        return GatewayConfig(
+            url=self.url, timeout=timeout, app_id=self.app_id, dna_hash=self.dna_hash
+        )
+
+    # --- Request handling (called on server threads) ---
+
+    def handle(self, path: str) -> tuple[int, bytes]:
+        """Process one request path; returns (status, body)."""
+        parts = urlsplit(path)
+        segments = parts.path.strip("/").split("/")
+        if len(segments) != 4 or segments[:2] != [self.dna_hash, self.app_id]:
+            return 404, b"Not Found"
+        fn_name = segments[3]
+
+        delay = self.latency + (self._uniform(self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            self.requests += 1
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.injected_errors += 1
+                return self.error_status, b"Injected failure"
+
+        function = self._functions.get(fn_name)
+        if function is None:
+            return 500, f"Function not found: {fn_name}".encode()
+        encoded = parse_qs(parts.query).get("payload", [None])[0]
+        try:
+            payload = json.loads(base64.b64decode(encoded)) if encoded else None
+            with self._lock:
+                return 200, json.dumps(function(payload)).encode()
+        except ZomeError as exc:
+            return 500, str(exc).encode()
+        except (ValueError, KeyError, TypeError) as exc:
+            return 400, f"Invalid payload: {exc}".encode()
+
+    def _uniform(self, upper: float) -> float:
+        with self._lock:
+            return self._rng.uniform(0.0, upper)
+
+    def _next_hash(self) -> list[int]:
+        self._counter += 1
+        return make_hash(ACTION_HASH_PREFIX, self._counter.to_bytes(8, "big"))
+
+    # --- zome_resource functions (called with the lock held) ---
+
+    def _create_resource_specification(self, payload: dict[str, Any]) -> dict[str, Any]:
+        spec = {
+            "name": payload["name"],
+            "description": payload["description"],
+            "category": payload["category"],
+            "image_url": payload.get("image_url"),
+            "tags": payload.get("tags", []),
+            "is_active": True,
+        }
+        spec_hash = self._next_hash()
+        key = bytes(spec_hash)
+        self._specs[key] = spec
+        self._spec_resources[key] = []
+        self._by_category.setdefault(spec["category"], []).append(key)
+        rule_hashes = [self._next_hash() for _ in payload.get("governance_rules", [])]
+        return {"spec_hash": spec_hash, "spec": spec, "governance_rule_hashes": rule_hashes}
+
+    def _get_all_resource_specifications(self, payload: None) -> dict[str, Any]:
+        return {"specifications": list(self._specs.values())}
+
+    def _get_latest_resource_specification(self, payload: list[int]) -> dict[str, Any]:
+        return _lookup(self._specs, payload, "ResourceSpecification")
+
+    def _get_specs_by_category(self, payload: str) -> list[dict[str, Any]]:
+        return [self._specs[key] for key in self._by_category.get(payload, [])]
+
+    def _create_economic_resource(self, payload: dict[str, Any]) -> dict[str, Any]:
+        spec_key = bytes(payload["spec_hash"])
+        if spec_key not in self._specs:
+            raise ZomeError("ResourceSpecification not found")
+        resource = {
+            "quantity": payload["quantity"],
+            "unit": payload["unit"],
+            "custodian": self.agent,
+            "current_location": payload.get("current_location"),
+            "state": "PendingValidation",
+        }
+        resource_hash = self._next_hash()
+        self._resources[bytes(resource_hash)] = resource
+        self._spec_resources[spec_key].append(bytes(resource_hash))
+        return {"resource_hash": resource_hash, "resource": resource}
+
+    def _get_all_economic_resources(self, payload: None) -> dict[str, Any]:
+        return {"resources": list(self._resources.values())}
+
+    def _get_latest_economic_resource(self, payload: list[int]) -> dict[str, Any]:
+        return _lookup(self._resources, payload, "EconomicResource")
+
+    def _get_resources_by_specification(self, payload: list[int]) -> list[dict[str, Any]]:
+        keys = self._spec_resources.get(bytes(payload), [])
+        return [self._resources[key] for key in keys]
+
+    def _update_resource_state(self, payload: dict[str, Any]) -> dict[str, Any]:
+        resource = _lookup(self._resources, payload["resource_hash"], "EconomicResource")
+        resource["state"] = payload["new_state"]
+        return {"updated_resource_hash": payload["resource_hash"], "updated_resource": resource}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    gateway: FakeGateway
+    protocol_version = "HTTP/1.1"  # keep-alive, like hc-http-gw
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def do_GET(self) -> None:
+        status, body = self.gateway.handle(self.path)
+        self.send_response(status)
+        content_type = "application/json" if status == 200 else "text/plain"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def make_hash(prefix: bytes, seed: bytes) -> list[int]:
+    """A 39-byte Holochain hash: 3-byte type prefix, 32-byte digest, 4-byte location."""
+    digest = hashlib.blake2b(seed, digest_size=32).digest()
+    return list(prefix + digest + bytes(4))
+
+
+def _lookup(table: dict[bytes, dict[str, Any]], key: list[int], kind: str) -> dict[str, Any]:
+    record = table.get(bytes(key))
+    if record is None:
+        raise ZomeError(f"{kind} not found")
+    return record
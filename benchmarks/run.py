@@ -0,0 +1,125 @@
+"""Run the benchmark suite and emit machine-readable JSON.
+
+Usage:
+    python -m benchmarks.run --sizes 1000,10000 --output results.json
+    python -m benchmarks.run --sizes 1000000 --benchmarks validation,encoding
+    python -m benchmarks.run --latency-ms 5 --jitter-ms 2 --error-rate 0.01
+
+The JSON document holds a `meta` block (timestamp, interpreter, library
+versions, git commit, run parameters) and one `results` entry per
+benchmark and size, so successive runs can be diffed for regressions.
+A short human-readable summary goes to stderr.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from benchmarks.suite import BENCHMARKS, SuiteConfig, run_suite
+
+SCHEMA_VERSION = 1
+
+
+def parse_args(argv: list[str] | None = None) -> tuple[SuiteConfig, Path | None]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000", help="comma-separated catalog sizes")
+    parser.add_argument(
+        "--benchmarks", default=",".join(BENCHMARKS), help="comma-separated subset to run"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="sync/index concurrency")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="fake gateway latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="extra random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="injected error fraction")
+    parser.add_argument(
+        "--sync-max", type=int, default=10_000, help="cap on products synced over HTTP"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    benchmarks = tuple(name for name in args.benchmarks.split(",") if name)
+    unknown = set(benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    config = SuiteConfig(
+        sizes=tuple(int(size) for size in args.sizes.split(",") if size),
+        benchmarks=benchmarks,
+        workers=args.workers,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        sync_max=args.sync_max,
+        seed=args.seed,
+    )
+    return config, args.output
+
+
+def build_report(config: SuiteConfig, results: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pydantic": pydantic.VERSION,
+            "git_commit": _git_commit(),
+            "config": asdict(config),
+        },
+        "results": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip()
+
+
+def _summary(result: dict[str, Any]) -> str:
+    name, size = result["benchmark"], result["size"]
+    if name == "sync":
+        return (
+            f"sync        {size:>9,}  {result['products_per_second']:>10,.0f} products/s  "
+            f"({result['errors']} errors)"
+        )
+    if name == "discovery":
+        return (
+            f"discovery   {size:>9,}  refresh {result['refresh_seconds']:.2f}s  "
+            f"availability p95 {result['availability_indexed_ms']['p95']:.3f}ms indexed / "
+            f"{result['availability_gateway_ms']['p95']:.2f}ms gateway"
+        )
+    steps = {k: v for k, v in result.items() if isinstance(v, dict) and "us_per_item" in v}
+    detail = "  ".join(f"{k} {v['us_per_item']:.1f}us" for k, v in steps.items())
+    return f"{name:<11} {size:>9,}  {detail}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    config, output = parse_args(argv)
+    results = run_suite(config)
+    for result in results:
+        print(_summary(result), file=sys.stderr)
+
+    text = json.dumps(build_report(config, results), indent=2)
+    if output is None:
+        print(text)
+    else:
+        output.write_text(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
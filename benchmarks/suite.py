@@ -0,0 +1,408 @@
+"""Benchmark definitions: sync throughput, discovery latency, validation and encoding cost.
+
+Each benchmark takes a catalog size and returns a flat, JSON-serializable
+dict of measurements. Gateway-bound benchmarks (sync, discovery) run
+against a FakeGateway and are capped at `sync_max` products, since they
+cost two HTTP round-trips per product; the CPU-bound ones (validation,
+encoding) run at the full size, cycling over a bounded chunk of inputs so
+memory stays flat up to 1M products. The list-response benchmark parses
+one body of up to `RESPONSE_MAX` elements, the largest list a single
+gateway call is expected to return.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fake_gateway import ACTION_HASH_PREFIX, AGENT_PUB_KEY_PREFIX, FakeGateway, make_hash
+from bridge.discovery import DiscoveryIndex, ResourceDiscovery
+from bridge.erp_mock import SYNTHETIC_CATEGORIES, MockERPClient, SyntheticCatalog
+from bridge.gateway_client import COMMITMENT_LIST, VALIDATION_RECEIPT_LIST, HolochainGatewayClient
+from bridge.hash_codec import encode_hash
+from bridge.mapper import product_to_economic_resource, product_to_resource_spec
+from bridge.metrics import MetricsRegistry
+from bridge.models import (
+    Commitment,
+    CreateEconomicResourceOutput,
+    CreateResourceSpecificationOutput,
+    EconomicResource,
+    GetAllEconomicResourcesOutput,
+    IssueParticipationReceiptsInput,
+    ParticipationClaimType,
+    PerformanceMetrics,
+    ValidationReceipt,
+)
+from bridge.sync import NondominiumBridge
+
+BENCHMARKS = ("sync", "discovery", "validation", "encoding", "responses")
+CHUNK = 10_000  # distinct inputs materialized for the CPU-bound benchmarks
+RESPONSE_MAX = 100_000  # elements in the largest list-response body
+QUERY_SAMPLES = 200  # availability lookups timed per discovery run
+
+
+@dataclass(frozen=True)
+class SuiteConfig:
+    """Knobs shared by every benchmark in a run."""
+
+    sizes: tuple[int, ...] = (1_000, 10_000)
+    benchmarks: tuple[str, ...] = BENCHMARKS
+    workers: int = 8
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    sync_max: int = 10_000
+    seed: int = 0
+
+
+def run_suite(config: SuiteConfig) -> list[dict[str, Any]]:
+    """Run the selected benchmarks for every size, in order."""
+    results: list[dict[str, Any]] = []
+    for size in config.sizes:
+        if "sync" in config.benchmarks or "discovery" in config.benchmarks:
+            results += _gateway_benchmarks(size, config)
+        if "validation" in config.benchmarks:
+            results.append(bench_validation(size, config.seed))
+        if "encoding" in config.benchmarks:
+            results.append(bench_encoding(size, config.seed))
+        if "responses" in config.benchmarks:
+            results.append(bench_responses(size))
+    return results
+
+
+def _gateway_benchmarks(size: int, config: SuiteConfig) -> list[dict[str, Any]]:
+    """Sync into a fresh fake gateway, then (optionally) index and query it."""
+    synced = min(size, config.sync_max)
+    results = []
+    with (
+        FakeGateway(
+            latency=config.latency,
+            jitter=config.jitter,
+            error_rate=config.error_rate,
+            seed=config.seed,
+        ) as gateway,
+        tempfile.TemporaryDirectory() as tmp,
+    ):
+        metrics = MetricsRegistry()
+        client = HolochainGatewayClient(gateway.config(), metrics=metrics)
+        bridge = NondominiumBridge(
+            MockERPClient.synthetic(synced, seed=config.seed),
+            client,
+            state_path=Path(tmp) / "state.db",
+            workers=config.workers,
+        )
+        sync = bench_sync(bridge, gateway, metrics)
+        if "sync" in config.benchmarks:
+            results.append(_entry("sync", size, synced, sync))
+        if "discovery" in config.benchmarks:
+            discovery = bench_discovery(bridge, client, config.workers)
+            results.append(_entry("discovery", size, synced, discovery))
+    return results
+
+
+def bench_sync(
+    bridge: NondominiumBridge, gateway: FakeGateway, metrics: MetricsRegistry
+) -> dict[str, Any]:
+    """Full sync of the bridge's catalog, then a no-change delta re-run."""
+    start = time.perf_counter()
+    result = bridge.sync_inventory()
+    seconds = time.perf_counter() - start
+    requests = gateway.requests
+
+    start = time.perf_counter()
+    bridge.sync_inventory(delta=True)
+    rerun_seconds = time.perf_counter() - start
+
+    return {
+        "products": result.total_processed,
+        "resources_created": result.resources_created,
+        "errors": len(result.errors),
+        "seconds": seconds,
+        "products_per_second": _rate(result.total_processed, seconds),
+        "gateway_requests": requests,
+        "injected_errors": gateway.injected_errors,
+        "request_latency_ms": {
+            fn_name: {"p50": stats.p50 * 1000, "p95": stats.p95 * 1000}
+            for (_, fn_name), stats in metrics.snapshot().items()
+        },
+        "delta_rerun_seconds": rerun_seconds,
+        "delta_rerun_products_per_second": _rate(result.total_processed, rerun_seconds),
+    }
+
+
+def bench_discovery(
+    bridge: NondominiumBridge, client: HolochainGatewayClient, workers: int
+) -> dict[str, Any]:
+    """Index refresh time and query latency, indexed vs. straight to the gateway."""
+    index = DiscoveryIndex()
+    start = time.perf_counter()
+    index.refresh_from_state(client, bridge.state, workers=workers)
+    refresh_seconds = time.perf_counter() - start
+
+    indexed = ResourceDiscovery(client, index)
+    direct = ResourceDiscovery(client)
+    spec_hashes = [entry["spec_hash"] for _, entry in bridge.state.iter_entries()]
+    sample = spec_hashes[:: max(1, len(spec_hashes) // QUERY_SAMPLES)][:QUERY_SAMPLES]
+
+    start = time.perf_counter()
+    discovered = indexed.discover_all()
+    discover_all_seconds = time.perf_counter() - start
+
+    return {
+        "specs_indexed": len(index),
+        "resources_indexed": len(discovered),
+        "refresh_seconds": refresh_seconds,
+        "discover_all_ms": discover_all_seconds * 1000,
+        "by_category_ms": _latencies(indexed.discover_by_category, SYNTHETIC_CATEGORIES),
+        "availability_indexed_ms": _latencies(indexed.check_availability, sample),
+        "availability_gateway_ms": _latencies(direct.check_availability, sample),
+        "by_category_gateway_ms": _latencies(direct.discover_by_category, SYNTHETIC_CATEGORIES),
+    }
+
+
+def bench_validation(size: int, seed: int = 0) -> dict[str, Any]:
+    """Cost of turning gateway responses into models, from dicts and from raw bytes."""
+    agent = make_hash(AGENT_PUB_KEY_PREFIX, b"agent")
+    resources = []
+    specs = []
+    for product in SyntheticCatalog(min(size, CHUNK), seed=seed):
+        product_id = product.id
+        resource = {
+            "quantity": product.qty_available,
+            "unit": product.uom_name,
+            "custodian": agent,
+            "current_location": None,
+            "state": "PendingValidation",
+        }
+        resources.append(
+            {
+                "resource_hash": make_hash(ACTION_HASH_PREFIX, product_id.to_bytes(8, "big")),
+                "resource": resource,
+            }
+        )
+        specs.append(
+            {
+                "spec_hash": make_hash(ACTION_HASH_PREFIX, product_id.to_bytes(8, "little")),
+                "spec": product_to_resource_spec(product).model_dump(
+                    mode="json", exclude={"governance_rules"}
+                ),
+                "governance_rule_hashes": [],
+            }
+        )
+    resource_bodies = [json.dumps(r).encode() for r in resources]
+    spec_bodies = [json.dumps(s).encode() for s in specs]
+
+    timings = {
+        "resource_output_validate": _timed_over(
+            size, resources, CreateEconomicResourceOutput.model_validate
+        ),
+        "resource_output_decode_validate": _timed_over(
+            size,
+            resource_bodies,
+            lambda b: CreateEconomicResourceOutput.model_validate(json.loads(b)),
+        ),
+        "resource_output_validate_json": _timed_over(
+            size, resource_bodies, CreateEconomicResourceOutput.model_validate_json
+        ),
+        "economic_resource_validate": _timed_over(
+            size, [r["resource"] for r in resources], EconomicResource.model_validate
+        ),
+        "spec_output_validate": _timed_over(
+            size, specs, CreateResourceSpecificationOutput.model_validate
+        ),
+        "spec_output_decode_validate": _timed_over(
+            size,
+            spec_bodies,
+            lambda b: CreateResourceSpecificationOutput.model_validate(json.loads(b)),
+        ),
+        "spec_output_validate_json": _timed_over(
+            size, spec_bodies, CreateResourceSpecificationOutput.model_validate_json
+        ),
+    }
+    return _entry("validation", size, size, _per_item(size, timings))
+
+
+def bench_encoding(size: int, seed: int = 0) -> dict[str, Any]:
+    """Cost of each step from ERP product to gateway query parameter.
+
+    `encode_*` starts from a model_dump(mode="json") dict, the path every
+    write took before models were encoded directly; `encode_*_model` is the
+    current path, `dump_encode_*` the old one end to end.
+    """
+    products = list(SyntheticCatalog(min(size, CHUNK), seed=seed))
+    spec_hash = "uhCkk" + "A" * 48
+    spec_inputs = [product_to_resource_spec(p) for p in products]
+    resource_inputs = [product_to_economic_resource(p, spec_hash) for p in products]
+    receipt_inputs = [_receipts_input(p.id, p.description) for p in products]
+    spec_dumps = [s.model_dump(mode="json") for s in spec_inputs]
+    resource_dumps = [r.model_dump(mode="json") for r in resource_inputs]
+    encode = HolochainGatewayClient._encode_payload
+
+    timings = {
+        "map_spec": _timed_over(size, products, product_to_resource_spec),
+        "map_resource": _timed_over(
+            size, products, lambda p: product_to_economic_resource(p, spec_hash)
+        ),
+        "dump_spec": _timed_over(size, spec_inputs, lambda s: s.model_dump(mode="json")),
+        "dump_resource": _timed_over(size, resource_inputs, lambda r: r.model_dump(mode="json")),
+        "encode_spec": _timed_over(size, spec_dumps, encode),
+        "encode_resource": _timed_over(size, resource_dumps, encode),
+        "encode_spec_model": _timed_over(size, spec_inputs, encode),
+        "encode_resource_model": _timed_over(size, resource_inputs, encode),
+        "dump_encode_receipts": _timed_over(
+            size, receipt_inputs, lambda r: encode(r.model_dump(mode="json"))
+        ),
+        "encode_receipts_model": _timed_over(size, receipt_inputs, encode),
+    }
+    return _entry("encoding", size, size, _per_item(size, timings))
+
+
+def _receipts_input(product_id: int, notes: str) -> IssueParticipationReceiptsInput:
+    """A PPR issuance input: five hashes, two metric blocks, a long note."""
+    key = product_id.to_bytes(8, "big")
+    action_hash = encode_hash(bytes(make_hash(ACTION_HASH_PREFIX, key)))
+    agent = encode_hash(bytes(make_hash(AGENT_PUB_KEY_PREFIX, key)))
+    metrics = PerformanceMetrics(
+        timeliness=0.9, quality=0.8, reliability=0.95, communication=0.7, overall_satisfaction=0.85
+    )
+    return IssueParticipationReceiptsInput(
+        fulfills=action_hash,
+        fulfilled_by=action_hash,
+        provider=agent,
+        receiver=agent,
+        claim_types=[
+            ParticipationClaimType.CUSTODY_TRANSFER,
+            ParticipationClaimType.CUSTODY_ACCEPTANCE,
+        ],
+        provider_metrics=metrics,
+        receiver_metrics=metrics,
+        resource_hash=action_hash,
+        notes=notes,
+    )
+
+
+def bench_responses(size: int) -> dict[str, Any]:
+    """Cost of parsing one list-response body, json.loads + per-item vs raw-bytes adapter."""
+    count = min(size, RESPONSE_MAX)
+    agent, item = "uhCAk" + "A" * 48, "uhCkk" + "B" * 48
+    resources = json.dumps(
+        {
+            "resources": [
+                {
+                    "quantity": float(i % 50),
+                    "unit": "unit",
+                    "custodian": make_hash(AGENT_PUB_KEY_PREFIX, b"agent"),
+                    "current_location": None,
+                    "state": "Active",
+                }
+                for i in range(count)
+            ]
+        }
+    ).encode()
+    commitments = json.dumps(
+        [
+            {
+                "action": "Use",
+                "provider": agent,
+                "receiver": agent,
+                "resource_inventoried_as": item,
+                "due_date": 1_700_000_000_000_000 + i,
+                "note": f"Use request {i}",
+                "committed_at": 1_699_000_000_000_000 + i,
+            }
+            for i in range(count)
+        ]
+    ).encode()
+    receipts = json.dumps(
+        [
+            {
+                "validator": agent,
+                "validated_item": item,
+                "validation_type": "resource_approval",
+                "approved": i % 5 != 0,
+                "notes": None,
+                "validated_at": 1_699_000_000_000_000 + i,
+            }
+            for i in range(count)
+        ]
+    ).encode()
+
+    timings = {
+        "resources_loads_validate": _timed(
+            lambda: GetAllEconomicResourcesOutput.model_validate(json.loads(resources))
+        ),
+        "resources_validate_json": _timed(
+            lambda: GetAllEconomicResourcesOutput.model_validate_json(resources)
+        ),
+        "commitments_loads_validate": _timed(
+            lambda: [Commitment.model_validate(c) for c in json.loads(commitments)]
+        ),
+        "commitments_validate_json": _timed(lambda: COMMITMENT_LIST.validate_json(commitments)),
+        "receipts_loads_validate": _timed(
+            lambda: [ValidationReceipt.model_validate(r) for r in json.loads(receipts)]
+        ),
+        "receipts_validate_json": _timed(lambda: VALIDATION_RECEIPT_LIST.validate_json(receipts)),
+    }
+    return _entry("responses", size, count, _per_item(count, timings))
+
+
+# --- Helpers ---
+
+
+def _entry(name: str, requested: int, size: int, metrics: dict[str, Any]) -> dict[str, Any]:
+    entry: dict[str, Any] = {"benchmark": name, "size": size}
+    if size != requested:
+        entry["requested_size"] = requested
+    entry.update(metrics)
+    return entry
+
+
+def _timed_over(size: int, inputs: Sequence[Any], fn: Callable[[Any], object]) -> float:
+    """Seconds to apply fn to `size` items, cycling over inputs."""
+    done = 0
+    start = time.perf_counter()
+    while done < size:
+        batch = inputs[: size - done]
+        for item in batch:
+            fn(item)
+        done += len(batch)
+    return time.perf_counter() - start
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _per_item(size: int, timings: dict[str, float]) -> dict[str, Any]:
+    return {
+        name: {"seconds": seconds, "us_per_item": seconds / size * 1e6 if size else 0.0}
+        for name, seconds in timings.items()
+    }
+
+
+def _latencies(fn: Callable[[Any], object], args: Iterable[Any]) -> dict[str, float]:
+    """p50/p95/max latency of fn over args, in milliseconds."""
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "p50": samples[int(0.50 * (len(samples) - 1))],
+        "p95": samples[int(0.95 * (len(samples) - 1))],
+        "max": samples[-1],
+    }
+
+
+def _rate(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else 0.0
@@ -0,0 +1,760 @@
+"""Asyncio-native client for Nondominium via hc-http-gw.
+
+Mirrors HolochainGatewayClient method-for-method with identical typed
+outputs, but runs on a pooled httpx.AsyncClient so callers can keep many
+zome calls in flight at once:
+
+    async with AsyncHolochainGatewayClient(config) as client:
+        outputs = await asyncio.gather(
+            *(client.create_resource_specification(s) for s in specs)
+        )
+
+The connection pool is capped by GatewayConfig.max_connections; requests
+beyond the cap wait for a free connection instead of failing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from types import TracebackType
+from typing import Any, TypeVar, overload
+
+import httpx
+
+from bridge.cache import CacheKey, ResponseCache
+from bridge.config import GatewayConfig
+from bridge.deadline import remaining
+from bridge.gateway_client import (
+    READ_ONLY_FUNCTIONS,
+    BulkResult,
+    CircuitOpenError,
+    DeadlineExceeded,
+    GatewayConnectError,
+    GatewayError,
+    HolochainGatewayClient,
+    model_parser,
+)
+from bridge.hedging import HedgePolicy
+from bridge.lazy import LazyList
+from bridge.metrics import MetricsRegistry
+from bridge.models import (
+    Claim,
+    ClaimCommitmentInput,
+    ClaimCommitmentOutput,
+    Commitment,
+    CreateEconomicResourceOutput,
+    CreateResourceSpecificationOutput,
+    CreateResourceValidationInput,
+    CreateResourceValidationOutput,
+    CreateValidationReceiptInput,
+    CreateValidationReceiptOutput,
+    DeriveReputationSummaryInput,
+    DeriveReputationSummaryOutput,
+    EconomicEvent,
+    EconomicResource,
+    EconomicResourceInput,
+    GetAllEconomicResourcesOutput,
+    GetAllResourceSpecificationsOutput,
+    GetResourceSpecWithRulesOutput,
+    IssueParticipationReceiptsInput,
+    IssueParticipationReceiptsOutput,
+    LogEconomicEventInput,
+    LogEconomicEventOutput,
+    LogInitialTransferInput,
+    LogInitialTransferOutput,
+    ProposeCommitmentInput,
+    ProposeCommitmentOutput,
+    ResourceSpecification,
+    ResourceSpecificationInput,
+    ResourceValidation,
+    TransferCustodyInput,
+    TransferCustodyOutput,
+    UpdateResourceStateInput,
+    ValidationReceipt,
+    hash_to_bytes,
+)
+from bridge.pool import GatewayPool
+from bridge.resilience import CircuitBreaker, RetryPolicy
+from bridge.singleflight import AsyncSingleFlight
+from bridge.throttle import AdaptiveConcurrencyLimiter, RateLimiter
+
+InputT = TypeVar("InputT")
+OutputT = TypeVar("OutputT")
+
+
+class AsyncHolochainGatewayClient:
+    """Async twin of HolochainGatewayClient backed by a pooled httpx.AsyncClient."""
+
+    ZOME_RESOURCE = HolochainGatewayClient.ZOME_RESOURCE
+    ZOME_GOUVERNANCE = HolochainGatewayClient.ZOME_GOUVERNANCE
+
+    _zome_path = staticmethod(HolochainGatewayClient._zome_path)
+    _encode_payload = staticmethod(HolochainGatewayClient._encode_payload)
+    _decode = staticmethod(HolochainGatewayClient._decode)
+    _attempt_timeout = staticmethod(HolochainGatewayClient._attempt_timeout)
+    _send_failed = staticmethod(HolochainGatewayClient._send_failed)
+    _cut_by_deadline = staticmethod(HolochainGatewayClient._cut_by_deadline)
+    _parse_commitments = staticmethod(HolochainGatewayClient._parse_commitments)
+    _parse_validation_receipts = staticmethod(HolochainGatewayClient._parse_validation_receipts)
+    _parse_resource_validation = staticmethod(HolochainGatewayClient._parse_resource_validation)
+    _parse_resources = staticmethod(HolochainGatewayClient._parse_resources)
+    _parse_events = staticmethod(HolochainGatewayClient._parse_events)
+    _parse_claims = staticmethod(HolochainGatewayClient._parse_claims)
+    _parse_participation_claims = staticmethod(HolochainGatewayClient._parse_participation_claims)
+
+    def __init__(
+        self,
+        config: GatewayConfig,
+        cache: ResponseCache | None = None,
+        single_flight: AsyncSingleFlight | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        metrics: MetricsRegistry | None = None,
+        pool: GatewayPool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        hedging: HedgePolicy | None = None,
+    ) -> None:
+        self.config = config
+        self.cache = cache
+        self.single_flight = single_flight
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        self.pool = pool
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.hedging = hedging
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_connections,
+            ),
+            # Waiting for a pooled connection is bounded by the caller, not by
+            # the per-request timeout: hundreds of queued calls are expected.
+            timeout=httpx.Timeout(config.timeout, pool=None),
+        )
+
+    async def __aenter__(self) -> AsyncHolochainGatewayClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def close(self) -> None:
+        """Same as aclose(): the twin of HolochainGatewayClient.close()."""
+        await self.aclose()
+
+    @overload
+    async def _call(
+        self, fn_name: str, payload: Any | None = None, zome: str = "zome_resource"
+    ) -> Any: ...
+
+    @overload
+    async def _call(
+        self,
+        fn_name: str,
+        payload: Any | None = None,
+        zome: str = "zome_resource",
+        *,
+        parse: Callable[[bytes], OutputT],
+    ) -> OutputT: ...
+
+    async def _call(
+        self,
+        fn_name: str,
+        payload: Any | None = None,
+        zome: str = "zome_resource",
+        *,
+        parse: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Call a zome function via hc-http-gw and return parsed JSON.
+
+        With `parse`, the raw response body is handed to it instead (e.g. a
+        precompiled TypeAdapter's validate_json, see json_parser), skipping
+        the intermediate dict tree; the parsed value is what gets cached and
+        shared with coalesced callers.
+
+        Read-only functions go through the cache and single-flight group, when
+        configured; any other call invalidates the cached reads it may affect.
+        """
+        parse = parse or self._decode
+        path = self._zome_path(self.config, zome, fn_name)
+        params: dict[str, str] = {}
+        if payload is not None:
+            params["payload"] = self._encode_payload(payload)
+
+        if fn_name in READ_ONLY_FUNCTIONS:
+            return await self._read((zome, fn_name, params.get("payload")), path, params, parse)
+        try:
+            return await self._request(zome, fn_name, path, params, parse)
+        finally:
+            # A failed write may still have landed, so invalidate either way.
+            if self.cache is not None:
+                self.cache.invalidate_for_write(fn_name, payload, self._encode_payload)
+
+    async def _read(
+        self, key: CacheKey, path: str, params: dict[str, str], parse: Callable[[bytes], Any]
+    ) -> Any:
+        """Serve a read from the cache, a shared in-flight call, or the gateway.
+
+        Cached values are tagged with the parser that produced them, so a
+        lookup through a different parser is a miss rather than a wrong type.
+        """
+        cache = self.cache
+        if cache is not None and cache.cacheable(key[1]):
+            hit, value = cache.get(key)
+            if hit and value[0] is parse:
+                return value[1]
+
+        led = False
+
+        async def fetch() -> Any:
+            nonlocal led
+            led = True
+            generation = cache.generation if cache is not None else None
+            data = await self._request(key[0], key[1], path, params, parse)
+            if cache is not None:
+                cache.put(key, (parse, data), generation)
+            return data
+
+        if self.single_flight is None:
+            return await fetch()
+        while True:
+            try:
+                return await self.single_flight.do((key, parse), fetch, timeout=remaining())
+            except TimeoutError:
+                raise DeadlineExceeded(
+                    f"Deadline passed waiting for a shared {key[1]} call"
+                ) from None
+            except DeadlineExceeded:
+                left = remaining()
+                if led or (left is not None and left <= 0):
+                    raise
+                # The leader ran out of its own budget, not ours: fetch again.
+
+    async def _request(
+        self,
+        zome: str,
+        fn_name: str,
+        path: str,
+        params: dict[str, str],
+        parse: Callable[[bytes], Any],
+    ) -> Any:
+        """Send a call under the retry policy and circuit breaker, if configured.
+
+        With a pool, each attempt goes to the endpoint it picks, and a read
+        failing on an unhealthy endpoint fails over at once to another one.
+        Each attempt first waits for its rate-limit token and a concurrency slot,
+        and waits for the gateway at most until the current deadline.
+        """
+        policy, breaker, pool = self.retry_policy, self.circuit_breaker, self.pool
+        rate_limiter, limiter = self.rate_limiter, self.concurrency_limiter
+        read_only = fn_name in READ_ONLY_FUNCTIONS
+        attempts = policy.attempts(read_only) if policy is not None else 1
+        attempt = 0
+        tried: list[str] = []
+        hedging = self.hedging
+        hedge_delay = hedging.delay(fn_name) if hedging is not None and read_only else None
+        while True:
+            if rate_limiter is not None:
+                wait = rate_limiter.reserve(zome, fn_name)
+                if wait > 0:
+                    left = remaining()
+                    if left is not None and wait >= left:
+                        raise DeadlineExceeded(
+                            f"Deadline leaves {left:.2f}s, rate limit holds {fn_name} {wait:.2f}s"
+                        )
+                    await asyncio.sleep(wait)
+            ticket = 0.0
+            if limiter is not None:
+                try:
+                    ticket = await limiter.acquire_async(remaining())
+                except TimeoutError:
+                    raise DeadlineExceeded(
+                        f"Deadline passed waiting for a concurrency slot for {fn_name}"
+                    ) from None
+            try:
+                timeout = self._attempt_timeout(self.config, fn_name)
+                if breaker is not None and not breaker.allow():
+                    raise CircuitOpenError(
+                        f"Circuit open: gateway calls suspended for {breaker.retry_after():.1f}s"
+                    )
+            except GatewayError:
+                if limiter is not None:
+                    limiter.discard()
+                raise
+            base = pool.acquire(read_only, tried) if pool is not None else self.config.url
+            start = time.perf_counter()
+            try:
+                if hedge_delay is None:
+                    body = await self._send(base + path, params, timeout)
+                else:
+                    body = await self._send_hedged(
+                        base, path, params, timeout, fn_name, hedge_delay
+                    )
+            except GatewayError as exc:
+                if self._cut_by_deadline(self.config, fn_name, timeout, exc):
+                    # The caller's budget, not the gateway, ended this attempt:
+                    # no verdict on the endpoint, the window or the breaker.
+                    if pool is not None:
+                        pool.release(base)
+                    if limiter is not None:
+                        limiter.discard()
+                    if breaker is not None:
+                        breaker.abandon_probe()
+                    self._observe(zome, fn_name, start, exc.status_code, params, 0)
+                    raise DeadlineExceeded(f"Deadline exceeded calling {fn_name}: {exc}") from exc
+                unhealthy = CircuitBreaker.counts_as_failure(exc.status_code)
+                if pool is not None:
+                    pool.release(base, failed=unhealthy)
+                if limiter is not None:
+                    limiter.release(ticket, overloaded=limiter.counts_as_overload(exc.status_code))
+                self._observe(zome, fn_name, start, exc.status_code, params, 0)
+                if breaker is not None:
+                    if unhealthy:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                left = remaining()
+                if left is not None and left <= 0:
+                    raise DeadlineExceeded(f"Deadline exceeded calling {fn_name}: {exc}") from exc
+                if pool is not None and read_only and unhealthy:
+                    tried.append(base)
+                    if pool.can_fail_over(tried):
+                        continue
+                attempt += 1
+                never_sent = isinstance(exc, GatewayConnectError)
+                if (
+                    policy is None
+                    or attempt >= attempts
+                    or not policy.should_retry(exc.status_code, read_only, never_sent)
+                ):
+                    raise
+                delay = policy.delay(attempt - 1)
+                if left is not None and delay >= left:
+                    raise DeadlineExceeded(
+                        f"Deadline leaves no time to retry {fn_name}: {exc}"
+                    ) from exc
+                await asyncio.sleep(delay)
+                tried.clear()
+            except BaseException:
+                if pool is not None:
+                    pool.release(base)
+                if limiter is not None:
+                    limiter.discard()
+                if breaker is not None:
+                    breaker.abandon_probe()
+                raise
+            else:
+                if pool is not None:
+                    pool.release(base)
+                if limiter is not None:
+                    limiter.release(ticket)
+                self._observe(zome, fn_name, start, 200, params, len(body))
+                if breaker is not None:
+                    breaker.record_success()
+                return parse(body)
+
+    def _observe(
+        self,
+        zome: str,
+        fn_name: str,
+        start: float,
+        status_code: int | None,
+        params: dict[str, str],
+        response_bytes: int,
+    ) -> None:
+        if self.metrics is not None:
+            self.metrics.observe(
+                zome,
+                fn_name,
+                time.perf_counter() - start,
+                status_code,
+                len(params.get("payload", "")),
+                response_bytes,
+            )
+
+    async def _send(self, url: str, params: dict[str, str], timeout: float) -> bytes:
+        """Issue one HTTP GET and return the raw response body."""
+        try:
+            resp = await self._client.get(
+                url, params=params, timeout=httpx.Timeout(timeout, pool=None)
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+            raise GatewayConnectError(f"HTTP request failed: {exc}") from exc
+        except httpx.HTTPError as exc:
+            raise GatewayError(f"HTTP request failed: {exc}") from exc
+
+        if resp.status_code != 200:
+            raise GatewayError(
+                f"Gateway returned {resp.status_code}: {resp.text}",
+                status_code=resp.status_code,
+            )
+
+        return resp.content
+
+    async def _send_hedged(
+        self,
+        base: str,
+        path: str,
+        params: dict[str, str],
+        timeout: float,
+        fn_name: str,
+        delay: float,
+    ) -> bytes:
+        """_send, racing a duplicate request if no answer comes within `delay`.
+
+        The first answer wins and the other request is cancelled; a failed
+        request waits for the other one, and when both fail the primary's
+        error is raised.
+        """
+        hedging, pool = self.hedging, self.pool
+        assert hedging is not None
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self._send(base + path, params, timeout))
+
+        def observe(task: asyncio.Future[bytes]) -> None:
+            if not task.cancelled() and task.exception() is None:
+                hedging.observe(fn_name, time.perf_counter() - start)
+
+        primary.add_done_callback(observe)
+        hedge: asyncio.Future[bytes] | None = None
+        try:
+            await asyncio.wait({primary}, timeout=delay)
+            if primary.done():
+                return primary.result()
+
+            hedge_base = pool.acquire(True, exclude=[base]) if pool is not None else base
+            hedge = asyncio.ensure_future(self._send(hedge_base + path, params, timeout))
+            if pool is not None:
+                hedge.add_done_callback(
+                    lambda task: pool.release(
+                        hedge_base,
+                        failed=not task.cancelled() and self._send_failed(task.exception()),
+                    )
+                )
+            pending: set[asyncio.Future[bytes]] = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        hedging.record_hedge(won=task is hedge)
+                        return task.result()
+            hedging.record_hedge(won=False)
+            return primary.result()  # raises the primary's error
+        finally:
+            leftovers = [t for t in (primary, hedge) if t is not None and not t.done()]
+            for leftover in leftovers:
+                leftover.cancel()
+            if leftovers:
+                # Let the loser unwind (closing its connection) before returning.
+                await asyncio.wait(leftovers)
+
+    # --- ResourceSpecification functions ---
+
+    async def create_resource_specification(
+        self, input_data: ResourceSpecificationInput
+    ) -> CreateResourceSpecificationOutput:
+        return await self._call(
+            "create_resource_specification",
+            input_data,
+            parse=model_parser(CreateResourceSpecificationOutput),
+        )
+
+    async def get_all_resource_specifications(self) -> GetAllResourceSpecificationsOutput:
+        return await self._call(
+            "get_all_resource_specifications",
+            parse=model_parser(GetAllResourceSpecificationsOutput),
+        )
+
+    async def get_latest_resource_specification(self, action_hash: str) -> ResourceSpecification:
+        return await self._call(
+            "get_latest_resource_specification",
+            hash_to_bytes(action_hash),
+            parse=model_parser(ResourceSpecification),
+        )
+
+    async def get_resource_specification_with_rules(
+        self, spec_hash: str
+    ) -> GetResourceSpecWithRulesOutput:
+        return await self._call(
+            "get_resource_specification_with_rules",
+            hash_to_bytes(spec_hash),
+            parse=model_parser(GetResourceSpecWithRulesOutput),
+        )
+
+    async def get_resource_specifications_by_category(self, category: str) -> Any:
+        return await self._call("get_resource_specifications_by_category", category)
+
+    async def get_my_resource_specifications(self) -> Any:
+        return await self._call("get_my_resource_specifications")
+
+    # --- EconomicResource functions ---
+
+    async def create_economic_resource(
+        self, input_data: EconomicResourceInput
+    ) -> CreateEconomicResourceOutput:
+        return await self._call(
+            "create_economic_resource",
+            input_data,
+            parse=model_parser(CreateEconomicResourceOutput),
+        )
+
+    async def get_all_economic_resources(self) -> GetAllEconomicResourcesOutput:
+        return await self._call(
+            "get_all_economic_resources", parse=model_parser(GetAllEconomicResourcesOutput)
+        )
+
+    async def get_latest_economic_resource(self, action_hash: str) -> EconomicResource:
+        return await self._call(
+            "get_latest_economic_resource",
+            hash_to_bytes(action_hash),
+            parse=model_parser(EconomicResource),
+        )
+
+    async def get_resources_by_specification(self, spec_hash: str) -> LazyList[EconomicResource]:
+        return await self._call(
+            "get_resources_by_specification", hash_to_bytes(spec_hash), parse=self._parse_resources
+        )
+
+    async def get_my_economic_resources(self) -> Any:
+        return await self._call("get_my_economic_resources")
+
+    # --- Custody & state functions ---
+
+    async def transfer_custody(self, input_data: TransferCustodyInput) -> TransferCustodyOutput:
+        return await self._call(
+            "transfer_custody",
+            input_data,
+            parse=model_parser(TransferCustodyOutput),
+        )
+
+    async def update_resource_state(self, input_data: UpdateResourceStateInput) -> Any:
+        return await self._call("update_resource_state", input_data)
+
+    # --- Bulk creation ---
+
+    async def create_resource_specifications_bulk(
+        self, inputs: Iterable[ResourceSpecificationInput], concurrency: int = 16
+    ) -> list[BulkResult[CreateResourceSpecificationOutput]]:
+        return await self._bulk(self.create_resource_specification, inputs, concurrency)
+
+    async def create_economic_resources_bulk(
+        self, inputs: Iterable[EconomicResourceInput], concurrency: int = 16
+    ) -> list[BulkResult[CreateEconomicResourceOutput]]:
+        return await self._bulk(self.create_economic_resource, inputs, concurrency)
+
+    @staticmethod
+    async def _bulk(
+        create: Callable[[InputT], Awaitable[OutputT]],
+        inputs: Iterable[InputT],
+        concurrency: int,
+    ) -> list[BulkResult[OutputT]]:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(index: int, item: InputT) -> BulkResult[OutputT]:
+            async with semaphore:
+                try:
+                    return BulkResult(index, output=await create(item))
+                except GatewayError as exc:
+                    return BulkResult(index, error=exc)
+
+        # Inputs are consumed lazily: at most 2 * concurrency tasks exist at once,
+        # so a generator of millions of items is never materialized up front.
+        results: list[BulkResult[OutputT]] = []
+        window: deque[asyncio.Task[BulkResult[OutputT]]] = deque()
+        try:
+            for index, item in enumerate(inputs):
+                if len(window) >= 2 * max(1, concurrency):
+                    results.append(await window.popleft())
+                window.append(asyncio.ensure_future(run(index, item)))
+            while window:
+                results.append(await window.popleft())
+        finally:
+            for task in window:  # only left over when the caller was cancelled
+                task.cancel()
+        return results
+
+    # --- Health check ---
+
+    async def health_check(self) -> bool:
+        """Check if the gateway is reachable by attempting a read operation.
+
+        The read bypasses the cache and single-flight group: a cached answer
+        would report a gateway that just went down as healthy.
+        """
+        fn_name = "get_all_resource_specifications"
+        path = self._zome_path(self.config, self.ZOME_RESOURCE, fn_name)
+        try:
+            await self._request(self.ZOME_RESOURCE, fn_name, path, {}, self._decode)
+            return True
+        except GatewayError:
+            return False
+
+    # --- Commitment functions (zome_gouvernance) ---
+
+    async def propose_commitment(
+        self, input_data: ProposeCommitmentInput
+    ) -> ProposeCommitmentOutput:
+        return await self._call(
+            "propose_commitment",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(ProposeCommitmentOutput),
+        )
+
+    async def get_all_commitments(self) -> list[Commitment]:
+        return await self._call(
+            "get_all_commitments", zome=self.ZOME_GOUVERNANCE, parse=self._parse_commitments
+        )
+
+    async def get_commitments_for_agent(self, agent_pub_key: str) -> list[Commitment]:
+        return await self._call(
+            "get_commitments_for_agent",
+            hash_to_bytes(agent_pub_key),
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_commitments,
+        )
+
+    async def claim_commitment(self, input_data: ClaimCommitmentInput) -> ClaimCommitmentOutput:
+        return await self._call(
+            "claim_commitment",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(ClaimCommitmentOutput),
+        )
+
+    async def get_all_claims(self) -> LazyList[Claim]:
+        return await self._call(
+            "get_all_claims", zome=self.ZOME_GOUVERNANCE, parse=self._parse_claims
+        )
+
+    async def get_claims_for_commitment(self, commitment_hash: str) -> Any:
+        return await self._call(
+            "get_claims_for_commitment", hash_to_bytes(commitment_hash), zome=self.ZOME_GOUVERNANCE
+        )
+
+    # --- EconomicEvent functions (zome_gouvernance) ---
+
+    async def log_economic_event(self, input_data: LogEconomicEventInput) -> LogEconomicEventOutput:
+        return await self._call(
+            "log_economic_event",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(LogEconomicEventOutput),
+        )
+
+    async def log_initial_transfer(
+        self, input_data: LogInitialTransferInput
+    ) -> LogInitialTransferOutput:
+        return await self._call(
+            "log_initial_transfer",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(LogInitialTransferOutput),
+        )
+
+    async def get_all_economic_events(self) -> LazyList[EconomicEvent]:
+        return await self._call(
+            "get_all_economic_events", zome=self.ZOME_GOUVERNANCE, parse=self._parse_events
+        )
+
+    async def get_events_for_resource(self, resource_hash: str) -> LazyList[EconomicEvent]:
+        return await self._call(
+            "get_events_for_resource",
+            hash_to_bytes(resource_hash),
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_events,
+        )
+
+    async def get_events_for_agent(self, agent_pub_key: str) -> Any:
+        return await self._call(
+            "get_events_for_agent", hash_to_bytes(agent_pub_key), zome=self.ZOME_GOUVERNANCE
+        )
+
+    # --- Validation functions (zome_gouvernance) ---
+
+    async def create_validation_receipt(
+        self, input_data: CreateValidationReceiptInput
+    ) -> CreateValidationReceiptOutput:
+        return await self._call(
+            "create_validation_receipt",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(CreateValidationReceiptOutput),
+        )
+
+    async def get_validation_history(self, item_hash: str) -> list[ValidationReceipt]:
+        return await self._call(
+            "get_validation_history",
+            hash_to_bytes(item_hash),
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_validation_receipts,
+        )
+
+    async def get_all_validation_receipts(self) -> list[ValidationReceipt]:
+        return await self._call(
+            "get_all_validation_receipts",
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_validation_receipts,
+        )
+
+    async def create_resource_validation(
+        self, input_data: CreateResourceValidationInput
+    ) -> CreateResourceValidationOutput:
+        return await self._call(
+            "create_resource_validation",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(CreateResourceValidationOutput),
+        )
+
+    async def check_validation_status(self, validation_hash: str) -> ResourceValidation | None:
+        return await self._call(
+            "check_validation_status",
+            hash_to_bytes(validation_hash),
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_resource_validation,
+        )
+
+    # --- PPR functions (zome_gouvernance) ---
+
+    async def issue_participation_receipts(
+        self, input_data: IssueParticipationReceiptsInput
+    ) -> IssueParticipationReceiptsOutput:
+        return await self._call(
+            "issue_participation_receipts",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(IssueParticipationReceiptsOutput),
+        )
+
+    async def get_my_participation_claims(self) -> LazyList[dict[str, Any]]:
+        return await self._call(
+            "get_my_participation_claims",
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_participation_claims,
+        )
+
+    async def derive_reputation_summary(
+        self, input_data: DeriveReputationSummaryInput
+    ) -> DeriveReputationSummaryOutput:
+        return await self._call(
+            "derive_reputation_summary",
+            input_data,
+            zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(DeriveReputationSummaryOutput),
+        )
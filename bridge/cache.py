@@ -0,0 +1,223 @@
+"""TTL + LRU cache for read-only zome call responses.
+
+HolochainGatewayClient (and its async twin) consult a ResponseCache in
+`_call` when one is passed to the constructor. Entries are keyed by
+(zome, fn_name, encoded payload), expire after a per-function TTL and are
+evicted least-recently-used once `max_entries` is reached.
+
+Only functions with a positive TTL are cached. Writes made through the same
+client invalidate the reads they can affect: whole listings are dropped,
+and reads keyed by the written entity's hash (e.g. get_latest_economic_resource
+after transfer_custody) are dropped for that hash only. The TTL bounds how
+stale a read can be with respect to writes made by other agents.
+
+Cached values are the parsed JSON shared between callers; treat them as
+read-only. A read that was in flight while an invalidation happened is not
+stored (see `generation`), so it cannot resurrect what a write dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+CacheKey = tuple[str, str, str | None]
+
+# Seconds each read-only function's response may be served from cache.
+DEFAULT_TTLS: dict[str, float] = {
+    # zome_resource
+    "get_all_resource_specifications": 30.0,
+    "get_resource_specifications_by_category": 30.0,
+    "get_my_resource_specifications": 30.0,
+    "get_latest_resource_specification": 300.0,
+    "get_resource_specification_with_rules": 300.0,
+    "get_all_economic_resources": 10.0,
+    "get_my_economic_resources": 10.0,
+    "get_resources_by_specification": 10.0,
+    "get_latest_economic_resource": 30.0,
+    # zome_gouvernance
+    "get_all_commitments": 10.0,
+    "get_commitments_for_agent": 10.0,
+    "get_all_claims": 10.0,
+    "get_claims_for_commitment": 10.0,
+    "get_all_economic_events": 10.0,
+    "get_events_for_resource": 10.0,
+    "get_events_for_agent": 10.0,
+    "get_validation_history": 30.0,
+    "get_all_validation_receipts": 30.0,
+    "check_validation_status": 10.0,
+    "get_my_participation_claims": 10.0,
+}
+
+_SPEC_LISTINGS = (
+    "get_all_resource_specifications",
+    "get_resource_specifications_by_category",
+    "get_my_resource_specifications",
+)
+_RESOURCE_LISTINGS = (
+    "get_all_economic_resources",
+    "get_my_economic_resources",
+    "get_resources_by_specification",
+)
+_EVENT_LISTINGS = (
+    "get_all_economic_events",
+    "get_events_for_resource",
+    "get_events_for_agent",
+)
+
+# write fn -> reads whose cached responses are dropped entirely.
+INVALIDATES: dict[str, tuple[str, ...]] = {
+    "create_resource_specification": _SPEC_LISTINGS,
+    "create_economic_resource": _RESOURCE_LISTINGS,
+    "transfer_custody": _RESOURCE_LISTINGS,
+    "update_resource_state": _RESOURCE_LISTINGS,
+    "propose_commitment": ("get_all_commitments", "get_commitments_for_agent"),
+    "claim_commitment": ("get_all_claims", "get_claims_for_commitment"),
+    "log_economic_event": _EVENT_LISTINGS + _RESOURCE_LISTINGS,
+    "log_initial_transfer": _EVENT_LISTINGS + _RESOURCE_LISTINGS,
+    "create_validation_receipt": ("get_validation_history", "get_all_validation_receipts"),
+    "create_resource_validation": ("check_validation_status", "get_validation_history"),
+    "issue_participation_receipts": ("get_my_participation_claims",),
+}
+
+# write fn -> (payload field, read fn): the read keyed by that hash is dropped.
+INVALIDATES_ENTITY: dict[str, tuple[tuple[str, str], ...]] = {
+    "transfer_custody": (("resource_hash", "get_latest_economic_resource"),),
+    "update_resource_state": (("resource_hash", "get_latest_economic_resource"),),
+    "log_economic_event": (("resource_inventoried_as", "get_latest_economic_resource"),),
+    "log_initial_transfer": (("resource_hash", "get_latest_economic_resource"),),
+}
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of ResponseCache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Thread-safe, size-bounded LRU of zome call responses with per-function TTLs.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted.
+        ttls: Per-function TTL overrides merged over DEFAULT_TTLS; a TTL of 0
+            disables caching for that function.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass it back to put()."""
+        return self._generation
+
+    def cacheable(self, fn_name: str) -> bool:
+        return self.ttls.get(fn_name, 0.0) > 0
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (True, value) on a fresh hit, (False, None) otherwise."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del self._entries[key]
+            self._misses += 1
+            return False, None
+
+    def put(self, key: CacheKey, value: Any, generation: int | None = None) -> None:
+        """Store value; skipped if an invalidation happened since `generation`."""
+        ttl = self.ttls.get(key[1], 0.0)
+        if ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, fn_name: str, encoded_payload: str | None = None) -> int:
+        """Drop cached responses of fn_name (only for one payload if given)."""
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[1] == fn_name and (encoded_payload is None or key[2] == encoded_payload)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            self._generation += 1
+            return len(stale)
+
+    def invalidate_for_write(
+        self, fn_name: str, payload: Any, encode: Callable[[Any], str]
+    ) -> None:
+        """Drop the reads a write to fn_name may have changed.
+
+        encode must be the client's payload encoder, so entity keys match the
+        keys the corresponding reads were cached under. A model payload is
+        dumped (entity fields only) to get hashes in their wire form.
+        """
+        for read_fn in INVALIDATES.get(fn_name, ()):
+            self.invalidate(read_fn)
+        entities = INVALIDATES_ENTITY.get(fn_name, ())
+        if entities and isinstance(payload, BaseModel):
+            payload = payload.model_dump(mode="json", include={field for field, _ in entities})
+        if isinstance(payload, dict):
+            for field_name, read_fn in entities:
+                if payload.get(field_name) is not None:
+                    self.invalidate(read_fn, encode(payload[field_name]))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from dotenv import load_dotenv
 
 
 @dataclass(frozen=True)
 class GatewayConfig:
-    """Connection settings for hc-http-gw."""
+    """Connection settings for hc-http-gw.
+
+    `timeout` applies to every zome function without an entry in `timeouts`
+    (fn name -> seconds), so cheap reads need not wait as long as heavy ones.
+    """
 
     url: str = "http://127.0.0.1:8888"
     timeout: int = 30
     app_id: str = "nondominium"
     dna_hash: str = ""
+    max_connections: int = 100
+    # Not hashed: the config stays usable as a dict key / cache key.
+    timeouts: dict[str, float] = field(default_factory=dict, hash=False)
+
+    def timeout_for(self, fn_name: str) -> float:
+        """Per-request timeout in seconds for a zome function."""
+        return self.timeouts.get(fn_name, self.timeout)
 
     @classmethod
     def from_env(cls, dotenv_path: str | None = None) -> GatewayConfig:
@@ -26,4 +37,44 @@ class GatewayConfig:
             timeout=int(os.getenv("HC_GW_TIMEOUT", "30")),
             app_id=os.getenv("HC_APP_ID", "nondominium"),
             dna_hash=os.getenv("HC_DNA_HASH", ""),
+            max_connections=int(os.getenv("HC_GW_MAX_CONNECTIONS", "100")),
+            timeouts=_parse_timeouts(os.getenv("HC_GW_TIMEOUTS", "")),
+        )
+
+
+def _parse_timeouts(value: str) -> dict[str, float]:
+    """Parse "fn=seconds,fn=seconds" (as in HC_GW_TIMEOUTS)."""
+    timeouts: dict[str, float] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        fn_name, sep, seconds = item.partition("=")
+        if not sep:
+            raise ValueError(f"Expected fn=seconds in timeout profile, got {item!r}")
+        timeouts[fn_name.strip()] = float(seconds)
+    return timeouts
+
+
+@dataclass(frozen=True)
+class ERPConfig:
+    """Connection settings for an ERPLibre (Odoo) XML-RPC endpoint."""
+
+    url: str = "http://127.0.0.1:8069"
+    db: str = ""
+    username: str = ""
+    password: str = ""
+    page_size: int = 500
+    timeout: int = 60
+
+    @classmethod
+    def from_env(cls, dotenv_path: str | None = None) -> ERPConfig:
+        """Load config from environment variables (.env file supported)."""
+        load_dotenv(dotenv_path)
+        return cls(
+            url=os.getenv("ERP_URL", "http://127.0.0.1:8069").rstrip("/"),
+            db=os.getenv("ERP_DB", ""),
+            username=os.getenv("ERP_USERNAME", ""),
+            password=os.getenv("ERP_PASSWORD", ""),
+            page_size=int(os.getenv("ERP_PAGE_SIZE", "500")),
+            timeout=int(os.getenv("ERP_TIMEOUT", "60")),
         )
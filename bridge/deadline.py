@@ -0,0 +1,76 @@
+"""Operation-level deadlines for gateway calls.
+
+A multi-call operation (a Use process, a sync run, a discovery refresh)
+sets one time budget; every gateway call made inside it, however deeply
+nested, only gets what is left of it:
+
+    with deadline(10.0):
+        UseProcess(client).execute_use_process(...)
+
+Each HTTP attempt waits at most min(its per-function timeout, the time
+remaining), and a call that starts, retries or waits for a rate-limit
+token when the budget cannot cover it raises DeadlineExceeded instead of
+sending. Waits for a concurrency slot or for a coalesced (single-flight)
+call are cut off the same way. An attempt cut short by the deadline is
+not counted as a gateway failure (breaker, pool health, concurrency
+window). Nested deadlines only ever tighten the budget.
+
+The deadline lives in a ContextVar, so asyncio tasks inherit it. Thread
+pools do not copy context on their own: submit work through `in_context`
+(see bridge.sync and bridge.discovery).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_expires_at: ContextVar[float | None] = ContextVar("gateway_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bound the gateway calls made in the block to `seconds` from now (None: no bound)."""
+    if seconds is None:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    current = _expires_at.get()
+    if current is not None:
+        expires = min(expires, current)
+    token = _expires_at.set(expires)
+    try:
+        yield
+    finally:
+        _expires_at.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left in the current deadline (may be negative), or None without one."""
+    expires = _expires_at.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def expired() -> bool:
+    """Whether the current deadline has passed (False without one)."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def in_context(fn: Callable[P, R]) -> Callable[P, R]:
+    """Wrap `fn` to run in a copy of the caller's context, deadline included.
+
+    Each call gets its own copy, so the wrapper can run on many threads at once.
+    """
+    context = copy_context()
+
+    def run(*args: P.args, **kwargs: P.kwargs) -> R:
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
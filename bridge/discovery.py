@@ -3,58 +3,249 @@
 Resources synced by one org become discoverable by others. This module
 wraps the gateway's read-only search/filter methods into a higher-level
 discovery API.
+
+The gateway cannot enumerate (hash, spec) pairs, so discover_all needs a
+DiscoveryIndex: a local, JSON-persisted join of specs and their resources,
+built from spec hashes we already know (our own SyncState, plus any shared
+by partner orgs). Once refreshed, queries are answered from memory with no
+DHT round-trip.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 
-from bridge.gateway_client import HolochainGatewayClient
+from bridge.deadline import deadline, in_context
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
 from bridge.models import EconomicResource, ResourceSpecification
+from bridge.sqlite_state import SqliteSyncState
+from bridge.sync import SyncState
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class DiscoveredResource:
-    """A resource joined with its specification for display."""
+    """A resource joined with its specification for display.
+
+    resource_hash is None for resources only seen through the spec's links
+    (get_resources_by_specification returns entries, not hashes).
+    """
 
     spec_hash: str
     spec: ResourceSpecification
-    resource_hash: str
+    resource_hash: str | None
     resource: EconomicResource
 
 
+@dataclass
+class IndexedSpec:
+    """One spec in the DiscoveryIndex with its linked resources."""
+
+    spec: ResourceSpecification
+    resources: list[EconomicResource]
+    resource_hashes: list[str | None]  # parallel to resources
+
+
+class DiscoveryIndex:
+    """Local materialized join of specs -> resources, persisted as JSON.
+
+    refresh() does the DHT work up front (three reads per spec, fanned out
+    over a thread pool); lookups afterwards are dict reads. The in-memory
+    tables are rebuilt off to the side and swapped in whole, so readers
+    never see a half-refreshed index.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._specs: dict[str, IndexedSpec] = {}
+        self._by_category: dict[str, list[str]] = {}
+        self.refreshed_at: float | None = None
+        if path is not None and path.exists():
+            self._load(path)
+
+    # --- Persistence ---
+
+    def _load(self, path: Path) -> None:
+        data = json.loads(path.read_text())
+        specs = {
+            spec_hash: IndexedSpec(
+                spec=ResourceSpecification.model_validate(entry["spec"]),
+                resources=[EconomicResource.model_validate(r) for r in entry["resources"]],
+                resource_hashes=entry["resource_hashes"],
+            )
+            for spec_hash, entry in data["specs"].items()
+        }
+        self._swap(specs)
+        self.refreshed_at = data.get("refreshed_at")
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        specs = {
+            spec_hash: {
+                "spec": entry.spec.model_dump(mode="json"),
+                "resources": [r.model_dump(mode="json") for r in entry.resources],
+                "resource_hashes": entry.resource_hashes,
+            }
+            for spec_hash, entry in self._specs.items()
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(json.dumps({"refreshed_at": self.refreshed_at, "specs": specs}))
+
+    def _swap(self, specs: dict[str, IndexedSpec]) -> None:
+        by_category: dict[str, list[str]] = {}
+        for spec_hash, entry in specs.items():
+            by_category.setdefault(entry.spec.category, []).append(spec_hash)
+        self._specs, self._by_category = specs, by_category
+
+    # --- Refresh ---
+
+    def refresh(
+        self,
+        gateway: HolochainGatewayClient,
+        spec_hashes: Iterable[str],
+        known_resources: Mapping[str, str] | None = None,
+        workers: int = 8,
+        timeout: float | None = None,
+    ) -> None:
+        """Re-read the given specs and their resources from the gateway.
+
+        Args:
+            gateway: Client used for the reads.
+            spec_hashes: Specs to index; specs not listed are dropped.
+            known_resources: spec_hash -> resource_hash for resources whose
+                hash we hold (e.g. from SyncState). The resource is fetched
+                and matched against the spec's linked resources so the
+                discovered entry carries its hash.
+            workers: Number of specs fetched concurrently.
+            timeout: Seconds the whole refresh may take (see bridge.deadline).
+
+        A spec whose reads fail, or do not finish within `timeout`, keeps its
+        previous entry, if any.
+        """
+        known = known_resources or {}
+        hashes = list(dict.fromkeys(spec_hashes))
+        with deadline(timeout), ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            fetch = in_context(lambda h: self._fetch(gateway, h, known.get(h)))
+            fetched = list(pool.map(fetch, hashes))
+
+        specs: dict[str, IndexedSpec] = {}
+        for spec_hash, entry in zip(hashes, fetched):
+            if entry is None:
+                entry = self._specs.get(spec_hash)
+            if entry is not None:
+                specs[spec_hash] = entry
+        self._swap(specs)
+        self.refreshed_at = time.time()
+
+    def refresh_from_state(
+        self,
+        gateway: HolochainGatewayClient,
+        state: SyncState | SqliteSyncState,
+        extra_spec_hashes: Iterable[str] = (),
+        workers: int = 8,
+        timeout: float | None = None,
+    ) -> None:
+        """Refresh from every spec recorded in a sync state, plus extra hashes.
+
+        Withdrawn entries (empty resource_hash) still index their spec, but
+        have no resource of our own to fetch.
+        """
+        spec_hashes: dict[str, None] = {}  # ordered set
+        known: dict[str, str] = {}
+        for _, entry in state.iter_entries():
+            spec_hashes[entry["spec_hash"]] = None
+            if entry["resource_hash"]:
+                known[entry["spec_hash"]] = entry["resource_hash"]
+        self.refresh(gateway, [*spec_hashes, *extra_spec_hashes], known, workers, timeout)
+
+    @staticmethod
+    def _fetch(
+        gateway: HolochainGatewayClient, spec_hash: str, resource_hash: str | None
+    ) -> IndexedSpec | None:
+        try:
+            spec = gateway.get_latest_resource_specification(spec_hash)
+            resources = list(gateway.get_resources_by_specification(spec_hash))
+            hashes: list[str | None] = [None] * len(resources)
+            if resource_hash is not None:
+                own = gateway.get_latest_economic_resource(resource_hash)
+                if own in resources:
+                    hashes[resources.index(own)] = resource_hash
+                else:
+                    # Link not visible yet (DHT propagation); index it directly.
+                    resources.append(own)
+                    hashes.append(resource_hash)
+        except GatewayError as exc:
+            logger.warning("Could not index spec %s: %s", spec_hash, exc)
+            return None
+        return IndexedSpec(spec=spec, resources=resources, resource_hashes=hashes)
+
+    # --- Queries ---
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, spec_hash: object) -> bool:
+        return spec_hash in self._specs
+
+    def all(self) -> list[DiscoveredResource]:
+        return [
+            DiscoveredResource(spec_hash, entry.spec, resource_hash, resource)
+            for spec_hash, entry in self._specs.items()
+            for resource, resource_hash in zip(entry.resources, entry.resource_hashes)
+        ]
+
+    def specs_in_category(self, category: str) -> list[ResourceSpecification]:
+        return [self._specs[h].spec for h in self._by_category.get(category, [])]
+
+    def resources_for_spec(self, spec_hash: str) -> list[EconomicResource] | None:
+        """Indexed resources for a spec, or None if the spec is not indexed."""
+        entry = self._specs.get(spec_hash)
+        return list(entry.resources) if entry is not None else None
+
+
 class ResourceDiscovery:
-    """High-level discovery API over the Nondominium DHT."""
+    """High-level discovery API over the Nondominium DHT.
+
+    With an index, discover_all, discover_by_category and check_availability
+    are served from memory; categories and specs the index does not know
+    fall through to the gateway.
+    """
 
-    def __init__(self, gateway_client: HolochainGatewayClient) -> None:
+    def __init__(
+        self, gateway_client: HolochainGatewayClient, index: DiscoveryIndex | None = None
+    ) -> None:
         self.gateway = gateway_client
+        self.index = index
 
     def discover_all(self) -> list[DiscoveredResource]:
-        """Get all specs and resources, correlate them into DiscoveredResource objects.
+        """Get all indexed specs and resources as DiscoveredResource objects.
 
-        Note: The gateway returns resources without their spec_hash in the
-        EconomicResource struct (it's in the link, not the entry). So we
-        use get_resources_by_specification to correlate spec→resources.
+        Note: get_all_resource_specifications doesn't return hashes, so specs
+        can't be correlated to resources from the gateway alone. Without a
+        DiscoveryIndex this returns an empty list.
         """
-        specs_output = self.gateway.get_all_resource_specifications()
-        discovered: list[DiscoveredResource] = []
-
-        for spec in specs_output.specifications:
-            # We need the spec hash to query linked resources.
-            # get_all_resource_specifications returns specs but not hashes.
-            # For PoC, we use category-based discovery instead.
-            pass
-
-        # PoC limitation: get_all_resource_specifications doesn't return hashes,
-        # so we can't correlate specs to resources. Full implementation would
-        # need a zome function that returns (hash, spec) pairs.
-        return discovered
+        if self.index is None:
+            return []
+        return self.index.all()
 
     def discover_by_category(self, category: str) -> list[ResourceSpecification]:
         """Find all resource specifications in a given category.
 
-        Uses the zome's get_resource_specifications_by_category function.
+        Uses the index when it has specs in the category, otherwise the
+        zome's get_resource_specifications_by_category function.
         """
+        if self.index is not None:
+            specs = self.index.specs_in_category(category)
+            if specs:
+                return specs
         data = self.gateway.get_resource_specifications_by_category(category)
         # The zome returns a list of ResourceSpecification records
         if isinstance(data, list):
@@ -66,12 +257,13 @@ class ResourceDiscovery:
 
         Useful for checking availability of a particular type of resource.
         """
-        data = self.gateway.get_resources_by_specification(spec_hash)
-        if isinstance(data, list):
-            return [EconomicResource.model_validate(item) for item in data]
-        return []
+        return list(self.gateway.get_resources_by_specification(spec_hash))
 
     def check_availability(self, spec_hash: str) -> int:
         """Count how many resources exist for a given specification."""
-        resources = self.get_resources_for_spec(spec_hash)
-        return len(resources)
+        if self.index is not None:
+            indexed = self.index.resources_for_spec(spec_hash)
+            if indexed is not None:
+                return len(indexed)
+        # Counting a LazyList validates nothing.
+        return len(self.gateway.get_resources_by_specification(spec_hash))
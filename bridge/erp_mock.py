@@ -2,11 +2,24 @@
 
 Simulates reading from an ERPLibre (Odoo) product.product model
 so the bridge can be developed and tested without a live ERP instance.
+
+For load tests, benchmarks and memory profiling, MockERPClient can instead
+serve a SyntheticCatalog: millions of realistic products generated on
+demand. Product i is a pure function of (seed, i), so the catalog is
+reproducible, supports random access, and is never held in memory:
+
+    erp = MockERPClient.synthetic(1_000_000, seed=42)
+    for product in erp.iter_products(available_only=True):
+        ...
 """
 
 from __future__ import annotations
 
+import hashlib
+import random
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from typing import overload
 
 
 @dataclass
@@ -69,21 +82,396 @@ MOCK_PRODUCTS: list[MockProduct] = [
 ]
 
 
-class MockERPClient:
-    """Simulates reading products from ERPLibre."""
+# --- Synthetic catalog ---
+
+
+@dataclass(frozen=True)
+class _CategoryProfile:
+    nouns: tuple[str, ...]
+    uoms: tuple[str, ...]
+    price_range: tuple[float, float]
+    max_qty: int
+    tags: tuple[str, ...]
+    variant_values: tuple[str, ...]  # attribute values distinguishing variants
+
+
+_CATEGORY_PROFILES: dict[str, _CategoryProfile] = {
+    "equipment": _CategoryProfile(
+        nouns=(
+            "3D Printer",
+            "Laser Cutter",
+            "CNC Router",
+            "Oscilloscope",
+            "Bandsaw",
+            "Drill Press",
+        ),
+        uoms=("unit",),
+        price_range=(200.0, 15000.0),
+        max_qty=3,
+        tags=("prototyping", "machining", "3d-printing", "laser-cutting"),
+        variant_values=("Standard", "Pro", "Enclosed", "Refurbished"),
+    ),
+    "electronics": _CategoryProfile(
+        nouns=("Microcontroller Board", "Sensor Module", "Stepper Driver", "Power Supply", "Relay"),
+        uoms=("unit",),
+        price_range=(2.0, 300.0),
+        max_qty=50,
+        tags=("electronics", "microcontroller", "sensors", "iot"),
+        variant_values=("3.3V", "5V", "12V", "24V"),
+    ),
+    "consumable": _CategoryProfile(
+        nouns=("PLA Filament", "PETG Filament", "Resin", "Solder Wire", "Epoxy", "Sandpaper"),
+        uoms=("kg", "l", "m", "unit"),
+        price_range=(5.0, 150.0),
+        max_qty=40,
+        tags=("consumable", "3d-printing", "finishing"),
+        variant_values=("White", "Black", "Red", "Transparent"),
+    ),
+    "tool": _CategoryProfile(
+        nouns=("Caliper", "Multimeter", "Hex Key Set", "Heat Gun", "Crimping Tool", "Chisel Set"),
+        uoms=("unit",),
+        price_range=(5.0, 400.0),
+        max_qty=10,
+        tags=("hand-tools", "measurement", "electronics"),
+        variant_values=("S", "M", "L", "XL"),
+    ),
+    "material": _CategoryProfile(
+        nouns=("Plywood Sheet", "Acrylic Sheet", "Aluminium Extrusion", "Steel Rod", "MDF Board"),
+        uoms=("unit", "m", "kg"),
+        price_range=(3.0, 200.0),
+        max_qty=100,
+        tags=("raw-material", "woodworking", "metalworking", "laser-cutting"),
+        variant_values=("3mm", "6mm", "10mm", "12mm"),
+    ),
+    "space": _CategoryProfile(
+        nouns=("Workbench", "Meeting Room", "Clean Room", "Paint Booth", "Electronics Lab"),
+        uoms=("hour",),
+        price_range=(10.0, 120.0),
+        max_qty=8,
+        tags=("space", "booking"),
+        variant_values=("Morning", "Afternoon", "Evening", "Weekend"),
+    ),
+}
+
+SYNTHETIC_CATEGORIES = tuple(_CATEGORY_PROFILES)
+
+
+@dataclass(frozen=True)
+class _Template:
+    """Fields shared by all variants of one synthetic product template."""
+
+    id: int
+    category: str
+    name: str
+    description: str
+    uom: str
+    price: float
+    tags: tuple[str, ...]
+    image_url: str | None
+
+
+_BRANDS = ("Open", "Community", "Modular", "Compact", "Heavy-duty", "Portable", "Precision")
+_SHARED_TAGS = ("fab-lab", "shared", "open-hardware", "sensorica")
+_DESCRIPTION_SENTENCES = (
+    "{name} is maintained by the {category} working group and shared across member labs.",
+    "Suitable for rapid prototyping, small production runs and teaching workshops.",
+    "Check the booking calendar before use; priority goes to active project contributors.",
+    "Documentation, safety notes and calibration logs are kept in the shared wiki.",
+    "Report wear, damage or missing parts through the maintenance channel after each session.",
+    "Compatible with the standard fixtures and jigs stored next to the main workbench.",
+    "Usage is tracked per project so costs can be attributed in the contribution accounting.",
+    "Training is required before first use; sessions run every second week.",
+    "Spare parts and consumables are listed under the same category in the inventory.",
+    "Originally contributed by a partner organization under a custodianship agreement.",
+)
+
+
+class SyntheticCatalog(Sequence[MockProduct]):
+    """Deterministic, seedable catalog of generated products (ids 1..size).
+
+    Products come in groups of `variants` sharing a template (name, category,
+    description, tags) and differing in an attribute value, price and stock,
+    like Odoo product.product variants of one product.template. Roughly one
+    variant in seven is out of stock.
+
+    Args:
+        size: Number of products.
+        seed: Generation seed; the same (seed, size, variants) always yields
+            the same catalog.
+        variants: Products per template (1 disables variants).
+    """
+
+    def __init__(self, size: int, seed: int = 0, variants: int = 3) -> None:
+        self.size = size
+        self.seed = seed
+        self.variants = max(1, variants)
+        self._last_template: _Template | None = None  # variants are read in runs
+
+    def __len__(self) -> int:
+        return self.size
+
+    @overload
+    def __getitem__(self, index: int) -> MockProduct: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[MockProduct]: ...
+
+    def __getitem__(self, index: int | slice) -> MockProduct | list[MockProduct]:
+        if isinstance(index, slice):
+            return [self._generate(i + 1) for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("catalog index out of range")
+        return self._generate(index + 1)
+
+    def __iter__(self) -> Iterator[MockProduct]:
+        for product_id in range(1, self.size + 1):
+            yield self._generate(product_id)
+
+    def get(self, product_id: int) -> MockProduct | None:
+        """Product by ERP id, or None if outside the catalog."""
+        if 1 <= product_id <= self.size:
+            return self._generate(product_id)
+        return None
+
+    def _generate(self, product_id: int) -> MockProduct:
+        template_id, slot = divmod(product_id - 1, self.variants)
+        template = self._last_template
+        if template is None or template.id != template_id:
+            template = self._last_template = self._template(template_id)
+        profile = _CATEGORY_PROFILES[template.category]
+        attribute = profile.variant_values[(template_id + slot) % len(profile.variant_values)]
+
+        # Per-variant values come from a hash rather than a seeded Random,
+        # which is several times cheaper than seeding a Mersenne Twister.
+        digest = hashlib.blake2b(f"v{self.seed}:{product_id}".encode(), digest_size=6).digest()
+        in_stock, qty_draw, price_draw = (
+            int.from_bytes(digest[i : i + 2], "big") / 65536 for i in (0, 2, 4)
+        )
+        if in_stock < 1 / 7:
+            qty = 0.0
+        elif template.uom in ("unit", "hour"):
+            qty = float(1 + int(qty_draw * profile.max_qty))
+        else:
+            qty = round(0.1 + qty_draw * profile.max_qty, 2)
+        return MockProduct(
+            id=product_id,
+            name=f"{template.name} - {attribute}" if self.variants > 1 else template.name,
+            description=template.description,
+            category=template.category,
+            list_price=round(template.price * (1.0 + 0.25 * price_draw), 2),
+            qty_available=qty,
+            uom_name=template.uom,
+            image_url=template.image_url,
+            tags=list(template.tags),
+        )
+
+    def _template(self, template_id: int) -> _Template:
+        rng = random.Random(f"t{self.seed}:{template_id}")
+        category = rng.choice(SYNTHETIC_CATEGORIES)
+        profile = _CATEGORY_PROFILES[category]
+        name = f"{rng.choice(_BRANDS)} {rng.choice(profile.nouns)} {template_id:06d}"
+        uom = rng.choice(profile.uoms)
+        price = rng.uniform(*profile.price_range)
+        tags = rng.sample(profile.tags, rng.randint(1, min(3, len(profile.tags))))
+        tags += rng.sample(_SHARED_TAGS, rng.randint(0, 2))
+        sentences = rng.sample(_DESCRIPTION_SENTENCES, rng.randint(2, len(_DESCRIPTION_SENTENCES)))
+        image_url = (
+            f"https://erp.example.org/web/image/product.template/{template_id}/image_1920"
+            if rng.random() < 0.6
+            else None
+        )
+        return _Template(
+            id=template_id,
+            category=category,
+            name=name,
+            description=" ".join(sentences).format(name=name, category=category),
+            uom=uom,
+            price=price,
+            tags=tuple(tags),
+            image_url=image_url,
+        )
+
+
+# --- Indexed store ---
+
+
+class _Bitmap:
+    """Growable bitset over non-negative ints with a running population count."""
 
     def __init__(self) -> None:
-        self._products = list(MOCK_PRODUCTS)
+        self._bits = bytearray()
+        self.count = 0
+
+    def __contains__(self, i: object) -> bool:
+        if not isinstance(i, int) or i < 0:
+            return False
+        byte = i >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (i & 7)))
+
+    def add(self, i: int) -> None:
+        byte, mask = i >> 3, 1 << (i & 7)
+        if byte >= len(self._bits):
+            self._bits.extend(bytes(max(byte + 1, 2 * len(self._bits)) - len(self._bits)))
+        if not self._bits[byte] & mask:
+            self._bits[byte] |= mask
+            self.count += 1
+
+    def discard(self, i: int) -> None:
+        byte, mask = i >> 3, 1 << (i & 7)
+        if byte < len(self._bits) and self._bits[byte] & mask:
+            self._bits[byte] &= ~mask
+            self.count -= 1
+
+
+class ProductStore:
+    """Product table indexed by id, category and availability.
+
+    Lookups by id, availability tests and counts are O(1); listing a
+    category is O(products in it). The indexes are updated incrementally by
+    upsert() and remove(), so a changed product never triggers a rescan.
+    Iteration follows insertion order (an upsert keeps a product's place).
+
+    Replace products with upsert() rather than editing them in place, or the
+    indexes go stale. Not thread-safe: mutate between reads, not during them.
+    """
+
+    def __init__(self, products: Iterable[MockProduct] = ()) -> None:
+        self._by_id: dict[int, MockProduct] = {}
+        self._by_category: dict[str, dict[int, None]] = {}  # insertion-ordered id sets
+        self._available = _Bitmap()
+        for product in products:
+            self.upsert(product)
+
+    def upsert(self, product: MockProduct) -> None:
+        """Insert or replace the product with product.id."""
+        old = self._by_id.get(product.id)
+        if old is not None and old.category != product.category:
+            self._drop_from_category(old)
+        self._by_id[product.id] = product
+        self._by_category.setdefault(product.category, {})[product.id] = None
+        if product.qty_available > 0:
+            self._available.add(product.id)
+        else:
+            self._available.discard(product.id)
+
+    def remove(self, product_id: int) -> MockProduct | None:
+        product = self._by_id.pop(product_id, None)
+        if product is not None:
+            self._drop_from_category(product)
+            self._available.discard(product_id)
+        return product
+
+    def _drop_from_category(self, product: MockProduct) -> None:
+        ids = self._by_category[product.category]
+        del ids[product.id]
+        if not ids:
+            del self._by_category[product.category]
+
+    def get(self, product_id: int) -> MockProduct | None:
+        return self._by_id.get(product_id)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[MockProduct]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, product_id: object) -> bool:
+        return product_id in self._by_id
+
+    def is_available(self, product_id: int) -> bool:
+        return product_id in self._available
+
+    @property
+    def available_count(self) -> int:
+        return self._available.count
+
+    def available(self) -> Iterator[MockProduct]:
+        """Products with qty > 0, in store order."""
+        available = self._available
+        return (p for p in self._by_id.values() if p.id in available)
+
+    def categories(self) -> list[str]:
+        return list(self._by_category)
+
+    def ids_in_category(self, category: str) -> list[int]:
+        return list(self._by_category.get(category, ()))
+
+    def in_category(self, category: str) -> list[MockProduct]:
+        return [self._by_id[i] for i in self._by_category.get(category, ())]
+
+
+class MockERPClient:
+    """Simulates reading products from ERPLibre.
+
+    Serves MOCK_PRODUCTS by default, or `products` (any iterable, e.g. a
+    SyntheticCatalog to materialize) from an indexed, mutable ProductStore.
+    Given a `catalog`, the products are instead generated as they are read
+    and the client is read-only (see MockERPClient.synthetic).
+    """
+
+    def __init__(
+        self,
+        catalog: SyntheticCatalog | None = None,
+        products: Iterable[MockProduct] | None = None,
+    ) -> None:
+        if catalog is not None and products is not None:
+            raise ValueError("Pass either a catalog or products, not both")
+        self._catalog = catalog
+        self._store = ProductStore(
+            () if catalog is not None else MOCK_PRODUCTS if products is None else products
+        )
+
+    @classmethod
+    def synthetic(cls, size: int, seed: int = 0, variants: int = 3) -> MockERPClient:
+        """A client over a generated catalog of `size` products."""
+        return cls(SyntheticCatalog(size, seed=seed, variants=variants))
 
     def get_all_products(self) -> list[MockProduct]:
-        return list(self._products)
+        return list(self.iter_products())
+
+    def iter_products(self, available_only: bool = False) -> Iterator[MockProduct]:
+        """Yield products one at a time (same contract as ERPLibreClient.iter_products)."""
+        if self._catalog is None:
+            yield from self._store.available() if available_only else self._store
+            return
+        for p in self._catalog:
+            if not available_only or p.qty_available > 0:
+                yield p
 
     def get_available_products(self) -> list[MockProduct]:
         """Return products with qty > 0 (available for sharing)."""
-        return [p for p in self._products if p.qty_available > 0]
+        return list(self.iter_products(available_only=True))
 
     def get_product_by_id(self, product_id: int) -> MockProduct | None:
-        for p in self._products:
-            if p.id == product_id:
-                return p
-        return None
+        if self._catalog is not None:
+            return self._catalog.get(product_id)
+        return self._store.get(product_id)
+
+    def get_products_by_category(self, category: str) -> list[MockProduct]:
+        if self._catalog is not None:
+            return [p for p in self._catalog if p.category == category]
+        return self._store.in_category(category)
+
+    def is_available(self, product_id: int) -> bool:
+        if self._catalog is not None:
+            product = self._catalog.get(product_id)
+            return product is not None and product.qty_available > 0
+        return self._store.is_available(product_id)
+
+    # --- Mutation (simulates edits made in the ERP) ---
+
+    def upsert_product(self, product: MockProduct) -> None:
+        self._writable().upsert(product)
+
+    def remove_product(self, product_id: int) -> MockProduct | None:
+        return self._writable().remove(product_id)
+
+    def _writable(self) -> ProductStore:
+        if self._catalog is not None:
+            raise TypeError(
+                "Generated catalogs are read-only; use MockERPClient(products=...) to edit"
+            )
+        return self._store
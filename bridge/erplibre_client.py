@@ -0,0 +1,226 @@
+"""ERPLibre (Odoo) product source over XML-RPC.
+
+Production counterpart of MockERPClient with the same interface. Products
+are read from product.product with `execute_kw(..., "search_read", ...)`:
+
+- Field projection: only the fields the mapper needs are requested.
+- Paging: results come in pages of ERPConfig.page_size, ordered by
+  (write_date, id) and continued with a keyset filter rather than an offset,
+  so rows changing mid-pull are neither skipped nor repeated.
+- Incremental pulls: `iter_products(since=cursor)` only returns products with
+  `write_date > cursor`; after a full iteration `last_cursor` holds the value
+  to pass next time.
+"""
+
+from __future__ import annotations
+
+import http.client
+import xmlrpc.client
+from collections.abc import Iterator
+from typing import Any
+
+from bridge.config import ERPConfig
+from bridge.erp_mock import MockProduct
+
+PRODUCT_MODEL = "product.product"
+TAG_MODEL = "product.tag"
+
+# Fields read from product.product; everything product_to_resource_spec and
+# product_to_economic_resource need, plus the paging key.
+PRODUCT_FIELDS = [
+    "name",
+    "description_sale",
+    "categ_id",
+    "list_price",
+    "qty_available",
+    "uom_id",
+    "write_date",
+]
+# Only requested when the server's product.product has it (Odoo 16+).
+TAG_FIELD = "product_tag_ids"
+
+ORDER = "write_date asc, id asc"
+
+
+class ERPError(Exception):
+    """Error communicating with ERPLibre."""
+
+
+class _TimeoutTransport(xmlrpc.client.Transport):
+    """XML-RPC transport with a socket timeout (ServerProxy has none)."""
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__()
+        self._timeout = timeout
+
+    def make_connection(self, host: Any) -> http.client.HTTPConnection:
+        conn = super().make_connection(host)
+        conn.timeout = self._timeout
+        return conn
+
+
+class _TimeoutSafeTransport(xmlrpc.client.SafeTransport):
+    """HTTPS counterpart of _TimeoutTransport."""
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__()
+        self._timeout = timeout
+
+    def make_connection(self, host: Any) -> http.client.HTTPSConnection:
+        conn = super().make_connection(host)
+        conn.timeout = self._timeout
+        return conn
+
+
+def _transport(url: str, timeout: float) -> xmlrpc.client.Transport:
+    """Timeout-aware transport for the URL's scheme (ServerProxy's own choice ignores it)."""
+    if url.startswith("https"):
+        return _TimeoutSafeTransport(timeout)
+    return _TimeoutTransport(timeout)
+
+
+class ERPLibreClient:
+    """Reads products from ERPLibre's product.product model."""
+
+    def __init__(self, config: ERPConfig) -> None:
+        self.config = config
+        self.last_cursor: str | None = None
+        transport = _transport(config.url, config.timeout)
+        self._common = xmlrpc.client.ServerProxy(
+            f"{config.url}/xmlrpc/2/common", transport=transport, allow_none=True
+        )
+        self._models = xmlrpc.client.ServerProxy(
+            f"{config.url}/xmlrpc/2/object", transport=transport, allow_none=True
+        )
+        self._uid: int | None = None
+        self._fields: list[str] | None = None
+        self._tag_names: dict[int, str] = {}
+
+    # --- XML-RPC helpers ---
+
+    def _login(self) -> int:
+        if self._uid is None:
+            try:
+                uid: Any = self._common.authenticate(
+                    self.config.db, self.config.username, self.config.password, {}
+                )
+            except (xmlrpc.client.Error, OSError) as exc:
+                raise ERPError(f"XML-RPC authentication failed: {exc}") from exc
+            if not uid:
+                raise ERPError(f"Authentication rejected for {self.config.username!r}")
+            self._uid = int(uid)
+        return self._uid
+
+    def _execute(
+        self, model: str, method: str, args: list[Any], kwargs: dict[str, Any] | None = None
+    ) -> Any:
+        uid = self._login()
+        try:
+            return self._models.execute_kw(
+                self.config.db, uid, self.config.password, model, method, args, kwargs or {}
+            )
+        except (xmlrpc.client.Error, OSError) as exc:
+            raise ERPError(f"{model}.{method} failed: {exc}") from exc
+
+    def _product_fields(self) -> list[str]:
+        """Projected field list, including tags only if the server has them."""
+        if self._fields is None:
+            available = self._execute(PRODUCT_MODEL, "fields_get", [], {"attributes": ["type"]})
+            self._fields = PRODUCT_FIELDS + ([TAG_FIELD] if TAG_FIELD in available else [])
+        return self._fields
+
+    def _resolve_tags(self, records: list[dict[str, Any]]) -> None:
+        """Fetch names for tag ids not seen before, one read per page."""
+        missing = {
+            tag_id
+            for record in records
+            for tag_id in record.get(TAG_FIELD) or []
+            if tag_id not in self._tag_names
+        }
+        if missing:
+            for tag in self._execute(TAG_MODEL, "read", [sorted(missing)], {"fields": ["name"]}):
+                self._tag_names[tag["id"]] = tag["name"]
+
+    def _to_product(self, record: dict[str, Any]) -> MockProduct:
+        # Odoo returns False for empty fields and [id, display_name] for many2one.
+        category = record["categ_id"][1].split(" / ")[-1].lower() if record["categ_id"] else ""
+        tag_ids = record.get(TAG_FIELD) or []
+        return MockProduct(
+            id=record["id"],
+            name=record["name"],
+            description=record["description_sale"] or "",
+            category=category,
+            list_price=float(record["list_price"]),
+            qty_available=float(record["qty_available"]),
+            uom_name=record["uom_id"][1] if record["uom_id"] else "",
+            tags=[self._tag_names[t] for t in tag_ids if t in self._tag_names] or None,
+        )
+
+    # --- Paged reads ---
+
+    def iter_products(
+        self, available_only: bool = False, since: str | None = None
+    ) -> Iterator[MockProduct]:
+        """Yield products page by page in (write_date, id) order.
+
+        Args:
+            available_only: Only products with qty_available > 0.
+            since: Only products with write_date > since (an Odoo datetime
+                string, typically a previous `last_cursor`).
+        """
+        domain: list[Any] = []
+        if available_only:
+            domain.append(("qty_available", ">", 0))
+        if since is not None:
+            domain.append(("write_date", ">", since))
+
+        fields = self._product_fields()
+        page_domain = domain
+        self.last_cursor = since
+        while True:
+            records: list[dict[str, Any]] = self._execute(
+                PRODUCT_MODEL,
+                "search_read",
+                [page_domain],
+                {"fields": fields, "limit": self.config.page_size, "order": ORDER},
+            )
+            if not records:
+                return
+            if TAG_FIELD in fields:
+                self._resolve_tags(records)
+            for record in records:
+                yield self._to_product(record)
+
+            last = records[-1]
+            self.last_cursor = last["write_date"]
+            if len(records) < self.config.page_size:
+                return
+            page_domain = domain + [
+                "|",
+                ("write_date", ">", last["write_date"]),
+                "&",
+                ("write_date", "=", last["write_date"]),
+                ("id", ">", last["id"]),
+            ]
+
+    # --- MockERPClient interface ---
+
+    def get_all_products(self) -> list[MockProduct]:
+        return list(self.iter_products())
+
+    def get_available_products(self) -> list[MockProduct]:
+        """Return products with qty > 0 (available for sharing)."""
+        return list(self.iter_products(available_only=True))
+
+    def get_product_by_id(self, product_id: int) -> MockProduct | None:
+        records = self._execute(
+            PRODUCT_MODEL,
+            "search_read",
+            [[("id", "=", product_id)]],
+            {"fields": self._product_fields(), "limit": 1},
+        )
+        if not records:
+            return None
+        if TAG_FIELD in self._product_fields():
+            self._resolve_tags(records)
+        return self._to_product(records[0])
@@ -3,23 +3,61 @@
 hc-http-gw exposes Holochain zome functions as HTTP GET endpoints:
     GET {host}/{dna_hash}/{app_id}/{zome}/{fn}?payload={base64_json}
 
-Payloads are standard base64-encoded JSON (with padding).
+Payloads are standard base64-encoded JSON (with padding). Input models are
+serialized straight to JSON bytes by pydantic-core; other payloads (hash
+byte arrays, strings) go through orjson when it is installed (the `fast`
+extra), else the stdlib json module.
 Functions that take `()` omit the `?payload=` parameter entirely.
 
 Hash values (ActionHash, AgentPubKey) are byte arrays in the JSON payload
 due to hc-http-gw v0.3.x msgpack-to-JSON transcoding.
+
+Pass a bridge.cache.ResponseCache to serve repeated read-only calls from
+memory (per-function TTLs, LRU-bounded, invalidated by this client's writes),
+a bridge.singleflight.SingleFlight to let concurrent identical reads share
+one request, bridge.resilience's RetryPolicy / CircuitBreaker to ride out
+transient gateway failures and fast-fail while it is down, and a
+bridge.metrics.MetricsRegistry to record per-function latency and errors.
+With a bridge.pool.GatewayPool, calls are spread over several gateways for
+the same DNA instead of going to config.url. bridge.throttle's RateLimiter
+and AdaptiveConcurrencyLimiter pace calls per function and cap how many are
+in flight at what the gateway sustains. A bridge.hedging.HedgePolicy races a
+duplicate request against slow idempotent reads. A transport (see
+bridge.replay) sees every HTTP exchange and may answer it itself, e.g. to
+record a session and replay it offline.
 """
 
 from __future__ import annotations
 
-import base64
+import binascii
 import json
-from typing import Any
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Generic, Protocol, TypeVar, overload
 
 import requests
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+try:
+    import orjson
+except ImportError:  # optional: pip install 'nondominium-erp-bridge[fast]'
+    orjson = None  # type: ignore[assignment]
 
+from bridge.cache import CacheKey, ResponseCache
 from bridge.config import GatewayConfig
+from bridge.deadline import in_context, remaining
+from bridge.hedging import HedgePolicy
+from bridge.lazy import LazyList
+from bridge.metrics import MetricsRegistry
 from bridge.models import (
+    Claim,
     ClaimCommitmentInput,
     ClaimCommitmentOutput,
     Commitment,
@@ -31,6 +69,7 @@ from bridge.models import (
     CreateValidationReceiptOutput,
     DeriveReputationSummaryInput,
     DeriveReputationSummaryOutput,
+    EconomicEvent,
     EconomicResource,
     EconomicResourceInput,
     GetAllEconomicResourcesOutput,
@@ -46,12 +85,46 @@ from bridge.models import (
     ProposeCommitmentOutput,
     ResourceSpecification,
     ResourceSpecificationInput,
+    ResourceValidation,
     TransferCustodyInput,
     TransferCustodyOutput,
     UpdateResourceStateInput,
     ValidationReceipt,
     hash_to_bytes,
 )
+from bridge.pool import GatewayPool
+from bridge.resilience import CircuitBreaker, RetryPolicy
+from bridge.singleflight import SingleFlight
+from bridge.throttle import AdaptiveConcurrencyLimiter, RateLimiter
+
+# Zome functions that never write; only these are cached and coalesced.
+READ_ONLY_FUNCTIONS = frozenset(
+    {
+        # zome_resource
+        "get_all_resource_specifications",
+        "get_latest_resource_specification",
+        "get_resource_specification_with_rules",
+        "get_resource_specifications_by_category",
+        "get_my_resource_specifications",
+        "get_all_economic_resources",
+        "get_latest_economic_resource",
+        "get_resources_by_specification",
+        "get_my_economic_resources",
+        # zome_gouvernance
+        "get_all_commitments",
+        "get_commitments_for_agent",
+        "get_all_claims",
+        "get_claims_for_commitment",
+        "get_all_economic_events",
+        "get_events_for_resource",
+        "get_events_for_agent",
+        "get_validation_history",
+        "get_all_validation_receipts",
+        "check_validation_status",
+        "get_my_participation_claims",
+        "derive_reputation_summary",
+    }
+)
 
 
 class GatewayError(Exception):
@@ -62,41 +135,475 @@ class GatewayError(Exception):
         super().__init__(message)
 
 
+class GatewayConnectError(GatewayError):
+    """The request never reached hc-http-gw (connection refused, connect timeout)."""
+
+
+class CircuitOpenError(GatewayError):
+    """Call refused locally because the gateway circuit breaker is open."""
+
+
+class DeadlineExceeded(GatewayError):
+    """The operation's deadline (bridge.deadline) left no time for the call."""
+
+
+class Transport(Protocol):
+    """Hook around each HTTP exchange of HolochainGatewayClient.
+
+    `forward(url, params, timeout)` performs the real request; a transport may
+    call it (recording, inspecting) or answer without it (replaying). Errors
+    must be raised as GatewayError / GatewayConnectError, like the client does.
+    """
+
+    def send(
+        self,
+        url: str,
+        params: dict[str, str],
+        timeout: float,
+        forward: Callable[[str, dict[str, str], float], bytes],
+    ) -> bytes: ...
+
+
+InputT = TypeVar("InputT")
+OutputT = TypeVar("OutputT")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@dataclass
+class BulkResult(Generic[OutputT]):
+    """Outcome of one item of a bulk call; `index` is its position in the input."""
+
+    index: int
+    output: OutputT | None = None
+    error: GatewayError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _never_sent(exc: requests.RequestException) -> bool:
+    """Whether a requests failure happened before any bytes reached the gateway."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def json_parser(adapter: TypeAdapter[OutputT]) -> Callable[[bytes], OutputT]:
+    """A `_call(parse=...)` parser validating the raw body with a precompiled adapter.
+
+    validate_json parses and builds the models in one pass inside
+    pydantic-core: no intermediate dict tree, no Python call per element.
+    Malformed JSON is still reported as GatewayError, as by _decode.
+    """
+    return _raw_parser(adapter.validate_json)
+
+
+_MODEL_PARSERS: dict[type[BaseModel], Callable[[bytes], Any]] = {}
+
+
+def model_parser(model: type[ModelT]) -> Callable[[bytes], ModelT]:
+    """The `_call(parse=...)` parser for a single model: model_validate_json on the raw body.
+
+    Memoized per model, so repeated calls hand _call the same parser object
+    (cached reads are tagged by parser identity).
+    """
+    parser = _MODEL_PARSERS.get(model)
+    if parser is None:
+        parser = _MODEL_PARSERS.setdefault(model, _raw_parser(model.model_validate_json))
+    return parser
+
+
+def _raw_parser(validate_json: Callable[[bytes], OutputT]) -> Callable[[bytes], OutputT]:
+    def parse(body: bytes) -> OutputT:
+        try:
+            return validate_json(body)
+        except ValidationError as exc:
+            if any(error["type"] == "json_invalid" for error in exc.errors()):
+                raise GatewayError(
+                    f"Gateway returned invalid JSON: {exc}", status_code=200
+                ) from exc
+            raise
+
+    return parse
+
+
+def lazy_list_parser(validate: Callable[[Any], OutputT]) -> Callable[[bytes], LazyList[OutputT]]:
+    """A `_call(parse=...)` parser decoding a JSON array into a LazyList.
+
+    Only the JSON is decoded up front; `validate` runs per element on first
+    access. A body that is not a JSON array raises GatewayError.
+    """
+
+    def parse(body: bytes) -> LazyList[OutputT]:
+        data = _decode_json(body)
+        if not isinstance(data, list):
+            raise GatewayError(
+                f"Gateway returned {type(data).__name__}, expected a JSON array", status_code=200
+            )
+        return LazyList(data, validate)
+
+    return parse
+
+
+def _decode_json(body: bytes) -> Any:
+    try:
+        return json.loads(body)
+    except ValueError as exc:
+        raise GatewayError(f"Gateway returned invalid JSON: {exc}", status_code=200) from exc
+
+
+# Compiled once at import; constructing a TypeAdapter builds a core schema.
+COMMITMENT_LIST = TypeAdapter(list[Commitment])
+VALIDATION_RECEIPT_LIST = TypeAdapter(list[ValidationReceipt])
+RESOURCE_VALIDATION = TypeAdapter[ResourceValidation | None](ResourceValidation | None)
+# PrivateParticipationClaim carries raw signature bytes and is left untyped.
+PARTICIPATION_CLAIM = TypeAdapter(dict[str, Any])
+
+
 class HolochainGatewayClient:
     """Typed client wrapping hc-http-gw for Nondominium zome coordinators."""
 
     ZOME_RESOURCE = "zome_resource"
     ZOME_GOUVERNANCE = "zome_gouvernance"
 
-    def __init__(self, config: GatewayConfig) -> None:
+    _parse_commitments = staticmethod(json_parser(COMMITMENT_LIST))
+    _parse_validation_receipts = staticmethod(json_parser(VALIDATION_RECEIPT_LIST))
+    _parse_resource_validation = staticmethod(json_parser(RESOURCE_VALIDATION))
+    _parse_resources = staticmethod(lazy_list_parser(EconomicResource.model_validate))
+    _parse_events = staticmethod(lazy_list_parser(EconomicEvent.model_validate))
+    _parse_claims = staticmethod(lazy_list_parser(Claim.model_validate))
+    _parse_participation_claims = staticmethod(
+        lazy_list_parser(PARTICIPATION_CLAIM.validate_python)
+    )
+
+    def __init__(
+        self,
+        config: GatewayConfig,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        metrics: MetricsRegistry | None = None,
+        pool: GatewayPool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        hedging: HedgePolicy | None = None,
+        transport: Transport | None = None,
+    ) -> None:
         self.config = config
+        self.cache = cache
+        self.single_flight = single_flight
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        self.pool = pool
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.hedging = hedging
+        self.transport = transport
+        # Hedged reads race two blocking requests, so they run on worker threads:
+        # two per read, for at most hedging.max_in_flight reads at once.
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_slots: threading.BoundedSemaphore | None = None
+        if hedging is not None:
+            self._hedge_executor = ThreadPoolExecutor(
+                2 * hedging.max_in_flight, thread_name_prefix="gateway-hedge"
+            )
+            self._hedge_slots = threading.BoundedSemaphore(hedging.max_in_flight)
         self._session = requests.Session()
+        # Size the keep-alive pool so concurrent callers (e.g. the concurrent sync
+        # mode) reuse connections instead of discarding them past urllib3's default 10.
+        # One connection pool per gateway host.
+        hosts = len(pool.urls) if pool is not None else 1
+        adapter = HTTPAdapter(pool_connections=hosts, pool_maxsize=config.max_connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def __enter__(self) -> HolochainGatewayClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the hedging threads and close the connection pool.
+
+        Queued hedges are cancelled; requests already sent are not waited for.
+        """
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
 
     # --- URL / encoding helpers ---
 
-    def _base_url(self, zome: str = "zome_resource") -> str:
-        return f"{self.config.url}/{self.config.dna_hash}/{self.config.app_id}/{zome}"
+    @staticmethod
+    def _zome_path(config: GatewayConfig, zome: str, fn_name: str) -> str:
+        """Request path of a zome function, appended to the base URL of the gateway."""
+        return f"/{config.dna_hash}/{config.app_id}/{zome}/{fn_name}"
 
     @staticmethod
     def _encode_payload(data: Any) -> str:
         """Base64-encode a JSON payload for hc-http-gw.
 
-        hc-http-gw v0.3.x expects standard base64 with padding.
+        hc-http-gw v0.3.x expects standard base64 with padding. A model is
+        serialized by its own compiled serializer (same JSON as
+        model_dump(mode="json"), without the intermediate dict).
         """
-        json_bytes = json.dumps(data, separators=(",", ":")).encode()
-        return base64.b64encode(json_bytes).decode()
-
-    def _call(self, fn_name: str, payload: Any | None = None, zome: str = "zome_resource") -> Any:
-        """Call a zome function via hc-http-gw and return parsed JSON."""
-        url = f"{self._base_url(zome)}/{fn_name}"
+        if isinstance(data, BaseModel):
+            json_bytes = data.__pydantic_serializer__.to_json(data)
+        elif orjson is not None:
+            json_bytes = orjson.dumps(data)
+        else:
+            json_bytes = json.dumps(data, separators=(",", ":")).encode()
+        return binascii.b2a_base64(json_bytes, newline=False).decode("ascii")
+
+    @overload
+    def _call(
+        self, fn_name: str, payload: Any | None = None, zome: str = "zome_resource"
+    ) -> Any: ...
+
+    @overload
+    def _call(
+        self,
+        fn_name: str,
+        payload: Any | None = None,
+        zome: str = "zome_resource",
+        *,
+        parse: Callable[[bytes], OutputT],
+    ) -> OutputT: ...
+
+    def _call(
+        self,
+        fn_name: str,
+        payload: Any | None = None,
+        zome: str = "zome_resource",
+        *,
+        parse: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Call a zome function via hc-http-gw and return parsed JSON.
+
+        With `parse`, the raw response body is handed to it instead (e.g. a
+        precompiled TypeAdapter's validate_json, see json_parser), skipping
+        the intermediate dict tree; the parsed value is what gets cached and
+        shared with coalesced callers.
+
+        Read-only functions go through the cache and single-flight group, when
+        configured; any other call invalidates the cached reads it may affect.
+        """
+        parse = parse or self._decode
+        path = self._zome_path(self.config, zome, fn_name)
         params: dict[str, str] = {}
         if payload is not None:
             params["payload"] = self._encode_payload(payload)
 
+        if fn_name in READ_ONLY_FUNCTIONS:
+            return self._read((zome, fn_name, params.get("payload")), path, params, parse)
+        try:
+            return self._request(zome, fn_name, path, params, parse)
+        finally:
+            # A failed write may still have landed, so invalidate either way.
+            if self.cache is not None:
+                self.cache.invalidate_for_write(fn_name, payload, self._encode_payload)
+
+    def _read(
+        self, key: CacheKey, path: str, params: dict[str, str], parse: Callable[[bytes], Any]
+    ) -> Any:
+        """Serve a read from the cache, a shared in-flight call, or the gateway.
+
+        Cached values are tagged with the parser that produced them, so a
+        lookup through a different parser is a miss rather than a wrong type.
+        """
+        cache = self.cache
+        if cache is not None and cache.cacheable(key[1]):
+            hit, value = cache.get(key)
+            if hit and value[0] is parse:
+                return value[1]
+
+        led = False
+
+        def fetch() -> Any:
+            nonlocal led
+            led = True
+            generation = cache.generation if cache is not None else None
+            data = self._request(key[0], key[1], path, params, parse)
+            if cache is not None:
+                cache.put(key, (parse, data), generation)
+            return data
+
+        if self.single_flight is None:
+            return fetch()
+        while True:
+            try:
+                return self.single_flight.do((key, parse), fetch, timeout=remaining())
+            except TimeoutError:
+                raise DeadlineExceeded(
+                    f"Deadline passed waiting for a shared {key[1]} call"
+                ) from None
+            except DeadlineExceeded:
+                left = remaining()
+                if led or (left is not None and left <= 0):
+                    raise
+                # The leader ran out of its own budget, not ours: fetch again.
+
+    def _request(
+        self,
+        zome: str,
+        fn_name: str,
+        path: str,
+        params: dict[str, str],
+        parse: Callable[[bytes], Any],
+    ) -> Any:
+        """Send a call under the retry policy and circuit breaker, if configured.
+
+        With a pool, each attempt goes to the endpoint it picks, and a read
+        failing on an unhealthy endpoint fails over at once to another one.
+        Each attempt first waits for its rate-limit token and a concurrency slot,
+        and waits for the gateway at most until the current deadline.
+        """
+        policy, breaker, pool = self.retry_policy, self.circuit_breaker, self.pool
+        rate_limiter, limiter = self.rate_limiter, self.concurrency_limiter
+        read_only = fn_name in READ_ONLY_FUNCTIONS
+        attempts = policy.attempts(read_only) if policy is not None else 1
+        attempt = 0
+        tried: list[str] = []
+        hedging = self.hedging
+        hedge_delay = hedging.delay(fn_name) if hedging is not None and read_only else None
+        while True:
+            if rate_limiter is not None:
+                wait = rate_limiter.reserve(zome, fn_name)
+                if wait > 0:
+                    left = remaining()
+                    if left is not None and wait >= left:
+                        raise DeadlineExceeded(
+                            f"Deadline leaves {left:.2f}s, rate limit holds {fn_name} {wait:.2f}s"
+                        )
+                    time.sleep(wait)
+            ticket = 0.0
+            if limiter is not None:
+                try:
+                    ticket = limiter.acquire(remaining())
+                except TimeoutError:
+                    raise DeadlineExceeded(
+                        f"Deadline passed waiting for a concurrency slot for {fn_name}"
+                    ) from None
+            try:
+                timeout = self._attempt_timeout(self.config, fn_name)
+                if breaker is not None and not breaker.allow():
+                    raise CircuitOpenError(
+                        f"Circuit open: gateway calls suspended for {breaker.retry_after():.1f}s"
+                    )
+            except GatewayError:
+                if limiter is not None:
+                    limiter.discard()
+                raise
+            base = pool.acquire(read_only, tried) if pool is not None else self.config.url
+            start = time.perf_counter()
+            try:
+                if hedge_delay is None:
+                    body = self._send(base + path, params, timeout)
+                else:
+                    body = self._send_hedged(base, path, params, timeout, fn_name, hedge_delay)
+            except GatewayError as exc:
+                if self._cut_by_deadline(self.config, fn_name, timeout, exc):
+                    # The caller's budget, not the gateway, ended this attempt:
+                    # no verdict on the endpoint, the window or the breaker.
+                    if pool is not None:
+                        pool.release(base)
+                    if limiter is not None:
+                        limiter.discard()
+                    if breaker is not None:
+                        breaker.abandon_probe()
+                    self._observe(zome, fn_name, start, exc.status_code, params, 0)
+                    raise DeadlineExceeded(f"Deadline exceeded calling {fn_name}: {exc}") from exc
+                unhealthy = CircuitBreaker.counts_as_failure(exc.status_code)
+                if pool is not None:
+                    pool.release(base, failed=unhealthy)
+                if limiter is not None:
+                    limiter.release(ticket, overloaded=limiter.counts_as_overload(exc.status_code))
+                self._observe(zome, fn_name, start, exc.status_code, params, 0)
+                if breaker is not None:
+                    if unhealthy:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                left = remaining()
+                if left is not None and left <= 0:
+                    raise DeadlineExceeded(f"Deadline exceeded calling {fn_name}: {exc}") from exc
+                if pool is not None and read_only and unhealthy:
+                    tried.append(base)
+                    if pool.can_fail_over(tried):
+                        continue
+                attempt += 1
+                never_sent = isinstance(exc, GatewayConnectError)
+                if (
+                    policy is None
+                    or attempt >= attempts
+                    or not policy.should_retry(exc.status_code, read_only, never_sent)
+                ):
+                    raise
+                delay = policy.delay(attempt - 1)
+                if left is not None and delay >= left:
+                    raise DeadlineExceeded(
+                        f"Deadline leaves no time to retry {fn_name}: {exc}"
+                    ) from exc
+                time.sleep(delay)
+                tried.clear()
+            except BaseException:
+                if pool is not None:
+                    pool.release(base)
+                if limiter is not None:
+                    limiter.discard()
+                if breaker is not None:
+                    breaker.abandon_probe()
+                raise
+            else:
+                if pool is not None:
+                    pool.release(base)
+                if limiter is not None:
+                    limiter.release(ticket)
+                self._observe(zome, fn_name, start, 200, params, len(body))
+                if breaker is not None:
+                    breaker.record_success()
+                return parse(body)
+
+    def _observe(
+        self,
+        zome: str,
+        fn_name: str,
+        start: float,
+        status_code: int | None,
+        params: dict[str, str],
+        response_bytes: int,
+    ) -> None:
+        if self.metrics is not None:
+            self.metrics.observe(
+                zome,
+                fn_name,
+                time.perf_counter() - start,
+                status_code,
+                len(params.get("payload", "")),
+                response_bytes,
+            )
+
+    def _send(self, url: str, params: dict[str, str], timeout: float) -> bytes:
+        """Issue one HTTP GET (through the transport, if any) and return the raw body."""
+        if self.transport is not None:
+            return self.transport.send(url, params, timeout, self._http_get)
+        return self._http_get(url, params, timeout)
+
+    def _http_get(self, url: str, params: dict[str, str], timeout: float) -> bytes:
         try:
-            resp = self._session.get(url, params=params, timeout=self.config.timeout)
+            resp = self._session.get(url, params=params, timeout=timeout)
         except requests.RequestException as exc:
-            raise GatewayError(f"HTTP request failed: {exc}") from exc
+            error = GatewayConnectError if _never_sent(exc) else GatewayError
+            raise error(f"HTTP request failed: {exc}") from exc
 
         if resp.status_code != 200:
             raise GatewayError(
@@ -104,32 +611,145 @@ class HolochainGatewayClient:
                 status_code=resp.status_code,
             )
 
-        return resp.json()
+        return resp.content
+
+    def _send_hedged(
+        self,
+        base: str,
+        path: str,
+        params: dict[str, str],
+        timeout: float,
+        fn_name: str,
+        delay: float,
+    ) -> bytes:
+        """_send, racing a duplicate request if no answer comes within `delay`.
+
+        The first answer wins; a failed request waits for the other one, and
+        when both fail the primary's error is raised. The losing request
+        cannot be interrupted: it finishes on its worker and is dropped.
+
+        A read holds one of the `max_in_flight` slots until both its requests
+        are done, so requests never queue for a worker; with no slot free the
+        read is sent unhedged.
+        """
+        hedging, pool, executor = self.hedging, self.pool, self._hedge_executor
+        slots = self._hedge_slots
+        assert hedging is not None and executor is not None and slots is not None
+        if not slots.acquire(blocking=False):
+            return self._send(base + path, params, timeout)
+        lock = threading.Lock()
+        holders = 1  # this call, then each request it starts
+
+        def let_go(_: object = None) -> None:
+            nonlocal holders
+            with lock:
+                holders -= 1
+                last = holders == 0
+            if last:
+                slots.release()
+
+        def submit(url: str) -> Future[bytes]:
+            nonlocal holders
+            with lock:
+                holders += 1
+            future = executor.submit(self._send, url, params, timeout)
+            future.add_done_callback(let_go)
+            return future
+
+        try:
+            start = time.perf_counter()
+            primary = submit(base + path)
+
+            def observe(future: Future[bytes]) -> None:
+                if future.exception() is None:
+                    hedging.observe(fn_name, time.perf_counter() - start)
+
+            primary.add_done_callback(observe)
+            wait([primary], timeout=delay)
+            if primary.done():
+                return primary.result()
+
+            hedge_base = pool.acquire(True, exclude=[base]) if pool is not None else base
+            hedge = submit(hedge_base + path)
+            if pool is not None:
+                hedge.add_done_callback(
+                    lambda future: pool.release(
+                        hedge_base, failed=self._send_failed(future.exception())
+                    )
+                )
+            pending: set[Future[bytes]] = {primary, hedge}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        hedging.record_hedge(won=future is hedge)
+                        return future.result()
+            hedging.record_hedge(won=False)
+            return primary.result()  # raises the primary's error
+        finally:
+            let_go()
+
+    _decode = staticmethod(_decode_json)
+
+    @staticmethod
+    def _send_failed(exc: BaseException | None) -> bool:
+        """Whether a finished send counts against its endpoint's health."""
+        return isinstance(exc, GatewayError) and CircuitBreaker.counts_as_failure(exc.status_code)
+
+    @staticmethod
+    def _attempt_timeout(config: GatewayConfig, fn_name: str) -> float:
+        """The function's timeout, cut to what is left of the current deadline."""
+        timeout = config.timeout_for(fn_name)
+        left = remaining()
+        if left is None or left >= timeout:
+            return timeout
+        if left <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded before calling {fn_name}")
+        return left
+
+    @staticmethod
+    def _cut_by_deadline(
+        config: GatewayConfig, fn_name: str, timeout: float, exc: GatewayError
+    ) -> bool:
+        """Whether an attempt timed out only because its timeout was cut to the deadline."""
+        return (
+            timeout < config.timeout_for(fn_name)
+            and exc.status_code is None
+            and not isinstance(exc, GatewayConnectError)
+        )
 
     # --- ResourceSpecification functions ---
 
     def create_resource_specification(
         self, input_data: ResourceSpecificationInput
     ) -> CreateResourceSpecificationOutput:
-        data = self._call(
+        return self._call(
             "create_resource_specification",
-            input_data.model_dump(mode="json"),
+            input_data,
+            parse=model_parser(CreateResourceSpecificationOutput),
         )
-        return CreateResourceSpecificationOutput.model_validate(data)
 
     def get_all_resource_specifications(self) -> GetAllResourceSpecificationsOutput:
-        data = self._call("get_all_resource_specifications")
-        return GetAllResourceSpecificationsOutput.model_validate(data)
+        return self._call(
+            "get_all_resource_specifications",
+            parse=model_parser(GetAllResourceSpecificationsOutput),
+        )
 
     def get_latest_resource_specification(self, action_hash: str) -> ResourceSpecification:
-        data = self._call("get_latest_resource_specification", hash_to_bytes(action_hash))
-        return ResourceSpecification.model_validate(data)
+        return self._call(
+            "get_latest_resource_specification",
+            hash_to_bytes(action_hash),
+            parse=model_parser(ResourceSpecification),
+        )
 
     def get_resource_specification_with_rules(
         self, spec_hash: str
     ) -> GetResourceSpecWithRulesOutput:
-        data = self._call("get_resource_specification_with_rules", hash_to_bytes(spec_hash))
-        return GetResourceSpecWithRulesOutput.model_validate(data)
+        return self._call(
+            "get_resource_specification_with_rules",
+            hash_to_bytes(spec_hash),
+            parse=model_parser(GetResourceSpecWithRulesOutput),
+        )
 
     def get_resource_specifications_by_category(self, category: str) -> Any:
         return self._call("get_resource_specifications_by_category", category)
@@ -142,22 +762,28 @@ class HolochainGatewayClient:
     def create_economic_resource(
         self, input_data: EconomicResourceInput
     ) -> CreateEconomicResourceOutput:
-        data = self._call(
+        return self._call(
             "create_economic_resource",
-            input_data.model_dump(mode="json"),
+            input_data,
+            parse=model_parser(CreateEconomicResourceOutput),
         )
-        return CreateEconomicResourceOutput.model_validate(data)
 
     def get_all_economic_resources(self) -> GetAllEconomicResourcesOutput:
-        data = self._call("get_all_economic_resources")
-        return GetAllEconomicResourcesOutput.model_validate(data)
+        return self._call(
+            "get_all_economic_resources", parse=model_parser(GetAllEconomicResourcesOutput)
+        )
 
     def get_latest_economic_resource(self, action_hash: str) -> EconomicResource:
-        data = self._call("get_latest_economic_resource", hash_to_bytes(action_hash))
-        return EconomicResource.model_validate(data)
+        return self._call(
+            "get_latest_economic_resource",
+            hash_to_bytes(action_hash),
+            parse=model_parser(EconomicResource),
+        )
 
-    def get_resources_by_specification(self, spec_hash: str) -> Any:
-        return self._call("get_resources_by_specification", hash_to_bytes(spec_hash))
+    def get_resources_by_specification(self, spec_hash: str) -> LazyList[EconomicResource]:
+        return self._call(
+            "get_resources_by_specification", hash_to_bytes(spec_hash), parse=self._parse_resources
+        )
 
     def get_my_economic_resources(self) -> Any:
         return self._call("get_my_economic_resources")
@@ -165,18 +791,75 @@ class HolochainGatewayClient:
     # --- Custody & state functions ---
 
     def transfer_custody(self, input_data: TransferCustodyInput) -> TransferCustodyOutput:
-        data = self._call("transfer_custody", input_data.model_dump(mode="json"))
-        return TransferCustodyOutput.model_validate(data)
+        return self._call(
+            "transfer_custody",
+            input_data,
+            parse=model_parser(TransferCustodyOutput),
+        )
 
     def update_resource_state(self, input_data: UpdateResourceStateInput) -> Any:
-        return self._call("update_resource_state", input_data.model_dump(mode="json"))
+        return self._call("update_resource_state", input_data)
+
+    # --- Bulk creation ---
+
+    def create_resource_specifications_bulk(
+        self, inputs: Iterable[ResourceSpecificationInput], concurrency: int = 16
+    ) -> list[BulkResult[CreateResourceSpecificationOutput]]:
+        """Create many specs with up to `concurrency` calls in flight.
+
+        Results are in input order; a failed item carries its GatewayError
+        instead of aborting the batch.
+        """
+        return self._bulk(self.create_resource_specification, inputs, concurrency)
+
+    def create_economic_resources_bulk(
+        self, inputs: Iterable[EconomicResourceInput], concurrency: int = 16
+    ) -> list[BulkResult[CreateEconomicResourceOutput]]:
+        """Create many resources with up to `concurrency` calls in flight.
+
+        Results are in input order; a failed item carries its GatewayError
+        instead of aborting the batch.
+        """
+        return self._bulk(self.create_economic_resource, inputs, concurrency)
+
+    @staticmethod
+    def _bulk(
+        create: Callable[[InputT], OutputT], inputs: Iterable[InputT], concurrency: int
+    ) -> list[BulkResult[OutputT]]:
+        def run(index: int, item: InputT) -> BulkResult[OutputT]:
+            try:
+                return BulkResult(index, output=create(item))
+            except GatewayError as exc:
+                return BulkResult(index, error=exc)
+
+        if concurrency <= 1:
+            return [run(index, item) for index, item in enumerate(inputs)]
+
+        # Inputs are consumed lazily: at most 2 * concurrency are pending, so a
+        # generator of millions of items is never materialized up front.
+        results: list[BulkResult[OutputT]] = []
+        run_in_context = in_context(run)  # workers see the caller's deadline
+        window: deque[Future[BulkResult[OutputT]]] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for index, item in enumerate(inputs):
+                if len(window) >= 2 * concurrency:
+                    results.append(window.popleft().result())
+                window.append(pool.submit(run_in_context, index, item))
+            results.extend(future.result() for future in window)
+        return results
 
     # --- Health check ---
 
     def health_check(self) -> bool:
-        """Check if the gateway is reachable by attempting a read operation."""
+        """Check if the gateway is reachable by attempting a read operation.
+
+        The read bypasses the cache and single-flight group: a cached answer
+        would report a gateway that just went down as healthy.
+        """
+        fn_name = "get_all_resource_specifications"
+        path = self._zome_path(self.config, self.ZOME_RESOURCE, fn_name)
         try:
-            self.get_all_resource_specifications()
+            self._request(self.ZOME_RESOURCE, fn_name, path, {}, self._decode)
             return True
         except GatewayError:
             return False
@@ -184,33 +867,36 @@ class HolochainGatewayClient:
     # --- Commitment functions (zome_gouvernance) ---
 
     def propose_commitment(self, input_data: ProposeCommitmentInput) -> ProposeCommitmentOutput:
-        data = self._call(
+        return self._call(
             "propose_commitment",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(ProposeCommitmentOutput),
         )
-        return ProposeCommitmentOutput.model_validate(data)
 
     def get_all_commitments(self) -> list[Commitment]:
-        data = self._call("get_all_commitments", zome=self.ZOME_GOUVERNANCE)
-        return [Commitment.model_validate(c) for c in data]
+        return self._call(
+            "get_all_commitments", zome=self.ZOME_GOUVERNANCE, parse=self._parse_commitments
+        )
 
     def get_commitments_for_agent(self, agent_pub_key: str) -> list[Commitment]:
-        data = self._call(
-            "get_commitments_for_agent", hash_to_bytes(agent_pub_key), zome=self.ZOME_GOUVERNANCE
+        return self._call(
+            "get_commitments_for_agent",
+            hash_to_bytes(agent_pub_key),
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_commitments,
         )
-        return [Commitment.model_validate(c) for c in data]
 
     def claim_commitment(self, input_data: ClaimCommitmentInput) -> ClaimCommitmentOutput:
-        data = self._call(
+        return self._call(
             "claim_commitment",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(ClaimCommitmentOutput),
         )
-        return ClaimCommitmentOutput.model_validate(data)
 
-    def get_all_claims(self) -> Any:
-        return self._call("get_all_claims", zome=self.ZOME_GOUVERNANCE)
+    def get_all_claims(self) -> LazyList[Claim]:
+        return self._call("get_all_claims", zome=self.ZOME_GOUVERNANCE, parse=self._parse_claims)
 
     def get_claims_for_commitment(self, commitment_hash: str) -> Any:
         return self._call(
@@ -220,27 +906,32 @@ class HolochainGatewayClient:
     # --- EconomicEvent functions (zome_gouvernance) ---
 
     def log_economic_event(self, input_data: LogEconomicEventInput) -> LogEconomicEventOutput:
-        data = self._call(
+        return self._call(
             "log_economic_event",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(LogEconomicEventOutput),
         )
-        return LogEconomicEventOutput.model_validate(data)
 
     def log_initial_transfer(self, input_data: LogInitialTransferInput) -> LogInitialTransferOutput:
-        data = self._call(
+        return self._call(
             "log_initial_transfer",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(LogInitialTransferOutput),
         )
-        return LogInitialTransferOutput.model_validate(data)
 
-    def get_all_economic_events(self) -> Any:
-        return self._call("get_all_economic_events", zome=self.ZOME_GOUVERNANCE)
+    def get_all_economic_events(self) -> LazyList[EconomicEvent]:
+        return self._call(
+            "get_all_economic_events", zome=self.ZOME_GOUVERNANCE, parse=self._parse_events
+        )
 
-    def get_events_for_resource(self, resource_hash: str) -> Any:
+    def get_events_for_resource(self, resource_hash: str) -> LazyList[EconomicEvent]:
         return self._call(
-            "get_events_for_resource", hash_to_bytes(resource_hash), zome=self.ZOME_GOUVERNANCE
+            "get_events_for_resource",
+            hash_to_bytes(resource_hash),
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_events,
         )
 
     def get_events_for_agent(self, agent_pub_key: str) -> Any:
@@ -253,38 +944,44 @@ class HolochainGatewayClient:
     def create_validation_receipt(
         self, input_data: CreateValidationReceiptInput
     ) -> CreateValidationReceiptOutput:
-        data = self._call(
+        return self._call(
             "create_validation_receipt",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(CreateValidationReceiptOutput),
         )
-        return CreateValidationReceiptOutput.model_validate(data)
 
     def get_validation_history(self, item_hash: str) -> list[ValidationReceipt]:
-        data = self._call(
-            "get_validation_history", hash_to_bytes(item_hash), zome=self.ZOME_GOUVERNANCE
+        return self._call(
+            "get_validation_history",
+            hash_to_bytes(item_hash),
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_validation_receipts,
         )
-        return [ValidationReceipt.model_validate(r) for r in data]
 
     def get_all_validation_receipts(self) -> list[ValidationReceipt]:
-        data = self._call("get_all_validation_receipts", zome=self.ZOME_GOUVERNANCE)
-        return [ValidationReceipt.model_validate(r) for r in data]
+        return self._call(
+            "get_all_validation_receipts",
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_validation_receipts,
+        )
 
     def create_resource_validation(
         self, input_data: CreateResourceValidationInput
     ) -> CreateResourceValidationOutput:
-        data = self._call(
+        return self._call(
             "create_resource_validation",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(CreateResourceValidationOutput),
         )
-        return CreateResourceValidationOutput.model_validate(data)
 
-    def check_validation_status(self, validation_hash: str) -> Any:
+    def check_validation_status(self, validation_hash: str) -> ResourceValidation | None:
         return self._call(
             "check_validation_status",
             hash_to_bytes(validation_hash),
             zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_resource_validation,
         )
 
     # --- PPR functions (zome_gouvernance) ---
@@ -292,22 +989,26 @@ class HolochainGatewayClient:
     def issue_participation_receipts(
         self, input_data: IssueParticipationReceiptsInput
     ) -> IssueParticipationReceiptsOutput:
-        data = self._call(
+        return self._call(
             "issue_participation_receipts",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(IssueParticipationReceiptsOutput),
         )
-        return IssueParticipationReceiptsOutput.model_validate(data)
 
-    def get_my_participation_claims(self) -> Any:
-        return self._call("get_my_participation_claims", zome=self.ZOME_GOUVERNANCE)
+    def get_my_participation_claims(self) -> LazyList[dict[str, Any]]:
+        return self._call(
+            "get_my_participation_claims",
+            zome=self.ZOME_GOUVERNANCE,
+            parse=self._parse_participation_claims,
+        )
 
     def derive_reputation_summary(
         self, input_data: DeriveReputationSummaryInput
     ) -> DeriveReputationSummaryOutput:
-        data = self._call(
+        return self._call(
             "derive_reputation_summary",
-            input_data.model_dump(mode="json"),
+            input_data,
             zome=self.ZOME_GOUVERNANCE,
+            parse=model_parser(DeriveReputationSummaryOutput),
         )
-        return DeriveReputationSummaryOutput.model_validate(data)
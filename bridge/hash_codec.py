@@ -0,0 +1,74 @@
+"""Fast conversion between Holochain hash byte arrays and base64url strings.
+
+hc-http-gw v0.3.x sends hashes as JSON arrays of 39 ints and expects them
+back in that form, while the bridge keeps them as base64url strings (state
+keys, logs, equality checks). Bulk responses repeat the same few hashes:
+every resource of an org carries the same custodian agent key, every
+resource of a spec links the same spec hash. So both directions are
+memoized in bounded LRU tables (functools.lru_cache, C-implemented and
+thread-safe):
+
+- encode_hash: raw bytes -> base64url. A repeated hash costs one table
+  probe, and every model holding it shares one string object instead of
+  a fresh copy per occurrence (interning within the LRU window).
+- decode_hash: string, with or without the Holochain "u" multibase
+  prefix -> raw bytes, likewise memoized; outgoing payloads mostly carry
+  hashes that were just read or written.
+
+Misses go straight to binascii with precomputed translation tables rather
+than the base64.urlsafe_* wrappers. A 39-byte hash encodes to exactly 52
+characters, so no padding is ever stripped or added for real hashes.
+
+Values stay plain str on the model side so existing state files and
+string comparisons keep working; the canonical bytes live in the tables.
+"""
+
+from __future__ import annotations
+
+import binascii
+import functools
+from typing import Any
+
+HASH_CACHE_SIZE = 65_536  # distinct hashes remembered per direction
+
+_TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+_FROM_URLSAFE = bytes.maketrans(b"-_", b"+/")
+
+
+@functools.lru_cache(maxsize=HASH_CACHE_SIZE)
+def encode_hash(raw: bytes) -> str:
+    """Unpadded base64url of raw hash bytes (no "u" prefix)."""
+    encoded = binascii.b2a_base64(raw, newline=False).translate(_TO_URLSAFE)
+    return encoded.rstrip(b"=").decode("ascii")
+
+
+@functools.lru_cache(maxsize=HASH_CACHE_SIZE)
+def decode_hash(value: str) -> bytes:
+    """Raw bytes of a hash string in display ("uhCkk...") or raw ("hCkk...") form."""
+    raw_b64 = value[1:] if value.startswith("u") else value
+    padded = raw_b64 + "=" * (-len(raw_b64) % 4)
+    return binascii.a2b_base64(padded.encode("ascii").translate(_FROM_URLSAFE))
+
+
+def coerce_hash(v: Any) -> str:
+    """Accept a base64 string, a byte-array list (hc-http-gw v0.3.x) or bytes."""
+    if isinstance(v, str):
+        return v
+    if isinstance(v, list):
+        try:
+            return encode_hash(bytes(v))
+        except TypeError as exc:  # non-int items; ValueError surfaces as validation error
+            raise ValueError(f"Invalid hash byte array: {exc}") from exc
+    if isinstance(v, bytes):
+        return encode_hash(v)
+    raise ValueError(f"Expected str or list[int] for hash, got {type(v)}")
+
+
+def hash_to_list(v: str) -> list[int]:
+    """Byte-array form of a hash string, as hc-http-gw v0.3.x expects in payloads."""
+    return list(decode_hash(v))
+
+
+def cache_clear() -> None:
+    encode_hash.cache_clear()
+    decode_hash.cache_clear()
@@ -0,0 +1,125 @@
+"""Hedged reads: race a duplicate request against a slow one.
+
+DHT reads through hc-http-gw have long tails when the conductor must fetch
+entries from peers. Both gateway clients accept a HedgePolicy:
+
+    hedging = HedgePolicy()
+    client = HolochainGatewayClient(config, pool=pool, hedging=hedging)
+    ...
+    print(hedging.stats())
+
+For the functions in `functions` (idempotent reads only), a request still
+unanswered after the function's recent p95 latency (`quantile`) gets a
+duplicate, sent to another available endpoint of the client's GatewayPool
+when there is one, else to the same gateway. Whichever answers first wins;
+a failure waits for the other request. The async client cancels the losing
+request; a blocking requests call cannot be interrupted, so the sync
+client abandons it and drops its answer.
+
+By construction only about 1 - quantile of requests are hedged, so the
+extra load stays small. Until `min_samples` latencies have been seen for
+a function, `initial_delay` is used. Hedges bypass the retry policy, the
+circuit breaker and the concurrency limiter: they are part of one attempt.
+
+The sync client runs hedged reads on its own threads, two per read, and
+races at most `max_in_flight` of them at once; further reads are sent
+unhedged until a slot frees up. Close it (or use it as a context manager)
+to stop those threads.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+HEDGED_FUNCTIONS = frozenset(
+    {"get_latest_economic_resource", "get_resources_by_specification", "get_validation_history"}
+)
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Counters of a HedgePolicy.
+
+    `requests` counts calls to hedged functions, `hedges` the duplicates sent
+    and `wins` the duplicates that answered first.
+    """
+
+    requests: int
+    hedges: int
+    wins: int
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedges / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.hedges if self.hedges else 0.0
+
+
+class HedgePolicy:
+    """When to hedge a read, tracking recent latencies per function.
+
+    Args:
+        functions: Zome functions to hedge; only read-only ones are ever hedged.
+        quantile: Latency quantile after which the hedge is sent.
+        initial_delay: Hedge delay (seconds) until `min_samples` latencies are known.
+        min_delay: Floor of the hedge delay, so a fast gateway is not doubled up.
+        min_samples: Latencies needed before the quantile is trusted.
+        window: Recent latencies kept per function.
+        max_in_flight: Reads a sync client races at once (two threads each).
+    """
+
+    def __init__(
+        self,
+        functions: Iterable[str] = HEDGED_FUNCTIONS,
+        quantile: float = 0.95,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.005,
+        min_samples: int = 20,
+        window: int = 200,
+        max_in_flight: int = 8,
+    ) -> None:
+        self.functions = frozenset(functions)
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_in_flight = max_in_flight
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        self._requests = self._hedges = self._wins = 0
+
+    def delay(self, fn_name: str) -> float | None:
+        """Seconds to wait before hedging a call to `fn_name`; None: do not hedge."""
+        if fn_name not in self.functions:
+            return None
+        with self._lock:
+            self._requests += 1
+            samples = self._latencies.get(fn_name)
+            if samples is None or len(samples) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def observe(self, fn_name: str, seconds: float) -> None:
+        """Record the latency of a (primary) request that answered."""
+        with self._lock:
+            samples = self._latencies.get(fn_name)
+            if samples is None:
+                samples = self._latencies[fn_name] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def record_hedge(self, won: bool) -> None:
+        with self._lock:
+            self._hedges += 1
+            self._wins += won
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(requests=self._requests, hedges=self._hedges, wins=self._wins)
@@ -0,0 +1,82 @@
+"""Lazily validated list results for gateway reads.
+
+Listing zome functions (resources of a spec, events, claims) can return
+thousands of entries, while many callers only need how many there are
+(ResourceDiscovery.check_availability) or the first few. LazyList keeps
+the decoded JSON array as returned by the gateway and builds each model
+the first time its element is read, so len() and truthiness never pay
+for model construction.
+
+Validated elements are memoized: a LazyList served from the response
+cache, or shared by coalesced callers, validates each element at most
+once (two threads racing on the same index may both validate it, which
+is harmless; one result wins the slot). An element that does not match
+its model raises ValidationError on access rather than at call time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, TypeVar, overload
+
+T = TypeVar("T")
+
+_UNSET: Any = object()
+
+
+class LazyList(Sequence[T]):
+    """Read-only sequence over a decoded JSON array, validating on access."""
+
+    __slots__ = ("_raw", "_validate", "_items")
+
+    def __init__(self, raw: list[Any], validate: Callable[[Any], T]) -> None:
+        self._raw = raw
+        self._validate = validate
+        self._items: list[Any] | None = None
+
+    @property
+    def raw(self) -> list[Any]:
+        """The undecoded elements, as returned by the gateway."""
+        return self._raw
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self._raw)))]
+        if index < 0:
+            index += len(self._raw)
+        if not 0 <= index < len(self._raw):
+            raise IndexError("LazyList index out of range")
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self._raw)):
+            yield self._item(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        validated = sum(item is not _UNSET for item in self._items or ())
+        return f"LazyList({len(self._raw)} items, {validated} validated)"
+
+    def _item(self, index: int) -> T:
+        items = self._items
+        if items is None:
+            items = self._items = [_UNSET] * len(self._raw)
+        item = items[index]
+        if item is _UNSET:
+            item = items[index] = self._validate(self._raw[index])
+        return item  # type: ignore[no-any-return]
@@ -7,6 +7,8 @@ Uses the actual field names from the Nondominium zome coordinator:
 
 from __future__ import annotations
 
+import hashlib
+
 from bridge.erp_mock import MockProduct
 from bridge.models import EconomicResourceInput, ResourceSpecificationInput
 
@@ -39,3 +41,18 @@ def product_to_economic_resource(
         unit=product.uom_name,
         current_location=None,
     )
+
+
+def spec_fingerprint(spec_input: ResourceSpecificationInput) -> str:
+    """Content fingerprint of a mapped spec, used to detect ERP-side changes."""
+    return hashlib.sha256(spec_input.model_dump_json().encode()).hexdigest()
+
+
+def resource_fingerprint(resource_input: EconomicResourceInput) -> str:
+    """Content fingerprint of a mapped resource.
+
+    Excludes spec_hash: it is an output of the sync, not ERP content, and
+    changes whenever the spec is re-published.
+    """
+    content = resource_input.model_dump_json(exclude={"spec_hash"})
+    return hashlib.sha256(content.encode()).hexdigest()
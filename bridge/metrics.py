@@ -0,0 +1,188 @@
+"""In-process call metrics for gateway clients, with Prometheus text export.
+
+Pass a MetricsRegistry to either gateway client and every HTTP request to
+hc-http-gw (each retry attempt included, cache hits excluded) is recorded
+per (zome, fn): call count, errors by status, request/response bytes and
+a latency histogram.
+
+    metrics = MetricsRegistry()
+    client = HolochainGatewayClient(config, metrics=metrics)
+    ...
+    for (zome, fn), stats in metrics.snapshot().items():
+        print(zome, fn, stats.calls, stats.p95)
+    Path("bridge.prom").write_text(metrics.to_prometheus())
+
+Latency percentiles are estimated from the histogram buckets by linear
+interpolation (as Prometheus' histogram_quantile does), so memory stays
+constant no matter how many calls are recorded.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+
+# Upper bounds (seconds) of the latency buckets; an implicit +Inf follows.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+TRANSPORT_ERROR = "transport"  # status label for failures without an HTTP status
+
+
+class Histogram:
+    """Fixed-bucket histogram (not thread-safe; MetricsRegistry locks around it)."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+
+@dataclass
+class _FunctionMetrics:
+    calls: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+
+
+@dataclass(frozen=True)
+class FunctionStats:
+    """Snapshot of one zome function's metrics."""
+
+    calls: int
+    errors: dict[str, int]
+    request_bytes: int
+    response_bytes: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+
+class MetricsRegistry:
+    """Thread-safe registry of per (zome, fn) gateway call metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._functions: dict[tuple[str, str], _FunctionMetrics] = {}
+
+    def observe(
+        self,
+        zome: str,
+        fn_name: str,
+        seconds: float,
+        status_code: int | None,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """Record one HTTP request; status_code None means a transport failure."""
+        with self._lock:
+            metrics = self._functions.get((zome, fn_name))
+            if metrics is None:
+                metrics = self._functions[(zome, fn_name)] = _FunctionMetrics()
+            metrics.calls += 1
+            if status_code != 200:
+                label = TRANSPORT_ERROR if status_code is None else str(status_code)
+                metrics.errors[label] = metrics.errors.get(label, 0) + 1
+            metrics.request_bytes += request_bytes
+            metrics.response_bytes += response_bytes
+            metrics.latency.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._functions.clear()
+
+    def snapshot(self) -> dict[tuple[str, str], FunctionStats]:
+        with self._lock:
+            return {
+                key: FunctionStats(
+                    calls=m.calls,
+                    errors=dict(m.errors),
+                    request_bytes=m.request_bytes,
+                    response_bytes=m.response_bytes,
+                    mean=m.latency.sum / m.latency.count if m.latency.count else 0.0,
+                    p50=m.latency.quantile(0.50),
+                    p95=m.latency.quantile(0.95),
+                    p99=m.latency.quantile(0.99),
+                    max=m.latency.max,
+                )
+                for key, m in sorted(self._functions.items())
+            }
+
+    def to_prometheus(self, prefix: str = "hc_gateway") -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            items = sorted(self._functions.items())
+            lines = [
+                f"# HELP {prefix}_calls_total Requests sent to hc-http-gw.",
+                f"# TYPE {prefix}_calls_total counter",
+            ]
+            lines += [f"{prefix}_calls_total{_labels(k)} {m.calls}" for k, m in items]
+            lines += [
+                f"# HELP {prefix}_errors_total Failed requests by HTTP status.",
+                f"# TYPE {prefix}_errors_total counter",
+            ]
+            lines += [
+                f"{prefix}_errors_total{_labels(k, status=status)} {count}"
+                for k, m in items
+                for status, count in sorted(m.errors.items())
+            ]
+            for name, attr, help_text in (
+                ("request_bytes_total", "request_bytes", "Encoded payload bytes sent."),
+                ("response_bytes_total", "response_bytes", "Response body bytes received."),
+            ):
+                lines += [
+                    f"# HELP {prefix}_{name} {help_text}",
+                    f"# TYPE {prefix}_{name} counter",
+                ]
+                lines += [f"{prefix}_{name}{_labels(k)} {getattr(m, attr)}" for k, m in items]
+
+            metric = f"{prefix}_call_duration_seconds"
+            lines += [
+                f"# HELP {metric} Request latency.",
+                f"# TYPE {metric} histogram",
+            ]
+            for key, m in items:
+                cumulative = 0
+                for bound, count in zip((*m.latency.buckets, "+Inf"), m.latency.counts):
+                    cumulative += count
+                    lines.append(f"{metric}_bucket{_labels(key, le=str(bound))} {cumulative}")
+                lines.append(f"{metric}_sum{_labels(key)} {m.latency.sum}")
+                lines.append(f"{metric}_count{_labels(key)} {m.latency.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: tuple[str, str], **extra: str) -> str:
+    zome, fn_name = key
+    pairs = {"zome": zome, "fn": fn_name, **extra}
+    return "{" + ",".join(f'{name}="{value}"' for name, value in pairs.items()) + "}"
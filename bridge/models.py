@@ -15,31 +15,17 @@ These models map 1:1 to the Holochain zome types defined in:
 
 from __future__ import annotations
 
-import base64
 from enum import Enum
 from typing import Annotated, Any
 
 from pydantic import BaseModel, BeforeValidator, Field, PlainSerializer
 
+from bridge.hash_codec import coerce_hash, hash_to_list
 
-def _coerce_hash(v: Any) -> str:
-    """Accept both a base64 string and a byte-array list (hc-http-gw v0.3.x format)."""
-    if isinstance(v, str):
-        return v
-    if isinstance(v, list):
-        return base64.urlsafe_b64encode(bytes(v)).rstrip(b"=").decode()
-    raise ValueError(f"Expected str or list[int] for hash, got {type(v)}")
-
-
-def hash_to_bytes(v: str) -> list[int]:
-    """Convert a hash string back to byte array for hc-http-gw v0.3.x.
-
-    Accepts both Holochain display format (u-prefixed, e.g. "uhCkk...")
-    and raw base64url (e.g. "hCkk..." from _coerce_hash).
-    """
-    raw_b64 = v[1:] if v.startswith("u") else v
-    padded = raw_b64 + "=" * (-len(raw_b64) % 4)
-    return list(base64.urlsafe_b64decode(padded))
+# Hash conversion is memoized and interned in bridge.hash_codec; bound
+# directly (no wrapper call) under the names used throughout the bridge.
+_coerce_hash = coerce_hash  # byte-array list or str -> base64url str
+hash_to_bytes = hash_to_list  # "uhCkk..." or "hCkk..." -> byte-array list
 
 
 # Output type: coerces byte-array responses to base64url strings for Python use.
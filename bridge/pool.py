@@ -0,0 +1,227 @@
+"""A pool of hc-http-gw endpoints with load balancing and failover.
+
+Each endpoint is an hc-http-gw process fronting a conductor that runs the
+same DNA, so any of them can answer a read. Both gateway clients accept a
+GatewayPool:
+
+    pool = GatewayPool(["http://gw-a:8888", "http://gw-b:8888"])
+    pool.start_health_checks(http_probe(config), interval=5.0)
+    client = HolochainGatewayClient(config, pool=pool)
+
+Reads go to the available endpoint with the fewest requests in flight
+(ties rotate, so an idle pool round-robins). A read that fails with a
+transport error or 5xx is re-sent at once to another available endpoint;
+this failover does not consume the RetryPolicy's attempts.
+
+Writes are pinned to `write_url` (the first endpoint by default): entries
+are authored by the conductor's agent, so the org agent's writes must all
+go through its own conductor and are never failed over to another one.
+
+After `failure_threshold` consecutive failures an endpoint is taken out
+of rotation for `reset_timeout` seconds (then tried again), or until a
+background health probe finds it answering. When every endpoint is out,
+reads still go to the one due back soonest rather than failing unsent.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Collection, Sequence
+from dataclasses import dataclass
+
+import requests
+
+from bridge.config import GatewayConfig
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """Snapshot of one endpoint's state in a GatewayPool."""
+
+    url: str
+    available: bool
+    outstanding: int
+    requests: int
+    failures: int
+
+
+class _Endpoint:
+    __slots__ = ("url", "outstanding", "requests", "failures", "consecutive_failures", "down_until")
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+
+
+class GatewayPool:
+    """Thread-safe set of gateway endpoints shared by the calls of a client.
+
+    Args:
+        urls: Base URLs of the gateways (as in GatewayConfig.url).
+        write_url: Endpoint all writes are pinned to; defaults to urls[0]
+            and is added to the pool if not listed.
+        failure_threshold: Consecutive failures that take an endpoint out.
+        reset_timeout: Seconds an endpoint stays out before it is retried.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        write_url: str | None = None,
+        failure_threshold: int = 3,
+        reset_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        ordered = [url.rstrip("/") for url in urls]
+        if write_url is not None:
+            write_url = write_url.rstrip("/")
+            ordered.append(write_url)
+        ordered = list(dict.fromkeys(ordered))
+        if not ordered:
+            raise ValueError("GatewayPool needs at least one endpoint URL")
+        self.write_url = write_url or ordered[0]
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._endpoints = {url: _Endpoint(url) for url in ordered}
+        self._lock = threading.Lock()
+        self._turn = 0
+        self._stop: threading.Event | None = None
+        self._health_thread: threading.Thread | None = None
+
+    @property
+    def urls(self) -> list[str]:
+        return list(self._endpoints)
+
+    # --- Selection ---
+
+    def acquire(self, read_only: bool, exclude: Collection[str] = ()) -> str:
+        """Pick the endpoint for one request and count it as in flight.
+
+        Pair every acquire with a release. `exclude` lists endpoints that
+        already failed this call; it is ignored once nothing else is left.
+        """
+        with self._lock:
+            if read_only:
+                endpoint = self._pick(exclude)
+            else:
+                endpoint = self._endpoints[self.write_url]
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint.url
+
+    def _pick(self, exclude: Collection[str]) -> _Endpoint:
+        candidates = [e for e in self._endpoints.values() if e.url not in exclude]
+        if not candidates:
+            candidates = list(self._endpoints.values())
+        now = self._clock()
+        available = [e for e in candidates if e.down_until <= now]
+        if not available:
+            return min(candidates, key=lambda e: e.down_until)
+        # Rotate the starting point so ties spread over the pool.
+        self._turn = (self._turn + 1) % len(available)
+        rotated = available[self._turn :] + available[: self._turn]
+        return min(rotated, key=lambda e: e.outstanding)
+
+    def release(self, url: str, failed: bool = False) -> None:
+        """Mark a request to `url` finished; `failed` counts toward taking it out."""
+        with self._lock:
+            endpoint = self._endpoints[url]
+            endpoint.outstanding -= 1
+            self._record(endpoint, failed)
+
+    def can_fail_over(self, tried: Collection[str]) -> bool:
+        """Whether an available endpoint outside `tried` remains for a read."""
+        with self._lock:
+            now = self._clock()
+            return any(e.url not in tried and e.down_until <= now for e in self._endpoints.values())
+
+    def _record(self, endpoint: _Endpoint, failed: bool) -> None:
+        if not failed:
+            endpoint.consecutive_failures = 0
+            endpoint.down_until = 0.0
+            return
+        endpoint.failures += 1
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= self.failure_threshold:
+            endpoint.down_until = self._clock() + self.reset_timeout
+
+    # --- Health checks ---
+
+    def probe(self, check: Callable[[str], bool]) -> None:
+        """Run `check` against every endpoint once and record the outcomes."""
+        for url in self.urls:
+            try:
+                healthy = check(url)
+            except Exception:  # a broken probe must not kill the health thread
+                healthy = False
+            with self._lock:
+                endpoint = self._endpoints[url]
+                if healthy:
+                    self._record(endpoint, failed=False)
+                else:
+                    # A failed probe takes the endpoint out right away.
+                    endpoint.consecutive_failures = max(
+                        endpoint.consecutive_failures, self.failure_threshold - 1
+                    )
+                    self._record(endpoint, failed=True)
+
+    def start_health_checks(self, check: Callable[[str], bool], interval: float = 5.0) -> None:
+        """Probe every endpoint each `interval` seconds on a daemon thread."""
+        if self._health_thread is not None:
+            raise RuntimeError("Health checks already running")
+        stop = threading.Event()
+
+        def loop() -> None:
+            while not stop.is_set():
+                self.probe(check)
+                stop.wait(interval)
+
+        self._stop = stop
+        self._health_thread = threading.Thread(target=loop, name="gateway-pool-health", daemon=True)
+        self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        if self._stop is None or self._health_thread is None:
+            return
+        self._stop.set()
+        self._health_thread.join()
+        self._stop = self._health_thread = None
+
+    # --- Introspection ---
+
+    def stats(self) -> list[EndpointStats]:
+        with self._lock:
+            now = self._clock()
+            return [
+                EndpointStats(
+                    url=e.url,
+                    available=e.down_until <= now,
+                    outstanding=e.outstanding,
+                    requests=e.requests,
+                    failures=e.failures,
+                )
+                for e in self._endpoints.values()
+            ]
+
+
+def http_probe(
+    config: GatewayConfig, fn_name: str = "get_all_resource_specifications", timeout: float = 2.0
+) -> Callable[[str], bool]:
+    """A health check for GatewayPool: one read-only zome call, healthy on HTTP 200."""
+    path = f"/{config.dna_hash}/{config.app_id}/zome_resource/{fn_name}"
+    session = requests.Session()
+
+    def check(url: str) -> bool:
+        try:
+            return session.get(url + path, timeout=timeout).status_code == 200
+        except requests.RequestException:
+            return False
+
+    return check
@@ -0,0 +1,197 @@
+"""Record real gateway exchanges and replay them offline.
+
+A RecordingTransport sits between HolochainGatewayClient and the network
+and keeps every exchange: the zome function, its decoded payload, the
+response (or error) and how long it took. Saved as JSON Lines, gzipped
+when the file name ends in .gz:
+
+    recorder = RecordingTransport()
+    client = HolochainGatewayClient(config, transport=recorder)
+    bridge.sync_inventory()
+    recorder.save(Path("sync-run.jsonl.gz"))
+
+A ReplayTransport answers from such a file without any conductor, sleeping
+for the recorded latency times `latency_scale` (0 replays instantly, 2.0
+reproduces a gateway twice as slow). A recorded latency beyond the
+client's per-request timeout replays as a timeout.
+
+    replay = ReplayTransport.load(Path("sync-run.jsonl.gz"), latency_scale=1.0)
+    client = HolochainGatewayClient(config, transport=replay)
+
+Exchanges are matched on (zome/fn, payload) and served in recorded order;
+the DNA hash, app id and gateway URL are not part of the match, so a
+recording replays under any config. A call with no recorded answer left
+raises ReplayMiss (not a GatewayError, so it cannot be mistaken for a
+gateway failure and retried or swallowed). With `loop=True` the answers
+for a call are cycled instead, for benchmarks that repeat a workload.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Any, Literal
+from urllib.parse import urlsplit
+
+from bridge.gateway_client import GatewayConnectError, GatewayError
+
+SendFn = Callable[[str, dict[str, str], float], bytes]
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """One recorded gateway call.
+
+    `status` is None for a transport failure; `body` holds the response
+    text, or the error message when `status` is not 200. `offset` is when
+    the call started, in seconds since the first recorded call.
+    """
+
+    fn: str  # "zome/fn_name"
+    payload: Any
+    status: int | None
+    body: str
+    elapsed: float
+    offset: float = 0.0
+    never_sent: bool = False
+
+
+def _fn_and_payload(url: str, params: dict[str, str]) -> tuple[str, Any]:
+    zome, fn_name = urlsplit(url).path.rstrip("/").split("/")[-2:]
+    encoded = params.get("payload")
+    payload = json.loads(base64.b64decode(encoded)) if encoded is not None else None
+    return f"{zome}/{fn_name}", payload
+
+
+def _match_key(fn: str, payload: Any) -> tuple[str, str]:
+    return fn, json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def _open(path: Path, mode: Literal["r", "w"]) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt" if mode == "r" else "wt", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+class RecordingTransport:
+    """Forwards calls to the gateway and records each exchange (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._exchanges: list[Exchange] = []
+        self._origin: float | None = None
+
+    @property
+    def exchanges(self) -> list[Exchange]:
+        with self._lock:
+            return list(self._exchanges)
+
+    def send(self, url: str, params: dict[str, str], timeout: float, forward: SendFn) -> bytes:
+        fn, payload = _fn_and_payload(url, params)
+        start = time.perf_counter()
+        try:
+            body = forward(url, params, timeout)
+        except GatewayError as exc:
+            self._record(
+                fn,
+                payload,
+                exc.status_code,
+                str(exc),
+                start,
+                never_sent=isinstance(exc, GatewayConnectError),
+            )
+            raise
+        self._record(fn, payload, 200, body.decode("utf-8", errors="replace"), start)
+        return body
+
+    def _record(
+        self,
+        fn: str,
+        payload: Any,
+        status: int | None,
+        body: str,
+        start: float,
+        never_sent: bool = False,
+    ) -> None:
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            if self._origin is None:
+                self._origin = start
+            self._exchanges.append(
+                Exchange(fn, payload, status, body, elapsed, start - self._origin, never_sent)
+            )
+
+    def save(self, path: Path) -> None:
+        """Write the exchanges as JSON Lines (gzipped for a .gz path), in call order."""
+        exchanges = sorted(self.exchanges, key=lambda exchange: exchange.offset)
+        with _open(path, "w") as out:
+            for exchange in exchanges:
+                out.write(json.dumps(asdict(exchange), separators=(",", ":")) + "\n")
+
+
+class ReplayMiss(LookupError):
+    """A call with no recorded exchange left to answer it."""
+
+
+class ReplayTransport:
+    """Answers calls from recorded exchanges, with original or scaled latency.
+
+    Args:
+        exchanges: Recorded exchanges, in call order.
+        latency_scale: Factor applied to recorded latencies (0: no delay).
+        loop: Cycle through a call's answers instead of running out.
+        sleep: Delay function (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        exchanges: Iterable[Exchange],
+        latency_scale: float = 1.0,
+        loop: bool = False,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.latency_scale = latency_scale
+        self.loop = loop
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._answers: dict[tuple[str, str], deque[Exchange]] = {}
+        for exchange in exchanges:
+            key = _match_key(exchange.fn, exchange.payload)
+            self._answers.setdefault(key, deque()).append(exchange)
+        self.replayed = 0
+
+    @classmethod
+    def load(cls, path: Path, **kwargs: Any) -> ReplayTransport:
+        """Read a file written by RecordingTransport.save."""
+        with _open(path, "r") as lines:
+            exchanges = [Exchange(**json.loads(line)) for line in lines if line.strip()]
+        return cls(exchanges, **kwargs)
+
+    def send(self, url: str, params: dict[str, str], timeout: float, forward: SendFn) -> bytes:
+        fn, payload = _fn_and_payload(url, params)
+        with self._lock:
+            answers = self._answers.get(_match_key(fn, payload))
+            if not answers:
+                raise ReplayMiss(f"No recorded exchange left for {fn} with payload {payload!r}")
+            exchange = answers.popleft()
+            if self.loop:
+                answers.append(exchange)
+            self.replayed += 1
+
+        delay = exchange.elapsed * self.latency_scale
+        if delay > timeout:
+            self._sleep(timeout)
+            raise GatewayError(f"HTTP request failed: replayed {fn} timed out after {timeout}s")
+        if delay > 0:
+            self._sleep(delay)
+        if exchange.status == 200:
+            return exchange.body.encode("utf-8")
+        error = GatewayConnectError if exchange.never_sent else GatewayError
+        raise error(exchange.body, status_code=exchange.status)
@@ -0,0 +1,135 @@
+"""Retry policy and circuit breaker for gateway calls.
+
+Both gateway clients accept a RetryPolicy and a CircuitBreaker:
+
+    client = HolochainGatewayClient(
+        config, retry_policy=RetryPolicy(), circuit_breaker=CircuitBreaker()
+    )
+
+Retries:
+- Read-only functions are retried on transport errors and on the
+  transient statuses in `retry_statuses`, with full-jitter exponential
+  backoff (a random delay in [0, min(max_delay, base_delay * 2**attempt))).
+- Writes are not idempotent on the DHT (a repeated create publishes a
+  second entry), so they are only retried when the request provably never
+  reached the gateway (connection refused, connect timeout) and only if
+  `write_attempts` > 1. A write that may have landed is never repeated.
+
+Circuit breaker: after `failure_threshold` consecutive gateway failures
+(transport errors or 5xx) the circuit opens and calls fail immediately with
+CircuitOpenError instead of each waiting out GatewayConfig.timeout. After
+`reset_timeout` seconds one probe call is let through; its success closes
+the circuit, its failure re-opens it. 4xx responses mean the gateway is up
+and do not count.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-issuing a failed gateway call."""
+
+    read_attempts: int = 3
+    write_attempts: int = 1
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 502, 503, 504}))
+
+    def attempts(self, read_only: bool) -> int:
+        return max(1, self.read_attempts if read_only else self.write_attempts)
+
+    def should_retry(self, status_code: int | None, read_only: bool, never_sent: bool) -> bool:
+        """Whether a failure is worth another attempt (attempt budget aside)."""
+        if never_sent:
+            return True
+        if not read_only:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, rng: Callable[[], float] = random.random) -> float:
+        """Full-jitter backoff before retry number `attempt` (0-based)."""
+        return rng() * min(self.max_delay, self.base_delay * 2.0**attempt)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by all calls of a client.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before a probe.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open state only one probe may."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._clock() - self._opened_at < self.reset_timeout or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+    def abandon_probe(self) -> None:
+        """Free the half-open probe slot after a call ended with no verdict (cancelled)."""
+        with self._lock:
+            self._probing = False
+
+    @staticmethod
+    def counts_as_failure(status_code: int | None) -> bool:
+        """Transport errors and 5xx mean the gateway is unhealthy; 4xx do not."""
+        return status_code is None or status_code >= 500
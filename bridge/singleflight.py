@@ -0,0 +1,105 @@
+"""Coalescing of identical in-flight calls ("single-flight").
+
+When several threads (or coroutines) make the same read-only zome call at
+once, only the first one - the leader - issues the gateway request; the
+others wait for it and receive the same parsed result, or the same
+exception. Once the leader finishes the key is released, so later calls
+fetch again (or hit the ResponseCache, if one is configured).
+
+    flight = SingleFlight()
+    client = HolochainGatewayClient(config, single_flight=flight)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group for blocking calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.leaders = 0  # calls that went to the gateway
+        self.shared = 0  # calls that waited on a leader instead
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: float | None = None) -> Any:
+        """Run fn() for key, or wait for the call already running for key.
+
+        A waiter gives up with TimeoutError after `timeout` seconds; the
+        leader's call is not affected.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.shared += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            if not flight.done.wait(timeout):
+                raise TimeoutError(f"Shared call still running after {timeout:.2f}s")
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+class AsyncSingleFlight:
+    """Single-flight group for coroutines on one event loop.
+
+    The shared call runs as its own task, so a cancelled waiter (even the
+    one that started it) does not cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Task[Any]] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]], timeout: float | None = None
+    ) -> Any:
+        """Await fn() for key, sharing the call; TimeoutError after `timeout` seconds."""
+        task = self._flights.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+
+            async def run() -> Any:
+                return await fn()
+
+            task = asyncio.ensure_future(run())
+            self._flights[key] = task
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+            self.leaders += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Shared call still running after {timeout:.2f}s") from None
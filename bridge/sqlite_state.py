@@ -0,0 +1,174 @@
+"""SQLite-backed sync state for large catalogs.
+
+Drop-in alternative to sync.SyncState: same is_synced/record/get_entry/save
+interface, but each record() is a single indexed upsert instead of a full
+JSON rewrite, and nothing is loaded into memory up front. Writes are grouped
+into transactions of `batch_size` records; save() commits whatever is pending.
+
+The database runs in WAL mode so readers (e.g. a discovery process) never
+block the sync writer.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    product_id    INTEGER PRIMARY KEY,
+    spec_hash     TEXT NOT NULL,
+    resource_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sync_state_spec_hash ON sync_state (spec_hash);
+CREATE INDEX IF NOT EXISTS idx_sync_state_resource_hash ON sync_state (resource_hash);
+"""
+
+# Forward-only schema migrations, applied in order; PRAGMA user_version
+# records how many have run.
+_MIGRATIONS = (
+    """
+    ALTER TABLE sync_state ADD COLUMN spec_fingerprint TEXT;
+    ALTER TABLE sync_state ADD COLUMN resource_fingerprint TEXT;
+    """,
+)
+
+_UPSERT = """
+INSERT INTO sync_state
+    (product_id, spec_hash, resource_hash, spec_fingerprint, resource_fingerprint)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (product_id) DO UPDATE SET
+    spec_hash = excluded.spec_hash,
+    resource_hash = excluded.resource_hash,
+    spec_fingerprint = excluded.spec_fingerprint,
+    resource_fingerprint = excluded.resource_fingerprint
+"""
+
+_COLUMNS = ("spec_hash", "resource_hash", "spec_fingerprint", "resource_fingerprint")
+
+
+def _row_to_entry(row: tuple[str | None, ...]) -> dict[str, str]:
+    """Build a SyncState-compatible entry, omitting unset fingerprints."""
+    return {col: value for col, value in zip(_COLUMNS, row) if value is not None}
+
+
+class SqliteSyncState:
+    """SQLite persistence mapping product_id -> (spec_hash, resource_hash).
+
+    Provides the same idempotency guarantees as SyncState with O(log n)
+    lookups and per-record upserts.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 500) -> None:
+        self._path = path
+        self._batch_size = batch_size
+        self._pending = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is durable across application crashes in WAL mode; only an OS
+        # crash can lose the last commits, which a re-sync simply repeats.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        version: int = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        for index, script in enumerate(_MIGRATIONS[version:], start=version + 1):
+            self._conn.executescript(f"BEGIN; {script} PRAGMA user_version = {index}; COMMIT;")
+
+    def save(self) -> None:
+        """Commit any records not yet flushed by batching."""
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.save()
+        self._conn.close()
+
+    def is_synced(self, product_id: int) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM sync_state WHERE product_id = ?", (product_id,)
+        ).fetchone()
+        return row is not None
+
+    def record(
+        self,
+        product_id: int,
+        spec_hash: str,
+        resource_hash: str,
+        spec_fingerprint: str | None = None,
+        resource_fingerprint: str | None = None,
+    ) -> None:
+        self._conn.execute(
+            _UPSERT,
+            (product_id, spec_hash, resource_hash, spec_fingerprint, resource_fingerprint),
+        )
+        self._pending += 1
+        if self._pending >= self._batch_size:
+            self.save()
+
+    def get_entry(self, product_id: int) -> dict[str, str] | None:
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM sync_state WHERE product_id = ?",
+            (product_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return _row_to_entry(row)
+
+    def as_dict(self) -> dict[str, Any]:
+        rows = self._conn.execute(
+            f"SELECT product_id, {', '.join(_COLUMNS)} FROM sync_state ORDER BY product_id"
+        )
+        return {str(row[0]): _row_to_entry(row[1:]) for row in rows}
+
+    def iter_entries(self) -> Iterator[tuple[int, dict[str, str]]]:
+        """Yield (product_id, entry) pairs in product_id order, one page at a time.
+
+        Pages are read by keyset (product_id > last seen), so memory stays at
+        one page and records written meanwhile do not disturb the scan.
+        """
+        last = -(2**63)  # smallest SQLite integer
+        while True:
+            rows = self._conn.execute(
+                f"SELECT product_id, {', '.join(_COLUMNS)} FROM sync_state"
+                " WHERE product_id > ? ORDER BY product_id LIMIT ?",
+                (last, self._batch_size),
+            ).fetchall()
+            for row in rows:
+                yield row[0], _row_to_entry(row[1:])
+            if len(rows) < self._batch_size:
+                return
+            last = rows[-1][0]
+
+
+def migrate_json_state(json_path: Path, db_path: Path) -> int:
+    """Copy a SyncState JSON file into a SQLite state database.
+
+    Runs in a single transaction and upserts, so re-running it is harmless.
+    The JSON file is left untouched. Returns the number of entries migrated.
+    """
+    data: dict[str, dict[str, str]] = json.loads(json_path.read_text())
+    state = SqliteSyncState(db_path)
+    try:
+        with state._conn:
+            state._conn.executemany(
+                _UPSERT,
+                (
+                    (
+                        int(product_id),
+                        entry["spec_hash"],
+                        entry["resource_hash"],
+                        entry.get("spec_fingerprint"),
+                        entry.get("resource_fingerprint"),
+                    )
+                    for product_id, entry in data.items()
+                ),
+            )
+    finally:
+        state.close()
+    return len(data)
@@ -1,27 +1,64 @@
 """Inventory sync pipeline: ERP products -> Nondominium resources.
 
 Orchestrates the full sync flow:
-1. Get available products from ERP
+1. Stream available products from ERP (page by page, read ahead on a
+   background thread into a bounded buffer)
 2. Skip already-synced products (idempotency via SyncState)
 3. Map -> create spec -> map -> create resource (per product)
 4. Handle errors per-item (continue on failure)
 5. Persist sync state and return SyncResult
+
+With workers > 1, step 3 runs on a thread pool: each worker carries one
+product through spec -> resource, so the resource call for one product
+overlaps the spec calls of the products behind it. Outcomes are applied to
+SyncResult and SyncState on the calling thread, in catalog order.
+
+Delta mode (sync_inventory(delta=True)) replaces step 2 with a content
+check: each synced product's spec/resource fingerprints are compared to the
+ones recorded in SyncState, and only changed products touch the gateway.
+A changed spec is re-published with a new resource; a changed resource
+(quantity, unit) gets a new resource under the existing spec. In both cases
+the superseded resource is retired via update_resource_state. Delta mode
+walks the whole catalog, not just available products: a synced product
+whose quantity dropped to 0 has its resource retired, as does one that left
+the catalog. Such entries keep their spec_hash with an empty resource_hash,
+and a product that comes back in stock gets a new resource under its spec.
+
+sync_inventory(timeout=...) bounds the whole run (see bridge.deadline):
+gateway calls only get the remaining budget, and once it is spent no
+further products are started; they are picked up by the next run.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import queue
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar, cast
 
+from bridge.deadline import deadline, expired, in_context
 from bridge.erp_mock import MockERPClient, MockProduct
+from bridge.erplibre_client import ERPLibreClient
 from bridge.gateway_client import GatewayError, HolochainGatewayClient
-from bridge.mapper import product_to_economic_resource, product_to_resource_spec
+from bridge.mapper import (
+    product_to_economic_resource,
+    product_to_resource_spec,
+    resource_fingerprint,
+    spec_fingerprint,
+)
+from bridge.models import ResourceSpecificationInput, ResourceState, UpdateResourceStateInput
+from bridge.sqlite_state import SqliteSyncState
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class SyncResult:
@@ -29,18 +66,22 @@ class SyncResult:
 
     specs_created: int = 0
     resources_created: int = 0
+    updated: int = 0  # delta mode: new resource under the product's existing spec
+    resources_retired: int = 0  # delta mode: superseded resources set to Retired
+    withdrawn: int = 0  # delta mode: products out of stock or gone from the catalog
     skipped: int = 0
     errors: list[str] = field(default_factory=list)
 
     @property
     def total_processed(self) -> int:
-        return self.specs_created + self.skipped + len(self.errors)
+        return self.specs_created + self.updated + self.withdrawn + self.skipped + len(self.errors)
 
 
 class SyncState:
     """JSON-file persistence mapping product_id -> (spec_hash, resource_hash).
 
     Provides idempotency: products already synced are skipped on subsequent runs.
+    Entries may also carry spec/resource content fingerprints for delta syncs.
     """
 
     def __init__(self, path: Path) -> None:
@@ -59,11 +100,20 @@ class SyncState:
     def is_synced(self, product_id: int) -> bool:
         return str(product_id) in self._data
 
-    def record(self, product_id: int, spec_hash: str, resource_hash: str) -> None:
-        self._data[str(product_id)] = {
-            "spec_hash": spec_hash,
-            "resource_hash": resource_hash,
-        }
+    def record(
+        self,
+        product_id: int,
+        spec_hash: str,
+        resource_hash: str,
+        spec_fingerprint: str | None = None,
+        resource_fingerprint: str | None = None,
+    ) -> None:
+        entry = {"spec_hash": spec_hash, "resource_hash": resource_hash}
+        if spec_fingerprint is not None:
+            entry["spec_fingerprint"] = spec_fingerprint
+        if resource_fingerprint is not None:
+            entry["resource_fingerprint"] = resource_fingerprint
+        self._data[str(product_id)] = entry
 
     def get_entry(self, product_id: int) -> dict[str, str] | None:
         return self._data.get(str(product_id))
@@ -71,70 +121,407 @@ class SyncState:
     def as_dict(self) -> dict[str, Any]:
         return dict(self._data)
 
+    def iter_entries(self) -> Iterator[tuple[int, dict[str, str]]]:
+        """Yield (product_id, entry) pairs; entries may be re-recorded meanwhile."""
+        for key, entry in self._data.items():
+            yield int(key), entry
+
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+def open_sync_state(path: Path) -> SyncState | SqliteSyncState:
+    """Open the state backend matching the file suffix (SQLite for .db/.sqlite)."""
+    if path.suffix in SQLITE_SUFFIXES:
+        return SqliteSyncState(path)
+    return SyncState(path)
+
+
+_END = object()
+
+
+@dataclass
+class _ProducerFailure:
+    exc: BaseException
+
+
+def _prefetch(items: Iterable[T], size: int) -> Iterator[T]:
+    """Iterate `items` on a background thread, reading at most `size` ahead.
+
+    Lets the ERP fetch its next page while the gateway works on the current
+    one, without ever holding more than `size` products in the buffer.
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+    buffer: queue.Queue[object] = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(_END)
+        except BaseException as exc:
+            put(_ProducerFailure(exc))
+
+    threading.Thread(target=produce, name="sync-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _ProducerFailure):
+                raise item.exc
+            yield cast(T, item)
+    finally:
+        stop.set()
+
+
+@dataclass
+class _ProductJob:
+    """A product that needs gateway work, planned on the calling thread."""
+
+    product: MockProduct
+    spec_input: ResourceSpecificationInput
+    spec_fingerprint: str
+    resource_fingerprint: str
+    previous: dict[str, str] | None = None  # entry superseded by this job (delta mode)
+    reuse_spec: bool = False  # only the resource changed: keep previous spec_hash
+    retire_only: bool = False  # out of stock: retire the previous resource, create nothing
+
+
+@dataclass
+class _ProductOutcome:
+    """Gateway results for one job, produced by a (possibly pooled) worker."""
+
+    job: _ProductJob
+    spec_created: bool = False
+    spec_hash: str | None = None
+    resource_hash: str | None = None
+    retired: bool = False
+    error: str | None = None
+
 
 class NondominiumBridge:
     """Composes ERP client + gateway client + mapper into a sync pipeline."""
 
     def __init__(
         self,
-        erp_client: MockERPClient,
+        erp_client: MockERPClient | ERPLibreClient,
         gateway_client: HolochainGatewayClient,
         state_path: Path | None = None,
+        workers: int = 1,
+        prefetch: int = 1000,
     ) -> None:
         self.erp = erp_client
         self.gateway = gateway_client
-        self.state = SyncState(state_path or Path(".sync_state.json"))
+        self.state = open_sync_state(state_path or Path(".sync_state.json"))
+        self.workers = workers
+        self.prefetch = prefetch
 
-    def sync_inventory(self) -> SyncResult:
+    def sync_inventory(
+        self, workers: int | None = None, delta: bool = False, timeout: float | None = None
+    ) -> SyncResult:
         """Sync all available ERP products to Nondominium.
 
+        Products are streamed from the ERP client and held only while in
+        flight (the prefetch buffer plus 2 * workers), so memory stays flat
+        regardless of catalog size when paired with the SQLite state backend.
+
+        Args:
+            workers: Number of products published concurrently. Defaults to the
+                value given at construction; 1 syncs serially.
+            delta: Also propagate content changes of already-synced products,
+                detected by fingerprint (see module docstring). Entries recorded
+                before fingerprints existed are adopted as the baseline without
+                gateway calls.
+            timeout: Seconds the run may take. Products still in flight when it
+                runs out fail with DeadlineExceeded; later ones are not started
+                and an error notes the cut-off.
+
         Returns a SyncResult summarizing what happened.
         """
         result = SyncResult()
-        products = self.erp.get_available_products()
+        # Delta mode also needs the products that ran out of stock, to retire them.
+        products: Iterable[MockProduct] = self.erp.iter_products(available_only=not delta)
+        if self.prefetch > 0:
+            products = _prefetch(products, self.prefetch)
+        workers = self.workers if workers is None else workers
+        seen: set[int] = set()
+
+        try:
+            with deadline(timeout):
+                products = self._until_deadline(products, result)
+                if delta:
+                    products = self._remember_ids(products, seen)
+                if workers <= 1:
+                    for product in products:
+                        self._sync_product(product, result, delta)
+                else:
+                    self._sync_concurrently(products, workers, result, delta)
+                # Only a complete pass tells which synced products left the catalog.
+                if delta and not expired():
+                    self._retire_departed(seen, result)
+        finally:
+            # Products published before an ERP failure must not be created again.
+            self.state.save()
+        return result
 
+    @staticmethod
+    def _until_deadline(
+        products: Iterable[MockProduct], result: SyncResult
+    ) -> Iterator[MockProduct]:
         for product in products:
-            self._sync_product(product, result)
+            if expired():
+                result.errors.append("Sync deadline exceeded; remaining products not attempted")
+                return
+            yield product
 
-        self.state.save()
-        return result
+    @staticmethod
+    def _remember_ids(products: Iterable[MockProduct], seen: set[int]) -> Iterator[MockProduct]:
+        for product in products:
+            seen.add(product.id)
+            yield product
+
+    def _retire_departed(self, seen: set[int], result: SyncResult) -> None:
+        """Retire the live resources of synced products no longer in the ERP catalog."""
+        for product_id, entry in self.state.iter_entries():
+            if product_id in seen or not entry["resource_hash"]:
+                continue
+            try:
+                self._retire(entry["resource_hash"])
+            except GatewayError as exc:
+                error = (
+                    f"Product {product_id}: retiring resource {entry['resource_hash']} "
+                    f"of removed product failed: {exc}"
+                )
+                logger.error(error)
+                result.errors.append(error)
+                continue
+            logger.info("Retired resource of product %d, no longer in the catalog", product_id)
+            result.resources_retired += 1
+            result.withdrawn += 1
+            self.state.record(
+                product_id,
+                entry["spec_hash"],
+                "",
+                spec_fingerprint=entry.get("spec_fingerprint"),
+                resource_fingerprint=entry.get("resource_fingerprint"),
+            )
+
+    def _retire(self, resource_hash: str) -> None:
+        self.gateway.update_resource_state(
+            UpdateResourceStateInput(resource_hash=resource_hash, new_state=ResourceState.RETIRED)
+        )
+
+    def _sync_concurrently(
+        self, products: Iterable[MockProduct], workers: int, result: SyncResult, delta: bool
+    ) -> None:
+        """Publish products on a thread pool, applying outcomes in catalog order.
+
+        At most 2 * workers products are in flight, so a slow product holds
+        back result bookkeeping but never lets the backlog grow unbounded.
+        """
+        in_flight: set[int] = set()
+        pending: deque[Future[_ProductOutcome]] = deque()
+        publish = in_context(self._publish_product)  # workers see the run's deadline
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync") as pool:
+            try:
+                for product in products:
+                    if product.id in in_flight:
+                        # Duplicate id in the same run: the serial path would see it
+                        # as synced once the first copy is recorded.
+                        result.skipped += 1
+                        continue
+                    job = self._plan_product(product, result, delta)
+                    if job is None:
+                        continue
+                    in_flight.add(product.id)
+                    pending.append(pool.submit(publish, job))
+                    if len(pending) >= 2 * workers:
+                        self._apply_next(pending, in_flight, result)
+            finally:
+                # Record what was already published, even if the ERP stream failed.
+                while pending:
+                    self._apply_next(pending, in_flight, result)
+
+    def _apply_next(
+        self, pending: deque[Future[_ProductOutcome]], in_flight: set[int], result: SyncResult
+    ) -> None:
+        outcome = pending.popleft().result()
+        # Once recorded, later duplicates are caught by the state lookup instead.
+        in_flight.discard(outcome.job.product.id)
+        self._apply_outcome(outcome, result)
 
-    def _sync_product(self, product: MockProduct, result: SyncResult) -> None:
+    def _sync_product(self, product: MockProduct, result: SyncResult, delta: bool) -> None:
         """Sync a single product. Updates result in-place."""
-        if self.state.is_synced(product.id):
+        job = self._plan_product(product, result, delta)
+        if job is not None:
+            self._apply_outcome(self._publish_product(job), result)
+
+    def _plan_product(
+        self, product: MockProduct, result: SyncResult, delta: bool
+    ) -> _ProductJob | None:
+        """Decide what gateway work a product needs; None means skip."""
+        entry = self.state.get_entry(product.id)
+        if entry is not None and not delta:
             logger.info("Skipping already-synced product %d: %s", product.id, product.name)
             result.skipped += 1
-            return
+            return None
 
-        # Create ResourceSpecification
         spec_input = product_to_resource_spec(product)
-        try:
-            spec_output = self.gateway.create_resource_specification(spec_input)
-        except GatewayError as exc:
-            msg = f"Product {product.id} ({product.name}): spec creation failed: {exc}"
-            logger.error(msg)
-            result.errors.append(msg)
-            return
+        job = _ProductJob(
+            product=product,
+            spec_input=spec_input,
+            spec_fingerprint=spec_fingerprint(spec_input),
+            resource_fingerprint=resource_fingerprint(
+                product_to_economic_resource(product, entry["spec_hash"] if entry else "")
+            ),
+        )
+        withdrawn = not entry["resource_hash"] if entry is not None else False
+        if product.qty_available <= 0:
+            # Only seen in delta mode: withdraw the resource of a product out of stock.
+            if entry is None:
+                return None
+            if withdrawn:
+                result.skipped += 1
+                return None
+            logger.info("Product %d (%s) is out of stock", product.id, product.name)
+            job.previous = entry
+            job.retire_only = True
+            return job
+        if entry is None:
+            return job
+
+        old_spec_fp = entry.get("spec_fingerprint")
+        old_resource_fp = entry.get("resource_fingerprint")
+        if withdrawn:
+            # Back in stock: a new resource, under the existing spec if unchanged.
+            logger.info("Product %d (%s) is back in stock", product.id, product.name)
+            job.previous = entry  # its resource_hash is empty: nothing to retire
+            job.reuse_spec = old_spec_fp == job.spec_fingerprint
+            return job
+        if old_spec_fp is None or old_resource_fp is None:
+            logger.info("Recording baseline fingerprint for product %d", product.id)
+            self._record(product.id, entry["spec_hash"], entry["resource_hash"], job)
+            result.skipped += 1
+            return None
+        if old_spec_fp == job.spec_fingerprint and old_resource_fp == job.resource_fingerprint:
+            result.skipped += 1
+            return None
+
+        logger.info("Product %d (%s) changed since last sync", product.id, product.name)
+        job.previous = entry
+        job.reuse_spec = old_spec_fp == job.spec_fingerprint
+        return job
 
-        result.specs_created += 1
-        spec_hash = spec_output.spec_hash
+    def _publish_product(self, job: _ProductJob) -> _ProductOutcome:
+        """Create spec (unless reused) then resource, then retire the superseded one.
+
+        Touches only the gateway, so it is safe to run on a worker thread.
+        """
+        product = job.product
+        outcome = _ProductOutcome(job)
+
+        if job.retire_only and job.previous is not None:
+            outcome.spec_hash = job.previous["spec_hash"]
+            try:
+                self._retire(job.previous["resource_hash"])
+            except GatewayError as exc:
+                outcome.error = (
+                    f"Product {product.id} ({product.name}): retiring out-of-stock resource "
+                    f"{job.previous['resource_hash']} failed: {exc}"
+                )
+                return outcome
+            outcome.retired = True
+            return outcome
+
+        if job.reuse_spec and job.previous is not None:
+            outcome.spec_hash = job.previous["spec_hash"]
+        else:
+            # Create ResourceSpecification
+            try:
+                spec_output = self.gateway.create_resource_specification(job.spec_input)
+            except GatewayError as exc:
+                outcome.error = (
+                    f"Product {product.id} ({product.name}): spec creation failed: {exc}"
+                )
+                return outcome
+            outcome.spec_created = True
+            outcome.spec_hash = spec_output.spec_hash
 
         # Create EconomicResource linked to the spec
-        resource_input = product_to_economic_resource(product, spec_hash)
+        resource_input = product_to_economic_resource(product, outcome.spec_hash)
         try:
             resource_output = self.gateway.create_economic_resource(resource_input)
         except GatewayError as exc:
-            msg = f"Product {product.id} ({product.name}): resource creation failed: {exc}"
-            logger.error(msg)
-            result.errors.append(msg)
-            return
-
-        result.resources_created += 1
-        self.state.record(product.id, spec_hash, resource_output.resource_hash)
-        logger.info(
-            "Synced product %d (%s): spec=%s resource=%s",
-            product.id,
-            product.name,
+            outcome.error = (
+                f"Product {product.id} ({product.name}): resource creation failed: {exc}"
+            )
+            return outcome
+        outcome.resource_hash = resource_output.resource_hash
+
+        # Retire the resource this one supersedes (delta mode)
+        if job.previous is not None and job.previous["resource_hash"]:
+            try:
+                self._retire(job.previous["resource_hash"])
+                outcome.retired = True
+            except GatewayError as exc:
+                outcome.error = (
+                    f"Product {product.id} ({product.name}): retiring superseded resource "
+                    f"{job.previous['resource_hash']} failed: {exc}"
+                )
+        return outcome
+
+    def _apply_outcome(self, outcome: _ProductOutcome, result: SyncResult) -> None:
+        """Fold one product's outcome into result and state (calling thread only)."""
+        job = outcome.job
+        product = job.product
+        if job.retire_only:
+            if outcome.retired and outcome.spec_hash is not None:
+                result.resources_retired += 1
+                result.withdrawn += 1
+                # Empty resource_hash: nothing live until the product is back in stock.
+                self._record(product.id, outcome.spec_hash, "", job)
+        if outcome.spec_created:
+            result.specs_created += 1
+        if outcome.resource_hash is not None and outcome.spec_hash is not None:
+            result.resources_created += 1
+            if job.reuse_spec:
+                result.updated += 1
+            if outcome.retired:
+                result.resources_retired += 1
+            # Record even if retiring failed: the new resource exists and must
+            # not be created again on the next run.
+            self._record(product.id, outcome.spec_hash, outcome.resource_hash, job)
+            logger.info(
+                "Synced product %d (%s): spec=%s resource=%s",
+                product.id,
+                product.name,
+                outcome.spec_hash,
+                outcome.resource_hash,
+            )
+        if outcome.error is not None:
+            logger.error(outcome.error)
+            result.errors.append(outcome.error)
+
+    def _record(
+        self, product_id: int, spec_hash: str, resource_hash: str, job: _ProductJob
+    ) -> None:
+        self.state.record(
+            product_id,
             spec_hash,
-            resource_output.resource_hash,
+            resource_hash,
+            spec_fingerprint=job.spec_fingerprint,
+            resource_fingerprint=job.resource_fingerprint,
         )
@@ -0,0 +1,213 @@
+"""Client-side rate limiting and adaptive concurrency control.
+
+Both gateway clients accept a RateLimiter and an AdaptiveConcurrencyLimiter:
+
+    client = HolochainGatewayClient(
+        config,
+        rate_limiter=RateLimiter(rate=50.0),
+        concurrency_limiter=AdaptiveConcurrencyLimiter(),
+    )
+
+Rate limiting: every (zome, fn) pair gets its own token bucket refilling
+at `rate` calls per second (per-function overrides in `rates`), holding up
+to `burst` tokens. A call over the rate is delayed until its token is due,
+not rejected; reservations are handed out in order, so a backlog drains at
+exactly the configured rate.
+
+Adaptive concurrency (AIMD): at most `limit` gateway requests are in
+flight at once; further calls wait for a slot. Each request completing in
+under `latency_target` seconds widens the window by 1/limit (about one
+slot per window of successes), as long as the window was in use. A timeout,
+transport error, 429 or 5xx, or a request slower than `latency_target`,
+multiplies the limit by `backoff`. Only requests started after the last
+decrease can shrink it again, so a burst of failures from one overloaded
+window counts once. Bulk jobs can then run with generous worker counts and
+settle at the highest concurrency the gateway sustains.
+
+Both apply per attempt: retries and pool failovers wait for a token and
+a slot like any other request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+
+@dataclass
+class _Bucket:
+    rate: float
+    burst: float
+    tokens: float
+    updated: float
+
+
+class RateLimiter:
+    """Token bucket per (zome, fn), shared by all calls of a client.
+
+    Args:
+        rate: Calls per second allowed for each zome function.
+        burst: Calls that may go out back to back after an idle period
+            (defaults to max(1, rate)).
+        rates: Per-function overrides of `rate`, keyed by fn name.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        rates: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or any(r <= 0 for r in (rates or {}).values()):
+            raise ValueError("Rates must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+
+    def reserve(self, zome: str, fn_name: str) -> float:
+        """Take a token for one call; returns the seconds to wait before sending.
+
+        The token is consumed even if the caller then gives up waiting.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get((zome, fn_name))
+            if bucket is None:
+                rate = self.rates.get(fn_name, self.rate)
+                burst = self.burst if self.burst is not None else max(1.0, rate)
+                bucket = self._buckets[(zome, fn_name)] = _Bucket(rate, burst, burst, now)
+            bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            bucket.tokens -= 1.0
+            return 0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on the gateway requests in flight, shared by all calls of a client.
+
+    Threads wait in acquire(), coroutines in acquire_async(); each returns a
+    ticket to hand back to release() (or discard() for an abandoned request).
+
+    Args:
+        initial_limit: Starting window.
+        min_limit: The window never shrinks below this.
+        max_limit: The window never grows beyond this.
+        latency_target: Requests slower than this (seconds) count as overload.
+        backoff: Factor applied to the window on overload.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_target: float = 2.0,
+        backoff: float = 0.7,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current window: requests allowed in flight at once."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, timeout: float | None = None) -> float:
+        """Block until a slot is free and take it; TimeoutError after `timeout` seconds."""
+        with self._slot_freed:
+            if not self._slot_freed.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                raise TimeoutError(f"No concurrency slot freed within {timeout:.2f}s")
+            self._in_flight += 1
+            return self._clock()
+
+    async def acquire_async(self, timeout: float | None = None) -> float:
+        """Wait (without blocking the event loop) until a slot is free and take it.
+
+        Raises TimeoutError when no slot is granted within `timeout` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < int(self._limit) and not self._async_waiters:
+                self._in_flight += 1
+                return self._clock()
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._async_waiters.append((loop, waiter))
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError) as exc:
+            with self._lock:
+                if (loop, waiter) in self._async_waiters:
+                    self._async_waiters.remove((loop, waiter))
+                elif waiter.done() and not waiter.cancelled():
+                    # Granted just before the cancellation landed: hand it back.
+                    # (Granted but not yet delivered: _grant sees the cancelled waiter.)
+                    self._free_slot()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            raise TimeoutError(f"No concurrency slot granted within {timeout:.2f}s") from None
+        return self._clock()
+
+    def release(self, ticket: float, overloaded: bool = False) -> None:
+        """Free the slot taken at `ticket` and adjust the window from the outcome."""
+        with self._lock:
+            now = self._clock()
+            if overloaded or now - ticket > self.latency_target:
+                if ticket >= self._last_decrease:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    self._last_decrease = now
+            elif self._in_flight * 2 >= self._limit:
+                # Only grow a window that is actually in use.
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            self._free_slot()
+
+    def discard(self) -> None:
+        """Free a slot without feedback (the request was abandoned)."""
+        with self._lock:
+            self._free_slot()
+
+    @staticmethod
+    def counts_as_overload(status_code: int | None) -> bool:
+        """Transport errors (incl. timeouts), 429 and 5xx mean the gateway is saturated."""
+        return status_code is None or status_code == 429 or status_code >= 500
+
+    def _free_slot(self) -> None:
+        # Called with the lock held.
+        self._in_flight -= 1
+        while self._async_waiters and self._in_flight < int(self._limit):
+            loop, waiter = self._async_waiters.popleft()
+            self._in_flight += 1
+            loop.call_soon_threadsafe(self._grant, waiter)
+        self._slot_freed.notify_all()
+
+    def _grant(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.cancelled():
+            with self._lock:
+                self._free_slot()
+        else:
+            waiter.set_result(None)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from bridge.deadline import deadline
 from bridge.gateway_client import HolochainGatewayClient
 from bridge.models import (
     LogEconomicEventInput,
@@ -106,6 +107,7 @@ class UseProcess:
         generate_pprs: bool = True,
         commitment_note: str | None = None,
         event_note: str | None = None,
+        timeout: float | None = None,
     ) -> UseProcessResult:
         """Execute the full Use process: propose commitment then log event.
 
@@ -118,28 +120,32 @@ class UseProcess:
             generate_pprs: Whether to auto-generate PPR claims.
             commitment_note: Optional note for the commitment.
             event_note: Optional note for the economic event.
+            timeout: Seconds the whole process may take; both calls share
+                this budget (see bridge.deadline).
 
         Returns:
             UseProcessResult containing both commitment and event outputs.
 
         Raises:
-            GatewayError: If any gateway call fails.
+            GatewayError: If any gateway call fails (DeadlineExceeded when
+                the budget runs out).
         """
-        commitment = self.request_use(
-            resource_hash=resource_hash,
-            provider=provider,
-            due_date=due_date,
-            note=commitment_note,
-        )
-
-        event = self.record_use_event(
-            resource_hash=resource_hash,
-            provider=provider,
-            receiver=receiver,
-            quantity=quantity,
-            commitment_hash=commitment.commitment_hash,
-            generate_pprs=generate_pprs,
-            note=event_note,
-        )
+        with deadline(timeout):
+            commitment = self.request_use(
+                resource_hash=resource_hash,
+                provider=provider,
+                due_date=due_date,
+                note=commitment_note,
+            )
+
+            event = self.record_use_event(
+                resource_hash=resource_hash,
+                provider=provider,
+                receiver=receiver,
+                quantity=quantity,
+                commitment_hash=commitment.commitment_hash,
+                generate_pprs=generate_pprs,
+                note=event_note,
+            )
 
         return UseProcessResult(commitment=commitment, event=event)
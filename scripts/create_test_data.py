@@ -5,15 +5,19 @@ Usage:
     1. Start the conductor + gateway (see scripts/setup_conductor.sh)
     2. Set HC_DNA_HASH in .env
     3. python scripts/create_test_data.py
+
+Specs and resources are each created in one bulk pass; set BULK_CONCURRENCY
+to change how many calls are in flight at once (default 16).
 """
 
 from __future__ import annotations
 
+import os
 import sys
 
 from bridge.config import GatewayConfig
 from bridge.erp_mock import MockERPClient
-from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.gateway_client import HolochainGatewayClient
 from bridge.mapper import product_to_economic_resource, product_to_resource_spec
 
 
@@ -25,35 +29,44 @@ def main() -> int:
 
     client = HolochainGatewayClient(config)
     erp = MockERPClient()
+    products = erp.get_available_products()
+    concurrency = int(os.getenv("BULK_CONCURRENCY", "16"))
 
     print(f"Gateway: {config.url}")
-    print(f"Creating resources from {len(erp.get_available_products())} mock ERP products...")
+    print(f"Creating resources from {len(products)} mock ERP products...")
     print()
 
-    for product in erp.get_available_products():
-        print(f"  Product: {product.name}")
+    # 1. Create all ResourceSpecifications
+    spec_results = client.create_resource_specifications_bulk(
+        (product_to_resource_spec(p) for p in products), concurrency=concurrency
+    )
 
-        # 1. Create ResourceSpecification
-        spec_input = product_to_resource_spec(product)
-        try:
-            spec_result = client.create_resource_specification(spec_input)
-            print(f"    Spec created:     {spec_result.spec_hash}")
-        except GatewayError as e:
-            print(f"    ERROR creating spec: {e}")
-            continue
+    # 2. Create an EconomicResource for every product whose spec was created
+    published = [
+        (product, r.output.spec_hash)
+        for product, r in zip(products, spec_results)
+        if r.output is not None
+    ]
+    resource_results = client.create_economic_resources_bulk(
+        (product_to_economic_resource(product, spec_hash) for product, spec_hash in published),
+        concurrency=concurrency,
+    )
+    resources = {product.id: r for (product, _), r in zip(published, resource_results)}
 
-        # 2. Create EconomicResource linked to the spec
-        resource_input = product_to_economic_resource(product, spec_result.spec_hash)
-        try:
-            resource_result = client.create_economic_resource(resource_input)
-            print(f"    Resource created: {resource_result.resource_hash}")
-            print(
-                f"    Quantity: {resource_result.resource.quantity} {resource_result.resource.unit}"
-            )
-        except GatewayError as e:
-            print(f"    ERROR creating resource: {e}")
+    for product, spec_result in zip(products, spec_results):
+        print(f"  Product: {product.name}")
+        if spec_result.output is None:
+            print(f"    ERROR creating spec: {spec_result.error}")
             continue
+        print(f"    Spec created:     {spec_result.output.spec_hash}")
 
+        resource_result = resources[product.id]
+        if resource_result.output is None:
+            print(f"    ERROR creating resource: {resource_result.error}")
+            continue
+        resource = resource_result.output
+        print(f"    Resource created: {resource.resource_hash}")
+        print(f"    Quantity: {resource.resource.quantity} {resource.resource.unit}")
         print()
 
     print("Done!")
@@ -202,10 +202,7 @@ def main() -> None:
     print("\nQuerying all economic events...")
     try:
         events = client.get_all_economic_events()
-        if isinstance(events, list):
-            print(f"  Total events: {len(events)}")
-        else:
-            print(f"  Events: {events}")
+        print(f"  Total events: {len(events)}")
     except GatewayError as e:
         print(f"  Query failed: {e}")
 
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Migrate a JSON sync state file to the SQLite backend.
+
+Usage:
+    python scripts/migrate_sync_state.py [.sync_state.json] [.sync_state.db]
+
+Afterwards pass the .db path as NondominiumBridge(state_path=...) to use it.
+The JSON file is left in place.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from bridge.sqlite_state import migrate_json_state
+
+
+def main() -> int:
+    json_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".sync_state.json")
+    db_path = Path(sys.argv[2] if len(sys.argv) > 2 else json_path.with_suffix(".db"))
+
+    if not json_path.exists():
+        print(f"ERROR: {json_path} not found")
+        return 1
+
+    count = migrate_json_state(json_path, db_path)
+    print(f"Migrated {count} entries: {json_path} -> {db_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
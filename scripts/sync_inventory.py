@@ -5,17 +5,33 @@ Usage:
     1. Start the conductor + gateway (see scripts/setup_conductor.sh)
     2. Set HC_DNA_HASH in .env
     3. python scripts/sync_inventory.py
+
+Set SYNC_WORKERS to publish several products concurrently (default 1); the
+gateway client adapts how many of those calls are in flight to what the
+gateway sustains. Set GATEWAY_RATE_LIMIT to cap calls per second per zome
+function, and SYNC_TIMEOUT to bound the whole run in seconds (products not
+started in time are left for the next run).
+Set ERP_DB (and ERP_URL/ERP_USERNAME/ERP_PASSWORD) to read from ERPLibre
+instead of the mock catalog, or SYNTHETIC_CATALOG_SIZE to load-test with a
+generated catalog of that many products (seeded by SYNTHETIC_CATALOG_SEED).
+Set METRICS_PATH to write per-function gateway metrics in Prometheus text
+format when the run finishes.
 """
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
-from bridge.config import GatewayConfig
+from bridge.config import ERPConfig, GatewayConfig
 from bridge.erp_mock import MockERPClient
+from bridge.erplibre_client import ERPLibreClient
 from bridge.gateway_client import HolochainGatewayClient
+from bridge.metrics import MetricsRegistry
+from bridge.resilience import CircuitBreaker, RetryPolicy
 from bridge.sync import NondominiumBridge
+from bridge.throttle import AdaptiveConcurrencyLimiter, RateLimiter
 
 
 def main() -> int:
@@ -24,19 +40,42 @@ def main() -> int:
         print("ERROR: HC_DNA_HASH not set. Run setup_conductor.sh and set it in .env")
         return 1
 
-    gateway = HolochainGatewayClient(config)
-    erp = MockERPClient()
+    # Ride out brief conductor hiccups; stop hammering a gateway that is down,
+    # and back off before an overloaded one starts failing.
+    metrics = MetricsRegistry()
+    rate_limit = os.getenv("GATEWAY_RATE_LIMIT")
+    gateway = HolochainGatewayClient(
+        config,
+        retry_policy=RetryPolicy(),
+        circuit_breaker=CircuitBreaker(),
+        metrics=metrics,
+        rate_limiter=RateLimiter(float(rate_limit)) if rate_limit else None,
+        concurrency_limiter=AdaptiveConcurrencyLimiter(),
+    )
+    erp_config = ERPConfig.from_env()
+    erp: ERPLibreClient | MockERPClient
+    if erp_config.db:
+        erp = ERPLibreClient(erp_config)
+    elif os.getenv("SYNTHETIC_CATALOG_SIZE"):
+        erp = MockERPClient.synthetic(
+            int(os.environ["SYNTHETIC_CATALOG_SIZE"]),
+            seed=int(os.getenv("SYNTHETIC_CATALOG_SEED", "0")),
+        )
+    else:
+        erp = MockERPClient()
     bridge = NondominiumBridge(
         erp_client=erp,
         gateway_client=gateway,
         state_path=Path(".sync_state.json"),
+        workers=int(os.getenv("SYNC_WORKERS", "1")),
     )
 
     print(f"Gateway: {config.url}")
-    print(f"Products available: {len(erp.get_available_products())}")
+    print("Streaming available products from ERP...")
     print()
 
-    result = bridge.sync_inventory()
+    sync_timeout = os.getenv("SYNC_TIMEOUT")
+    result = bridge.sync_inventory(timeout=float(sync_timeout) if sync_timeout else None)
 
     print(f"Specs created:     {result.specs_created}")
     print(f"Resources created: {result.resources_created}")
@@ -48,6 +87,17 @@ def main() -> int:
     else:
         print("Errors:            0")
 
+    print()
+    print(f"{'Gateway function':<32} {'calls':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for (_, fn_name), stats in metrics.snapshot().items():
+        print(
+            f"{fn_name:<32} {stats.calls:>6} {stats.error_count:>6} "
+            f"{stats.p50 * 1000:>8.1f} {stats.p95 * 1000:>8.1f}"
+        )
+    metrics_path = os.getenv("METRICS_PATH")
+    if metrics_path:
+        Path(metrics_path).write_text(metrics.to_prometheus())
+
     print()
     print("Done!")
     return 1 if result.errors else 0
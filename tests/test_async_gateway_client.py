@@ -0,0 +1,173 @@
+"""Tests for AsyncHolochainGatewayClient using pytest-httpserver mock."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.models import (
+    CreateResourceSpecificationOutput,
+    EconomicResourceInput,
+    ResourceSpecificationInput,
+    ResourceState,
+    VfAction,
+)
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+ZOME_GOV = "zome_gouvernance"
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"),
+        timeout=5,
+        app_id=APP_ID,
+        dna_hash=DNA_HASH,
+        max_connections=8,
+    )
+
+
+def _zome_path(fn_name: str, zome: str = ZOME) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{zome}/{fn_name}"
+
+
+SPEC_RESPONSE = {
+    "spec_hash": "uhCkkABC",
+    "spec": {
+        "name": "Printer",
+        "description": "3D printer",
+        "category": "equipment",
+        "image_url": None,
+        "tags": ["fab-lab"],
+        "is_active": True,
+    },
+    "governance_rule_hashes": [],
+}
+
+
+class TestMethodParity:
+    def test_every_sync_method_has_async_twin(self):
+        sync_methods = {
+            name
+            for name, fn in inspect.getmembers(HolochainGatewayClient, inspect.isfunction)
+            if not name.startswith("_")
+        }
+        for name in sync_methods:
+            twin = getattr(AsyncHolochainGatewayClient, name, None)
+            assert twin is not None, f"missing async twin for {name}"
+            assert inspect.iscoroutinefunction(twin), f"{name} is not async"
+
+    def test_return_annotations_match(self):
+        for name, fn in inspect.getmembers(HolochainGatewayClient, inspect.isfunction):
+            if name.startswith("_"):
+                continue
+            twin = getattr(AsyncHolochainGatewayClient, name)
+            assert fn.__annotations__.get("return") == twin.__annotations__.get("return"), name
+
+
+class TestAsyncCalls:
+    def test_create_resource_specification(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("create_resource_specification"),
+        ).respond_with_json(SPEC_RESPONSE)
+
+        async def run() -> CreateResourceSpecificationOutput:
+            async with AsyncHolochainGatewayClient(config) as client:
+                return await client.create_resource_specification(
+                    ResourceSpecificationInput(
+                        name="Printer", description="3D printer", category="equipment"
+                    )
+                )
+
+        result = asyncio.run(run())
+        assert result.spec_hash == "uhCkkABC"
+        assert result.spec.category == "equipment"
+        assert "payload=" in httpserver.log[0][0].url
+
+    def test_unit_function_omits_payload(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_commitments", ZOME_GOV),
+        ).respond_with_json(
+            [
+                {
+                    "action": "Use",
+                    "provider": "uhCAkProvider",
+                    "receiver": "uhCAkReceiver",
+                    "due_date": 1,
+                    "committed_at": 1,
+                }
+            ]
+        )
+
+        async def run() -> list:
+            async with AsyncHolochainGatewayClient(config) as client:
+                return await client.get_all_commitments()
+
+        result = asyncio.run(run())
+        assert result[0].action == VfAction.USE
+        assert "payload" not in httpserver.log[0][0].url
+
+    def test_many_calls_in_flight(self, httpserver: HTTPServer, config: GatewayConfig):
+        """More concurrent calls than pooled connections all complete."""
+        httpserver.expect_request(
+            _zome_path("create_economic_resource"),
+        ).respond_with_json(
+            {
+                "resource_hash": "uhCkkRES",
+                "resource": {
+                    "quantity": 2.0,
+                    "unit": "unit",
+                    "custodian": "uhCAkAgent",
+                    "state": "PendingValidation",
+                },
+            }
+        )
+
+        async def run() -> list:
+            async with AsyncHolochainGatewayClient(config) as client:
+                return await asyncio.gather(
+                    *(
+                        client.create_economic_resource(
+                            EconomicResourceInput(spec_hash="uhCkkSpec", quantity=i, unit="unit")
+                        )
+                        for i in range(40)
+                    )
+                )
+
+        results = asyncio.run(run())
+        assert len(results) == 40
+        assert all(r.resource.state == ResourceState.PENDING_VALIDATION for r in results)
+        assert len(httpserver.log) == 40
+
+
+class TestAsyncErrorHandling:
+    def test_http_error_raises_gateway_error(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_resource_specifications"),
+        ).respond_with_data("Internal Server Error", status=500)
+
+        async def run() -> None:
+            async with AsyncHolochainGatewayClient(config) as client:
+                await client.get_all_resource_specifications()
+
+        with pytest.raises(GatewayError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 500
+
+    def test_connection_error_raises_gateway_error(self):
+        config = GatewayConfig(url="http://127.0.0.1:1", timeout=1, dna_hash=DNA_HASH)
+
+        async def run() -> bool:
+            async with AsyncHolochainGatewayClient(config) as client:
+                return await client.health_check()
+
+        assert asyncio.run(run()) is False
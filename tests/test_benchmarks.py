@@ -0,0 +1,70 @@
+"""Smoke tests for the benchmark harness and its fake hc-http-gw."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.fake_gateway import FakeGateway
+from benchmarks.run import build_report, parse_args
+from benchmarks.suite import SuiteConfig, run_suite
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.models import EconomicResourceInput, ResourceSpecificationInput
+
+
+class TestFakeGateway:
+    def test_round_trip_through_client(self):
+        with FakeGateway() as gateway:
+            client = HolochainGatewayClient(gateway.config())
+            spec = client.create_resource_specification(
+                ResourceSpecificationInput(name="Drill", description="d", category="tool")
+            )
+            resource = client.create_economic_resource(
+                EconomicResourceInput(spec_hash=spec.spec_hash, quantity=2, unit="unit")
+            )
+
+            assert client.get_latest_resource_specification(spec.spec_hash).name == "Drill"
+            assert client.get_latest_economic_resource(resource.resource_hash).quantity == 2
+            assert len(client.get_resources_by_specification(spec.spec_hash)) == 1
+            assert len(client.get_resource_specifications_by_category("tool")) == 1
+            assert gateway.requests == 6
+
+    def test_injected_errors(self):
+        with FakeGateway(error_rate=1.0, error_status=503) as gateway:
+            with pytest.raises(GatewayError) as exc_info:
+                HolochainGatewayClient(gateway.config()).get_all_economic_resources()
+            assert exc_info.value.status_code == 503
+            assert gateway.injected_errors == 1
+
+    def test_unknown_record_is_zome_error(self):
+        with FakeGateway() as gateway:
+            with pytest.raises(GatewayError) as exc_info:
+                HolochainGatewayClient(gateway.config()).get_latest_economic_resource(
+                    "uhCkk" + "A" * 48
+                )
+            assert exc_info.value.status_code == 500
+
+
+class TestSuite:
+    def test_small_run_is_json_serializable(self):
+        config = SuiteConfig(sizes=(30,), workers=2)
+        results = run_suite(config)
+
+        by_name = {r["benchmark"]: r for r in results}
+        assert set(by_name) == {"sync", "discovery", "validation", "encoding", "responses"}
+        assert by_name["sync"]["errors"] == 0
+        assert by_name["sync"]["resources_created"] == by_name["discovery"]["specs_indexed"]
+        assert by_name["encoding"]["encode_resource"]["us_per_item"] > 0
+        json.dumps(build_report(config, results))
+
+    def test_gateway_benchmarks_capped(self):
+        results = run_suite(SuiteConfig(sizes=(50,), benchmarks=("sync",), sync_max=10))
+        assert results[0]["size"] == 10
+        assert results[0]["requested_size"] == 50
+
+    def test_cli_args(self):
+        config, output = parse_args(["--sizes", "10,20", "--latency-ms", "5", "--output", "x"])
+        assert config.sizes == (10, 20)
+        assert config.latency == 0.005
+        assert output is not None and output.name == "x"
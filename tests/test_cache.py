@@ -0,0 +1,241 @@
+"""Tests for the read-only response cache and its use in the gateway clients."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.cache import ResponseCache
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.models import (
+    ResourceSpecificationInput,
+    ResourceState,
+    TransferCustodyInput,
+    UpdateResourceStateInput,
+)
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+
+RESOURCE = {
+    "quantity": 2.0,
+    "unit": "unit",
+    "custodian": "uhCAkAgent",
+    "current_location": None,
+    "state": "Active",
+}
+SPEC = {
+    "name": "Prusa MK4",
+    "description": "3D printer",
+    "category": "equipment",
+    "image_url": None,
+    "tags": [],
+    "is_active": True,
+}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+def _requests_to(httpserver: HTTPServer, fn_name: str) -> int:
+    return sum(1 for req, _ in httpserver.log if req.path == _zome_path(fn_name))
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"),
+        timeout=5,
+        app_id=APP_ID,
+        dna_hash=DNA_HASH,
+    )
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def cache(clock: FakeClock) -> ResponseCache:
+    return ResponseCache(clock=clock)
+
+
+@pytest.fixture()
+def client(config: GatewayConfig, cache: ResponseCache) -> HolochainGatewayClient:
+    return HolochainGatewayClient(config, cache=cache)
+
+
+class TestResponseCache:
+    def test_ttl_expiry(self, cache: ResponseCache, clock: FakeClock):
+        key = (ZOME, "get_all_economic_resources", None)
+        cache.put(key, {"resources": []})
+        assert cache.get(key) == (True, {"resources": []})
+
+        clock.now += cache.ttls["get_all_economic_resources"]
+        assert cache.get(key) == (False, None)
+        assert cache.stats().size == 0
+
+    def test_lru_eviction(self, clock: FakeClock):
+        cache = ResponseCache(max_entries=2, clock=clock)
+        a, b, c = ((ZOME, "get_latest_economic_resource", p) for p in "abc")
+        cache.put(a, 1)
+        cache.put(b, 2)
+        cache.get(a)  # a is now most recently used
+        cache.put(c, 3)
+        assert cache.get(b) == (False, None)
+        assert cache.get(a) == (True, 1)
+        assert cache.stats().evictions == 1
+
+    def test_ttl_overrides_and_uncached_functions(self, clock: FakeClock):
+        cache = ResponseCache(ttls={"get_all_commitments": 0}, clock=clock)
+        assert not cache.cacheable("get_all_commitments")
+        assert not cache.cacheable("create_economic_resource")
+        cache.put(("zome_gouvernance", "get_all_commitments", None), [])
+        assert cache.stats().size == 0
+
+    def test_put_skipped_after_concurrent_invalidation(self, cache: ResponseCache):
+        key = (ZOME, "get_all_economic_resources", None)
+        generation = cache.generation  # read starts
+        cache.invalidate("get_all_economic_resources")  # a write lands meanwhile
+        cache.put(key, {"resources": []}, generation)
+        assert cache.get(key) == (False, None)
+
+    def test_stats(self, cache: ResponseCache):
+        key = (ZOME, "get_all_resource_specifications", None)
+        cache.get(key)
+        cache.put(key, {})
+        cache.get(key)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_ratio == 0.5
+
+
+class TestCachedClient:
+    def test_repeated_read_served_from_cache(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, cache: ResponseCache
+    ):
+        httpserver.expect_request(
+            _zome_path("get_all_resource_specifications"),
+        ).respond_with_json({"specifications": [SPEC]})
+
+        for _ in range(3):
+            assert client.get_all_resource_specifications().specifications[0].name == "Prusa MK4"
+        assert _requests_to(httpserver, "get_all_resource_specifications") == 1
+        assert cache.stats().hits == 2
+
+    def test_payload_is_part_of_key(self, httpserver: HTTPServer, client: HolochainGatewayClient):
+        httpserver.expect_request(
+            _zome_path("get_resource_specifications_by_category"),
+        ).respond_with_json([SPEC])
+
+        client.get_resource_specifications_by_category("equipment")
+        client.get_resource_specifications_by_category("tools")
+        client.get_resource_specifications_by_category("equipment")
+        assert _requests_to(httpserver, "get_resource_specifications_by_category") == 2
+
+    def test_expired_entry_refetched(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, clock: FakeClock
+    ):
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_json({"resources": [RESOURCE]})
+
+        client.get_all_economic_resources()
+        clock.now += 60
+        client.get_all_economic_resources()
+        assert _requests_to(httpserver, "get_all_economic_resources") == 2
+
+    def test_create_invalidates_listings(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        httpserver.expect_request(
+            _zome_path("get_all_resource_specifications"),
+        ).respond_with_json({"specifications": []})
+        httpserver.expect_request(
+            _zome_path("create_resource_specification"),
+        ).respond_with_json({"spec_hash": "uhCkkNew", "spec": SPEC, "governance_rule_hashes": []})
+
+        client.get_all_resource_specifications()
+        client.create_resource_specification(
+            ResourceSpecificationInput(name="Prusa MK4", description="", category="equipment")
+        )
+        client.get_all_resource_specifications()
+        assert _requests_to(httpserver, "get_all_resource_specifications") == 2
+
+    def test_state_update_invalidates_only_that_resource(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        httpserver.expect_request(
+            _zome_path("get_latest_economic_resource"),
+        ).respond_with_json(RESOURCE)
+        httpserver.expect_request(
+            _zome_path("update_resource_state"),
+        ).respond_with_json(None)
+
+        client.get_latest_economic_resource("uhCkkResA")
+        client.get_latest_economic_resource("uhCkkResB")
+        client.update_resource_state(
+            UpdateResourceStateInput(resource_hash="uhCkkResA", new_state=ResourceState.RETIRED)
+        )
+        client.get_latest_economic_resource("uhCkkResA")
+        client.get_latest_economic_resource("uhCkkResB")
+        assert _requests_to(httpserver, "get_latest_economic_resource") == 3
+
+    def test_failed_write_still_invalidates(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        httpserver.expect_request(
+            _zome_path("get_latest_economic_resource"),
+        ).respond_with_json(RESOURCE)
+        httpserver.expect_request(
+            _zome_path("transfer_custody"),
+        ).respond_with_data("timeout", status=504)
+
+        client.get_latest_economic_resource("uhCkkResA")
+        with pytest.raises(GatewayError):
+            client.transfer_custody(
+                TransferCustodyInput(resource_hash="uhCkkResA", new_custodian="uhCAkOtherAgent")
+            )
+        client.get_latest_economic_resource("uhCkkResA")
+        assert _requests_to(httpserver, "get_latest_economic_resource") == 2
+
+    def test_errors_not_cached(self, httpserver: HTTPServer, client: HolochainGatewayClient):
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Internal Server Error", status=500)
+
+        for _ in range(2):
+            with pytest.raises(GatewayError):
+                client.get_all_economic_resources()
+        assert _requests_to(httpserver, "get_all_economic_resources") == 2
+
+    def test_async_client_shares_cache(
+        self, httpserver: HTTPServer, config: GatewayConfig, cache: ResponseCache
+    ):
+        httpserver.expect_request(
+            _zome_path("get_latest_economic_resource"),
+        ).respond_with_json(RESOURCE)
+
+        async def run() -> None:
+            async with AsyncHolochainGatewayClient(config, cache=cache) as client:
+                await client.get_latest_economic_resource("uhCkkResA")
+                await client.get_latest_economic_resource("uhCkkResA")
+
+        asyncio.run(run())
+        HolochainGatewayClient(config, cache=cache).get_latest_economic_resource("uhCkkResA")
+        assert _requests_to(httpserver, "get_latest_economic_resource") == 1
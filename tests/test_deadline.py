@@ -0,0 +1,349 @@
+"""Tests for per-function timeouts and operation deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.deadline import deadline, expired, in_context, remaining
+from bridge.erp_mock import MockERPClient
+from bridge.gateway_client import DeadlineExceeded, GatewayError, HolochainGatewayClient
+from bridge.pool import GatewayPool
+from bridge.resilience import CircuitBreaker, RetryPolicy
+from bridge.singleflight import AsyncSingleFlight, SingleFlight
+from bridge.sync import NondominiumBridge
+from bridge.throttle import AdaptiveConcurrencyLimiter
+from bridge.use_process import UseProcess
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+
+SPEC = {
+    "name": "Prusa MK4",
+    "description": "3D printer",
+    "category": "equipment",
+    "image_url": None,
+    "tags": [],
+    "is_active": True,
+}
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"),
+        timeout=5,
+        app_id=APP_ID,
+        dna_hash=DNA_HASH,
+        timeouts={"get_latest_resource_specification": 1.5},
+    )
+
+
+class TestDeadline:
+    def test_nested_deadlines_only_tighten(self):
+        assert remaining() is None and not expired()
+        with deadline(10.0):
+            with deadline(60.0):
+                left = remaining()
+                assert left is not None and left <= 10.0
+            with deadline(0.0):
+                assert expired()
+            with deadline(None):
+                assert not expired()
+        assert remaining() is None
+
+    def test_in_context_carries_deadline_to_threads(self):
+        with deadline(10.0), ThreadPoolExecutor(max_workers=2) as pool:
+            assert pool.submit(remaining).result() is None
+            left = pool.submit(in_context(remaining)).result()
+        assert left is not None and 0 < left <= 10.0
+
+
+class TestTimeoutProfiles:
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("HC_GW_TIMEOUT", "30")
+        monkeypatch.setenv(
+            "HC_GW_TIMEOUTS", "get_latest_economic_resource=2, derive_reputation_summary=120"
+        )
+        config = GatewayConfig.from_env()
+        assert config.timeout_for("get_latest_economic_resource") == 2.0
+        assert config.timeout_for("derive_reputation_summary") == 120.0
+        assert config.timeout_for("create_economic_resource") == 30
+
+        monkeypatch.setenv("HC_GW_TIMEOUTS", "get_latest_economic_resource")
+        with pytest.raises(ValueError):
+            GatewayConfig.from_env()
+
+    def test_config_stays_hashable(self):
+        config = GatewayConfig(timeouts={"get_latest_economic_resource": 2.0})
+        assert hash(config) == hash(GatewayConfig())
+        assert config != GatewayConfig()
+
+    def test_timeout_per_call_cut_to_deadline(
+        self, config: GatewayConfig, monkeypatch: pytest.MonkeyPatch
+    ):
+        client = HolochainGatewayClient(config)
+        timeouts: list[float] = []
+
+        def send(url: str, params: dict[str, str], timeout: float) -> bytes:
+            timeouts.append(timeout)
+            return json.dumps({"specifications": []} if "get_all" in url else SPEC).encode()
+
+        monkeypatch.setattr(client, "_send", send)
+        client.get_all_resource_specifications()
+        client.get_latest_resource_specification("uhCkkSpec")
+        with deadline(0.5):
+            client.get_all_resource_specifications()
+        assert timeouts[:2] == [5, 1.5]
+        assert 0 < timeouts[2] <= 0.5
+
+
+class TestClientDeadlines:
+    def test_expired_deadline_sends_nothing(self, httpserver: HTTPServer, config: GatewayConfig):
+        client = HolochainGatewayClient(config)
+        with deadline(0.0), pytest.raises(DeadlineExceeded):
+            client.get_latest_resource_specification("uhCkkSpec")
+        assert len(httpserver.log) == 0
+
+    def test_slow_gateway_cut_off_at_deadline(self, httpserver: HTTPServer, config: GatewayConfig):
+        release = threading.Event()
+
+        def slow(request: Request) -> Response:
+            release.wait(5)
+            return Response("{}", content_type="application/json")
+
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_handler(slow)
+        client = HolochainGatewayClient(config)
+
+        start = time.perf_counter()
+        try:
+            with deadline(0.2), pytest.raises(DeadlineExceeded):
+                client.get_latest_resource_specification("uhCkkSpec")
+        finally:
+            release.set()
+        assert time.perf_counter() - start < 1.0
+
+    def test_deadline_cut_leaves_no_health_verdict(
+        self, httpserver: HTTPServer, config: GatewayConfig
+    ):
+        release = threading.Event()
+
+        def slow(request: Request) -> Response:
+            release.wait(5)
+            return Response(json.dumps(SPEC), content_type="application/json")
+
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_handler(slow)
+        breaker = CircuitBreaker(failure_threshold=1)
+        pool = GatewayPool([config.url], failure_threshold=1)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+        shared = {"circuit_breaker": breaker, "pool": pool, "concurrency_limiter": limiter}
+        client = HolochainGatewayClient(config, **shared)
+
+        async def run_async() -> None:
+            async with AsyncHolochainGatewayClient(config, **shared) as aclient:
+                with deadline(0.1), pytest.raises(DeadlineExceeded):
+                    await aclient.get_latest_resource_specification("uhCkkSpec")
+
+        try:
+            for _ in range(3):
+                with deadline(0.1), pytest.raises(DeadlineExceeded):
+                    client.get_latest_resource_specification("uhCkkSpec")
+            asyncio.run(run_async())
+        finally:
+            release.set()
+        assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+        [endpoint] = pool.stats()
+        assert endpoint.available and endpoint.failures == 0 and endpoint.outstanding == 0
+        assert (limiter.limit, limiter.in_flight) == (16, 0)
+
+    def test_no_retry_past_deadline(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_data("unavailable", status=503)
+        client = HolochainGatewayClient(
+            config, retry_policy=RetryPolicy(read_attempts=5, base_delay=10.0, max_delay=10.0)
+        )
+
+        with deadline(0.5), pytest.raises(DeadlineExceeded) as exc_info:
+            client.get_latest_resource_specification("uhCkkSpec")
+        assert isinstance(exc_info.value.__cause__, GatewayError)
+
+    def test_concurrency_slot_wait_bounded(self, httpserver: HTTPServer, config: GatewayConfig):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        ticket = limiter.acquire()  # the only slot is busy
+        client = HolochainGatewayClient(config, concurrency_limiter=limiter)
+
+        start = time.perf_counter()
+        with deadline(0.2), pytest.raises(DeadlineExceeded, match="concurrency slot"):
+            client.get_latest_resource_specification("uhCkkSpec")
+
+        async def run() -> None:
+            async with AsyncHolochainGatewayClient(config, concurrency_limiter=limiter) as aclient:
+                with deadline(0.2), pytest.raises(DeadlineExceeded, match="concurrency slot"):
+                    await aclient.get_latest_resource_specification("uhCkkSpec")
+
+        asyncio.run(run())
+        assert time.perf_counter() - start < 2.0
+        assert len(httpserver.log) == 0
+        assert limiter.in_flight == 1
+        limiter.release(ticket)
+        assert limiter.in_flight == 0
+
+    def test_shared_call_wait_bounded(self, httpserver: HTTPServer, config: GatewayConfig):
+        started, release = threading.Event(), threading.Event()
+
+        def slow(request: Request) -> Response:
+            started.set()
+            release.wait(5)
+            return Response(json.dumps(SPEC), content_type="application/json")
+
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_handler(slow)
+        client = HolochainGatewayClient(config, single_flight=SingleFlight())
+        leader = threading.Thread(
+            target=client.get_latest_resource_specification, args=("uhCkkSpec",)
+        )
+        leader.start()
+        try:
+            assert started.wait(5)
+            start = time.perf_counter()
+            with deadline(0.2), pytest.raises(DeadlineExceeded, match="shared"):
+                client.get_latest_resource_specification("uhCkkSpec")
+            assert time.perf_counter() - start < 1.0
+        finally:
+            release.set()
+            leader.join()
+        assert client.single_flight is not None and client.single_flight.shared == 1
+
+    def test_waiter_outlives_leader_deadline(self, httpserver: HTTPServer, config: GatewayConfig):
+        started = threading.Event()
+        calls: list[float] = []
+
+        def slow_once(request: Request) -> Response:
+            calls.append(time.perf_counter())
+            if len(calls) == 1:
+                started.set()
+                time.sleep(0.5)
+            return Response(json.dumps(SPEC), content_type="application/json")
+
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_handler(slow_once)
+        client = HolochainGatewayClient(config, single_flight=SingleFlight())
+        errors: list[BaseException] = []
+
+        def lead() -> None:
+            with deadline(0.2):
+                try:
+                    client.get_latest_resource_specification("uhCkkSpec")
+                except DeadlineExceeded as exc:
+                    errors.append(exc)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        try:
+            assert started.wait(5)
+            # No deadline of its own: the leader running out must not fail this call.
+            assert client.get_latest_resource_specification("uhCkkSpec").name == SPEC["name"]
+        finally:
+            leader.join()
+        assert len(errors) == 1 and len(calls) == 2
+        assert client.single_flight is not None
+        assert (client.single_flight.leaders, client.single_flight.shared) == (2, 1)
+
+    def test_async_waiter_outlives_leader_deadline(
+        self, httpserver: HTTPServer, config: GatewayConfig
+    ):
+        calls: list[float] = []
+
+        def slow_once(request: Request) -> Response:
+            calls.append(time.perf_counter())
+            if len(calls) == 1:
+                time.sleep(0.5)
+            return Response(json.dumps(SPEC), content_type="application/json")
+
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_handler(slow_once)
+        flight = AsyncSingleFlight()
+
+        async def lead(client: AsyncHolochainGatewayClient) -> None:
+            with deadline(0.2), pytest.raises(DeadlineExceeded):
+                await client.get_latest_resource_specification("uhCkkSpec")
+
+        async def run() -> None:
+            async with AsyncHolochainGatewayClient(config, single_flight=flight) as client:
+                leader = asyncio.create_task(lead(client))
+                await asyncio.sleep(0.05)
+                spec = await client.get_latest_resource_specification("uhCkkSpec")
+                assert spec.name == SPEC["name"]
+                await leader
+
+        asyncio.run(run())
+        assert len(calls) == 2
+        assert (flight.leaders, flight.shared) == (2, 1)
+
+    def test_async_tasks_inherit_deadline(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_json(SPEC)
+
+        async def run() -> None:
+            async with AsyncHolochainGatewayClient(config) as client:
+                await client.get_latest_resource_specification("uhCkkSpec")
+                with deadline(0.0):
+                    with pytest.raises(DeadlineExceeded):
+                        await asyncio.gather(client.get_latest_resource_specification("uhCkkSpec"))
+
+        asyncio.run(run())
+        assert len(httpserver.log) == 1
+
+
+class TestOperationDeadlines:
+    def test_use_process_budget(self, httpserver: HTTPServer, config: GatewayConfig):
+        process = UseProcess(HolochainGatewayClient(config))
+        with pytest.raises(DeadlineExceeded):
+            process.execute_use_process(
+                resource_hash="uhCkkRes",
+                provider="uhCAkProvider",
+                receiver="uhCAkReceiver",
+                quantity=1.0,
+                due_date=1700000000000000,
+                timeout=0.0,
+            )
+        assert len(httpserver.log) == 0
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_sync_stops_starting_products(
+        self, httpserver: HTTPServer, config: GatewayConfig, tmp_path: Path, workers: int
+    ):
+        bridge = NondominiumBridge(
+            erp_client=MockERPClient(),
+            gateway_client=HolochainGatewayClient(config),
+            state_path=tmp_path / "state.json",
+            workers=workers,
+        )
+        result = bridge.sync_inventory(timeout=0.0)
+        assert result.specs_created == 0
+        assert result.errors == ["Sync deadline exceeded; remaining products not attempted"]
+        assert len(httpserver.log) == 0
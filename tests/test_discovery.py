@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 from pytest_httpserver import HTTPServer
 
 from bridge.config import GatewayConfig
-from bridge.discovery import ResourceDiscovery
+from bridge.discovery import DiscoveryIndex, ResourceDiscovery
 from bridge.gateway_client import HolochainGatewayClient
+from bridge.sync import SyncState
 
 DNA_HASH = "uhC0kTestDnaHash"
 APP_ID = "nondominium"
@@ -125,11 +128,140 @@ class TestCheckAvailability:
 
 
 class TestDiscoverAll:
-    def test_returns_empty_for_poc(self, httpserver: HTTPServer, discovery: ResourceDiscovery):
-        """PoC discover_all returns empty — full correlation needs spec hashes from links."""
+    def test_returns_empty_without_index(
+        self, httpserver: HTTPServer, discovery: ResourceDiscovery
+    ):
+        """Without an index discover_all returns empty: the gateway gives no spec hashes."""
         httpserver.expect_request(
             _zome_path("get_all_resource_specifications"),
         ).respond_with_json({"specifications": [SAMPLE_SPEC]})
 
         result = discovery.discover_all()
-        assert result == []  # PoC limitation: no spec-hash correlation
+        assert result == []  # no spec-hash correlation without an index
+
+
+SPEC_HASH = "uhCkkSpecHash"
+RESOURCE_HASH = "uhCkkResourceHash"
+WITHDRAWN_SPEC_HASH = "uhCkkWithdrawnSpecAA"
+OTHER_RESOURCE = {**SAMPLE_RESOURCE, "quantity": 5.0, "custodian": "uhCAkOtherOrg"}
+
+
+def _serve_spec(httpserver: HTTPServer, linked: list[dict], own: dict = SAMPLE_RESOURCE) -> None:
+    httpserver.expect_request(
+        _zome_path("get_latest_resource_specification"),
+    ).respond_with_json(SAMPLE_SPEC)
+    httpserver.expect_request(
+        _zome_path("get_resources_by_specification"),
+    ).respond_with_json(linked)
+    httpserver.expect_request(
+        _zome_path("get_latest_economic_resource"),
+    ).respond_with_json(own)
+
+
+@pytest.fixture()
+def state(tmp_path: Path) -> SyncState:
+    state = SyncState(tmp_path / "state.json")
+    state.record(1, SPEC_HASH, RESOURCE_HASH)
+    return state
+
+
+class TestDiscoveryIndex:
+    def test_refresh_joins_specs_and_resources(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, state: SyncState
+    ):
+        _serve_spec(httpserver, [SAMPLE_RESOURCE, OTHER_RESOURCE])
+        index = DiscoveryIndex()
+        index.refresh_from_state(client, state)
+
+        result = ResourceDiscovery(client, index).discover_all()
+        assert [(r.spec_hash, r.resource_hash) for r in result] == [
+            (SPEC_HASH, RESOURCE_HASH),
+            (SPEC_HASH, None),  # another org's resource, seen only via the link
+        ]
+        assert result[0].spec.name == "Prusa MK4"
+        assert result[1].resource.quantity == 5.0
+
+    def test_withdrawn_entry_indexes_spec_only(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, state: SyncState
+    ):
+        _serve_spec(httpserver, [OTHER_RESOURCE])
+        state.record(2, WITHDRAWN_SPEC_HASH, "")
+        index = DiscoveryIndex()
+        index.refresh_from_state(client, state)
+
+        withdrawn = index.resources_for_spec(WITHDRAWN_SPEC_HASH)
+        assert withdrawn is not None
+        assert [r.custodian for r in withdrawn] == ["uhCAkOtherOrg"]  # linked resources only
+        own_fetches = [
+            request
+            for request, _ in httpserver.log
+            if request.path.endswith("/get_latest_economic_resource")
+        ]
+        assert len(own_fetches) == 1  # only the live entry's resource
+
+    def test_queries_answered_from_memory(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, state: SyncState
+    ):
+        _serve_spec(httpserver, [SAMPLE_RESOURCE, OTHER_RESOURCE])
+        index = DiscoveryIndex()
+        index.refresh_from_state(client, state)
+        httpserver.clear_log()
+
+        discovery = ResourceDiscovery(client, index)
+        assert len(discovery.discover_all()) == 2
+        assert [s.name for s in discovery.discover_by_category("equipment")] == ["Prusa MK4"]
+        assert discovery.check_availability(SPEC_HASH) == 2
+        assert len(httpserver.log) == 0
+
+    def test_own_resource_not_yet_linked(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, state: SyncState
+    ):
+        _serve_spec(httpserver, [])
+        index = DiscoveryIndex()
+        index.refresh_from_state(client, state)
+        assert [r.resource_hash for r in index.all()] == [RESOURCE_HASH]
+
+    def test_persisted_and_reloaded(
+        self,
+        httpserver: HTTPServer,
+        client: HolochainGatewayClient,
+        state: SyncState,
+        tmp_path: Path,
+    ):
+        _serve_spec(httpserver, [SAMPLE_RESOURCE, OTHER_RESOURCE])
+        index = DiscoveryIndex(tmp_path / "index.json")
+        index.refresh_from_state(client, state)
+        index.save()
+
+        reloaded = DiscoveryIndex(tmp_path / "index.json")
+        assert reloaded.all() == index.all()
+        assert reloaded.refreshed_at == index.refreshed_at
+
+    def test_failed_refresh_keeps_previous_entry(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, state: SyncState
+    ):
+        _serve_spec(httpserver, [SAMPLE_RESOURCE])
+        index = DiscoveryIndex()
+        index.refresh_from_state(client, state)
+
+        httpserver.clear()
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification"),
+        ).respond_with_data("Internal Server Error", status=500)
+        index.refresh_from_state(client, state)
+        assert SPEC_HASH in index
+        assert len(index.all()) == 1
+
+    def test_unindexed_lookups_fall_through(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        httpserver.expect_request(
+            _zome_path("get_resource_specifications_by_category"),
+        ).respond_with_json([{**SAMPLE_SPEC, "category": "tools"}])
+        httpserver.expect_request(
+            _zome_path("get_resources_by_specification"),
+        ).respond_with_json([SAMPLE_RESOURCE])
+
+        discovery = ResourceDiscovery(client, DiscoveryIndex())
+        assert [s.category for s in discovery.discover_by_category("tools")] == ["tools"]
+        assert discovery.check_availability("uhCkkUnknownSpec") == 1
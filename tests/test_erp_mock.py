@@ -0,0 +1,133 @@
+"""Tests for the mock ERP client and its synthetic catalog."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+
+import pytest
+
+from bridge.erp_mock import (
+    MOCK_PRODUCTS,
+    SYNTHETIC_CATEGORIES,
+    MockERPClient,
+    ProductStore,
+    SyntheticCatalog,
+)
+
+
+class TestSyntheticCatalog:
+    def test_deterministic_per_seed(self):
+        assert list(SyntheticCatalog(50, seed=7)) == list(SyntheticCatalog(50, seed=7))
+        assert list(SyntheticCatalog(50, seed=7)) != list(SyntheticCatalog(50, seed=8))
+
+    def test_random_access_matches_iteration(self):
+        catalog = SyntheticCatalog(100, seed=3)
+        products = list(catalog)
+        assert [p.id for p in products] == list(range(1, 101))
+        assert catalog[41] == products[41]
+        assert catalog[-1] == products[-1]
+        assert catalog[10:13] == products[10:13]
+        assert catalog.get(57) == products[56]
+        assert catalog.get(0) is None and catalog.get(101) is None
+        with pytest.raises(IndexError):
+            catalog[100]
+
+    def test_lazy_at_scale(self):
+        start = time.perf_counter()
+        catalog = SyntheticCatalog(10_000_000)
+        last = catalog.get(10_000_000)
+        assert last is not None and last.id == 10_000_000
+        assert time.perf_counter() - start < 1.0
+
+    def test_realistic_fields(self):
+        products = list(SyntheticCatalog(700, seed=1))
+        assert {p.category for p in products} == set(SYNTHETIC_CATEGORIES)
+        assert len({p.uom_name for p in products}) > 3
+        assert all(p.tags for p in products)
+        assert min(len(p.description) for p in products) > 100
+        out_of_stock = sum(p.qty_available == 0 for p in products)
+        assert 0.05 < out_of_stock / len(products) < 0.25
+
+    def test_variants_share_template(self):
+        first, second, third, fourth = SyntheticCatalog(4, variants=3)
+        base = first.name.rsplit(" - ", 1)[0]
+        assert second.name.startswith(base) and third.name.startswith(base)
+        assert len({first.name, second.name, third.name}) == 3
+        assert first.description == second.description == third.description
+        assert not fourth.name.startswith(base)
+        assert " - " not in SyntheticCatalog(1, variants=1)[0].name
+
+
+class TestProductStore:
+    def test_lookups(self):
+        store = ProductStore(MOCK_PRODUCTS)
+        assert len(store) == 4 and 2 in store
+        assert store.get(2) == MOCK_PRODUCTS[1]
+        assert store.get(99) is None
+        assert store.ids_in_category("equipment") == [1, 2]
+        assert store.in_category("consumable") == [MOCK_PRODUCTS[3]]
+        assert store.available_count == 4
+
+    def test_upsert_maintains_indexes(self):
+        store = ProductStore(MOCK_PRODUCTS)
+        store.upsert(replace(MOCK_PRODUCTS[0], category="tool", qty_available=0.0))
+
+        assert store.ids_in_category("equipment") == [2]
+        assert store.ids_in_category("tool") == [1]
+        assert not store.is_available(1)
+        assert store.available_count == 3
+        assert [p.id for p in store] == [1, 2, 3, 4]  # position kept
+        assert [p.id for p in store.available()] == [2, 3, 4]
+
+        store.upsert(replace(MOCK_PRODUCTS[0], qty_available=5.0))
+        assert store.is_available(1)
+        assert store.available_count == 4
+
+    def test_remove(self):
+        store = ProductStore(MOCK_PRODUCTS)
+        assert store.remove(4) == MOCK_PRODUCTS[3]
+        assert store.remove(4) is None
+        assert "consumable" not in store.categories()
+        assert not store.is_available(4)
+        assert store.available_count == 3
+
+    def test_sparse_ids(self):
+        store = ProductStore([replace(MOCK_PRODUCTS[0], id=5_000_000)])
+        assert store.is_available(5_000_000)
+        assert not store.is_available(4_999_999)
+        assert not store.is_available(-1)
+
+
+class TestMockERPClient:
+    def test_default_serves_sample_products(self):
+        client = MockERPClient()
+        assert client.get_all_products() == MOCK_PRODUCTS
+        assert client.get_product_by_id(3) == MOCK_PRODUCTS[2]
+
+    def test_synthetic_mode(self):
+        client = MockERPClient.synthetic(200, seed=5)
+        available = list(client.iter_products(available_only=True))
+        assert all(p.qty_available > 0 for p in available)
+        assert available == client.get_available_products()
+        assert len(client.get_all_products()) == 200
+        assert client.get_product_by_id(200) == SyntheticCatalog(200, seed=5)[199]
+        with pytest.raises(TypeError):
+            client.remove_product(1)
+
+    def test_edits_visible_to_reads(self):
+        client = MockERPClient()
+        client.upsert_product(replace(MOCK_PRODUCTS[2], qty_available=0.0))
+        client.remove_product(1)
+
+        assert not client.is_available(3)
+        assert [p.id for p in client.get_available_products()] == [2, 4]
+        assert [p.id for p in client.get_products_by_category("equipment")] == [2]
+        assert client.get_product_by_id(1) is None
+
+    def test_materialized_catalog(self):
+        client = MockERPClient(products=SyntheticCatalog(300, seed=2))
+        assert client.get_product_by_id(150) == SyntheticCatalog(300, seed=2).get(150)
+        assert len(client.get_available_products()) == sum(
+            p.qty_available > 0 for p in SyntheticCatalog(300, seed=2)
+        )
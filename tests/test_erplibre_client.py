@@ -0,0 +1,257 @@
+"""Tests for ERPLibreClient against a local stand-in Odoo XML-RPC server."""
+
+from __future__ import annotations
+
+import http.client
+import operator
+import threading
+from collections.abc import Iterator
+from typing import Any
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+import pytest
+
+from bridge.config import ERPConfig
+from bridge.erplibre_client import PRODUCT_FIELDS, TAG_FIELD, ERPError, ERPLibreClient
+from bridge.mapper import product_to_economic_resource, product_to_resource_spec
+
+DB = "erplibre_test"
+USER = "bridge"
+PASSWORD = "secret"
+
+_OPS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+def _match(domain: list[Any], record: dict[str, Any]) -> bool:
+    """Evaluate an Odoo prefix-notation domain (|, &, ! and comparison leaves)."""
+
+    def parse(pos: int) -> tuple[bool, int]:
+        term = domain[pos]
+        if term == "|":
+            left, pos = parse(pos + 1)
+            right, pos = parse(pos)
+            return left or right, pos
+        if term == "&":
+            left, pos = parse(pos + 1)
+            right, pos = parse(pos)
+            return left and right, pos
+        if term == "!":
+            value, pos = parse(pos + 1)
+            return not value, pos
+        field, op, value = term
+        return _OPS[op](record[field], value), pos + 1
+
+    pos, result = 0, True
+    while pos < len(domain):  # top-level terms are implicitly AND-ed
+        value, pos = parse(pos)
+        result = result and value
+    return result
+
+
+class FakeOdoo:
+    """Minimal product.product / product.tag backend speaking Odoo's execute_kw."""
+
+    def __init__(self, products: list[dict[str, Any]], with_tags: bool = True) -> None:
+        self.products = products
+        self.tags = {1: "fab-lab", 2: "prototyping"}
+        self.with_tags = with_tags
+        self.calls: list[tuple[str, str, list[Any], dict[str, Any]]] = []
+
+    def authenticate(self, db: str, login: str, password: str, ctx: dict[str, Any]) -> Any:
+        return 2 if (db, login, password) == (DB, USER, PASSWORD) else False
+
+    def execute_kw(
+        self,
+        db: str,
+        uid: int,
+        password: str,
+        model: str,
+        method: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        self.calls.append((model, method, args, kwargs))
+        if model == "product.product" and method == "fields_get":
+            fields = ["id", *PRODUCT_FIELDS] + ([TAG_FIELD] if self.with_tags else [])
+            return {f: {"type": "char"} for f in fields}
+        if model == "product.product" and method == "search_read":
+            domain = args[0]
+            rows = sorted(
+                (p for p in self.products if _match(domain, p)),
+                key=lambda p: (p["write_date"], p["id"]),
+            )[: kwargs.get("limit") or None]
+            return [{"id": p["id"], **{f: p[f] for f in kwargs["fields"]}} for p in rows]
+        if model == "product.tag" and method == "read":
+            return [{"id": i, "name": self.tags[i]} for i in args[0]]
+        raise ValueError(f"unsupported call {model}.{method}")
+
+
+def _product(pid: int, write_date: str, qty: float = 1.0) -> dict[str, Any]:
+    return {
+        "id": pid,
+        "name": f"Product {pid}",
+        "description_sale": f"Description {pid}" if pid % 2 else False,
+        "categ_id": [7, "All / Fab Lab / Equipment"],
+        "list_price": 10.0 * pid,
+        "qty_available": qty,
+        "uom_id": [1, "Units"],
+        "write_date": write_date,
+        "product_tag_ids": [1, 2] if pid == 1 else [],
+        "default_code": f"SKU-{pid}",  # never requested: checks projection
+    }
+
+
+def _serve(backend: FakeOdoo) -> tuple[SimpleXMLRPCServer, str]:
+    class Handler(SimpleXMLRPCRequestHandler):
+        rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+
+    server = SimpleXMLRPCServer(
+        ("127.0.0.1", 0), requestHandler=Handler, allow_none=True, logRequests=False
+    )
+    server.register_instance(backend)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture()
+def backend() -> FakeOdoo:
+    # Products 3 and 4 share a write_date to exercise the keyset tie-break.
+    return FakeOdoo(
+        [
+            _product(1, "2026-01-01 10:00:00"),
+            _product(2, "2026-01-02 10:00:00", qty=0.0),
+            _product(3, "2026-01-03 10:00:00"),
+            _product(4, "2026-01-03 10:00:00"),
+            _product(5, "2026-01-04 10:00:00"),
+        ]
+    )
+
+
+@pytest.fixture()
+def odoo_url(backend: FakeOdoo) -> Iterator[str]:
+    server, url = _serve(backend)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def _client(url: str, page_size: int = 2, password: str = PASSWORD) -> ERPLibreClient:
+    return ERPLibreClient(
+        ERPConfig(url=url, db=DB, username=USER, password=password, page_size=page_size)
+    )
+
+
+def _search_reads(backend: FakeOdoo) -> list[tuple[list[Any], dict[str, Any]]]:
+    return [(a, k) for m, meth, a, k in backend.calls if meth == "search_read"]
+
+
+class TestPagedSearchRead:
+    def test_all_products_across_pages(self, backend: FakeOdoo, odoo_url: str):
+        products = _client(odoo_url).get_all_products()
+        assert [p.id for p in products] == [1, 2, 3, 4, 5]
+        # 5 rows in pages of 2 -> 3 round-trips, each bounded by the page size
+        calls = _search_reads(backend)
+        assert len(calls) == 3
+        assert all(k["limit"] == 2 for _, k in calls)
+
+    def test_field_projection(self, backend: FakeOdoo, odoo_url: str):
+        _client(odoo_url).get_all_products()
+        for _, kwargs in _search_reads(backend):
+            assert kwargs["fields"] == PRODUCT_FIELDS + [TAG_FIELD]
+            assert "default_code" not in kwargs["fields"]
+
+    def test_tags_omitted_when_server_lacks_field(self, backend: FakeOdoo, odoo_url: str):
+        backend.with_tags = False
+        products = _client(odoo_url).get_all_products()
+        assert products[0].tags is None
+        assert all(TAG_FIELD not in k["fields"] for _, k in _search_reads(backend))
+
+    def test_available_products_filter(self, odoo_url: str):
+        products = _client(odoo_url).get_available_products()
+        assert [p.id for p in products] == [1, 3, 4, 5]
+
+    def test_iterator_is_lazy(self, backend: FakeOdoo, odoo_url: str):
+        first = next(_client(odoo_url).iter_products())
+        assert first.id == 1
+        assert len(_search_reads(backend)) == 1
+
+
+class TestIncrementalPulls:
+    def test_since_cursor(self, odoo_url: str):
+        products = list(_client(odoo_url).iter_products(since="2026-01-02 10:00:00"))
+        assert [p.id for p in products] == [3, 4, 5]
+
+    def test_last_cursor_after_iteration(self, backend: FakeOdoo, odoo_url: str):
+        client = _client(odoo_url)
+        client.get_all_products()
+        assert client.last_cursor == "2026-01-04 10:00:00"
+
+        backend.products.append(_product(6, "2026-01-05 09:00:00"))
+        changed = list(client.iter_products(since=client.last_cursor))
+        assert [p.id for p in changed] == [6]
+        assert client.last_cursor == "2026-01-05 09:00:00"
+
+    def test_cursor_kept_when_nothing_changed(self, odoo_url: str):
+        client = _client(odoo_url)
+        assert list(client.iter_products(since="2026-02-01 00:00:00")) == []
+        assert client.last_cursor == "2026-02-01 00:00:00"
+
+
+class TestProductMapping:
+    def test_odoo_record_maps_to_product(self, odoo_url: str):
+        client = _client(odoo_url)
+        product = client.get_product_by_id(1)
+        assert product is not None
+        assert product.name == "Product 1"
+        assert product.description == "Description 1"
+        assert product.category == "equipment"
+        assert product.uom_name == "Units"
+        assert product.tags == ["fab-lab", "prototyping"]
+
+        spec = product_to_resource_spec(product)
+        resource = product_to_economic_resource(product, "uhCkkSpec")
+        assert spec.category == "equipment"
+        assert resource.quantity == 1.0
+
+    def test_false_description_becomes_empty(self, odoo_url: str):
+        product = _client(odoo_url).get_product_by_id(2)
+        assert product is not None
+        assert product.description == ""
+
+    def test_unknown_id(self, odoo_url: str):
+        assert _client(odoo_url).get_product_by_id(999) is None
+
+
+class TestErrors:
+    def test_rejected_credentials(self, odoo_url: str):
+        with pytest.raises(ERPError):
+            _client(odoo_url, password="wrong").get_all_products()
+
+    def test_unreachable_server(self):
+        with pytest.raises(ERPError):
+            _client("http://127.0.0.1:1").get_all_products()
+
+
+class TestTransport:
+    @pytest.mark.parametrize(
+        ("url", "connection", "port"),
+        [
+            ("http://erp.example.org", http.client.HTTPConnection, 80),
+            ("https://erp.example.org", http.client.HTTPSConnection, 443),
+        ],
+    )
+    def test_scheme_picks_transport(
+        self, url: str, connection: type[http.client.HTTPConnection], port: int
+    ):
+        transport = _client(url)._models("transport")
+        conn = transport.make_connection("erp.example.org")
+        assert type(conn) is connection
+        assert conn.port == port
+        assert conn.timeout == ERPConfig(url=url).timeout
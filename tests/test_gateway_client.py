@@ -1,14 +1,23 @@
 """Tests for HolochainGatewayClient using pytest-httpserver mock."""
 
+import asyncio
 import base64
 import json
+import time
+from collections.abc import Iterator
 
 import pytest
 from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
 
+from bridge import gateway_client
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.cache import ResponseCache
 from bridge.config import GatewayConfig
-from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.gateway_client import GatewayError, HolochainGatewayClient, model_parser
+from bridge.hash_codec import encode_hash
 from bridge.models import (
+    EconomicResource,
     EconomicResourceInput,
     ResourceSpecificationInput,
     ResourceState,
@@ -39,9 +48,19 @@ def _zome_path(fn_name: str) -> str:
 
 
 class TestURLConstruction:
-    def test_base_url(self, client: HolochainGatewayClient, config: GatewayConfig):
-        expected = f"{config.url}/{DNA_HASH}/{APP_ID}/{ZOME}"
-        assert client._base_url() == expected
+    def test_zome_path(self, config: GatewayConfig):
+        path = HolochainGatewayClient._zome_path(config, ZOME, "get_all_resource_specifications")
+        assert path == f"/{DNA_HASH}/{APP_ID}/{ZOME}/get_all_resource_specifications"
+
+    def test_request_url(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, config: GatewayConfig
+    ):
+        httpserver.expect_request(_zome_path("get_all_resource_specifications")).respond_with_json(
+            {"specifications": []}
+        )
+        client.get_all_resource_specifications()
+        [(request, _)] = httpserver.log
+        assert request.base_url == f"{config.url}{_zome_path('get_all_resource_specifications')}"
 
 
 class TestBase64Encoding:
@@ -71,6 +90,21 @@ class TestBase64Encoding:
         decoded_str = base64.b64decode(encoded).decode()
         assert " " not in decoded_str
 
+    def test_model_encoded_like_its_json_dump(self):
+        resource = EconomicResourceInput(
+            spec_hash="uhCkk" + "A" * 48, quantity=2.5, unit="unit", current_location="Ünïcode"
+        )
+        from_model = HolochainGatewayClient._encode_payload(resource)
+        from_dict = HolochainGatewayClient._encode_payload(resource.model_dump(mode="json"))
+        assert json.loads(base64.b64decode(from_model)) == json.loads(base64.b64decode(from_dict))
+        assert isinstance(json.loads(base64.b64decode(from_model))["spec_hash"], list)
+
+    def test_stdlib_json_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        payload = {"name": "test", "hash": list(range(39))}
+        fast = HolochainGatewayClient._encode_payload(payload)
+        monkeypatch.setattr(gateway_client, "orjson", None)
+        assert HolochainGatewayClient._encode_payload(payload) == fast
+
 
 class TestNullPayload:
     def test_no_payload_param_for_unit_functions(
@@ -193,6 +227,37 @@ class TestErrorHandling:
         with pytest.raises(GatewayError):
             client.get_all_resource_specifications()
 
+    def test_invalid_json_raises_gateway_error(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        httpserver.expect_request(
+            _zome_path("get_latest_economic_resource"),
+        ).respond_with_data("<html>proxy error</html>", content_type="text/html")
+
+        with pytest.raises(GatewayError, match="invalid JSON") as exc_info:
+            client.get_latest_economic_resource("uhCkkRes")
+        assert exc_info.value.status_code == 200
+
+
+class TestRawBodyParsing:
+    def test_models_validated_from_bytes(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        agent = [0x84, 0x20, 0x24] + list(range(36))
+        resource = {"quantity": 1.0, "unit": "unit", "custodian": agent}
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_json({"resources": [resource, resource]})
+
+        result = client.get_all_economic_resources()
+        assert [r.custodian for r in result.resources] == [encode_hash(bytes(agent))] * 2
+
+    def test_model_parser_memoized(self):
+        assert model_parser(EconomicResource) is model_parser(EconomicResource)
+        assert model_parser(EconomicResource)(
+            b'{"quantity": 1, "unit": "kg", "custodian": "x"}'
+        ) == (EconomicResource(quantity=1, unit="kg", custodian="x"))
+
 
 class TestHealthCheck:
     def test_healthy(self, httpserver: HTTPServer, client: HolochainGatewayClient):
@@ -208,3 +273,140 @@ class TestHealthCheck:
         ).respond_with_data("Error", status=500)
 
         assert client.health_check() is False
+
+    def test_not_served_from_cache(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_resource_specifications"),
+        ).respond_with_json({"specifications": []})
+        client = HolochainGatewayClient(config, cache=ResponseCache())
+        client.get_all_resource_specifications()  # warm the cache
+        assert client.health_check() is True
+
+        httpserver.stop()  # the gateway goes down
+        try:
+            assert client.health_check() is False
+        finally:
+            httpserver.start()
+
+    def test_async_not_served_from_cache(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_resource_specifications"),
+        ).respond_with_json({"specifications": []})
+
+        async def run() -> tuple[bool, bool]:
+            async with AsyncHolochainGatewayClient(config, cache=ResponseCache()) as client:
+                await client.get_all_resource_specifications()
+                healthy = await client.health_check()
+                httpserver.stop()
+                try:
+                    return healthy, await client.health_check()
+                finally:
+                    httpserver.start()
+
+        assert asyncio.run(run()) == (True, False)
+
+
+def _resource_handler(request: Request) -> Response:
+    """Echo the quantity back; later items answer first, quantity 3 fails."""
+    payload = json.loads(base64.b64decode(request.args["payload"]))
+    quantity = payload["quantity"]
+    time.sleep((10 - quantity) * 0.01)
+    if quantity == 3:
+        return Response("Internal Server Error", status=500)
+    body = {
+        "resource_hash": f"uhCkkRes{int(quantity)}",
+        "resource": {"quantity": quantity, "unit": "unit", "custodian": "uhCAkAgent"},
+    }
+    return Response(json.dumps(body), content_type="application/json")
+
+
+@pytest.fixture()
+def threaded_server() -> Iterator[HTTPServer]:
+    server = HTTPServer(threaded=True)
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+class TestBulkCreate:
+    @pytest.fixture()
+    def bulk_config(self, threaded_server: HTTPServer) -> GatewayConfig:
+        threaded_server.expect_request(
+            _zome_path("create_economic_resource"),
+        ).respond_with_handler(_resource_handler)
+        return GatewayConfig(
+            url=threaded_server.url_for("").rstrip("/"),
+            timeout=5,
+            app_id=APP_ID,
+            dna_hash=DNA_HASH,
+        )
+
+    @staticmethod
+    def _inputs() -> Iterator[EconomicResourceInput]:
+        for quantity in range(1, 9):
+            yield EconomicResourceInput(spec_hash="uhCkkSpec", quantity=quantity, unit="unit")
+
+    def test_input_order_and_per_item_errors(self, bulk_config: GatewayConfig):
+        client = HolochainGatewayClient(bulk_config)
+        results = client.create_economic_resources_bulk(self._inputs(), concurrency=4)
+
+        assert [r.index for r in results] == list(range(8))
+        assert [r.ok for r in results] == [True, True, False, True, True, True, True, True]
+        assert results[2].error is not None and results[2].error.status_code == 500
+        assert results[0].output is not None and results[0].output.resource_hash == "uhCkkRes1"
+        assert results[7].output is not None and results[7].output.resource.quantity == 8
+
+    def test_serial_when_concurrency_is_one(self, bulk_config: GatewayConfig):
+        client = HolochainGatewayClient(bulk_config)
+        results = client.create_economic_resources_bulk(self._inputs(), concurrency=1)
+        assert [r.ok for r in results].count(False) == 1
+
+    def test_async_bulk(self, bulk_config: GatewayConfig):
+        async def run() -> list:
+            async with AsyncHolochainGatewayClient(bulk_config) as client:
+                return await client.create_economic_resources_bulk(self._inputs(), concurrency=4)
+
+        results = asyncio.run(run())
+        assert [r.output.resource_hash for r in results if r.output is not None] == [
+            f"uhCkkRes{q}" for q in (1, 2, 4, 5, 6, 7, 8)
+        ]
+        assert not results[2].ok
+
+    def test_async_bulk_consumes_inputs_lazily(self):
+        pulled = finished = ahead = 0
+
+        def inputs() -> Iterator[int]:
+            nonlocal pulled
+            for item in range(1000):
+                pulled += 1
+                yield item
+
+        async def create(item: int) -> int:
+            nonlocal finished, ahead
+            ahead = max(ahead, pulled - finished)
+            await asyncio.sleep(0)
+            finished += 1
+            return item
+
+        results = asyncio.run(AsyncHolochainGatewayClient._bulk(create, inputs(), concurrency=4))
+        assert [r.output for r in results] == list(range(1000))
+        assert ahead <= 2 * 4 + 1  # the window plus the item waiting to enter it
+
+    def test_specs_bulk(self, httpserver: HTTPServer, client: HolochainGatewayClient):
+        httpserver.expect_request(
+            _zome_path("create_resource_specification"),
+        ).respond_with_json(
+            {
+                "spec_hash": "uhCkkABC",
+                "spec": {"name": "Printer", "description": "", "category": "equipment"},
+                "governance_rule_hashes": [],
+            }
+        )
+        specs = [
+            ResourceSpecificationInput(name=f"Printer {i}", description="", category="equipment")
+            for i in range(3)
+        ]
+        results = client.create_resource_specifications_bulk(specs)
+        assert all(r.ok for r in results)
+        assert len(httpserver.log) == 3
@@ -1,11 +1,17 @@
 """Tests for governance gateway methods using pytest-httpserver mock."""
 
+import asyncio
+
 import pytest
+from pydantic import ValidationError
 from pytest_httpserver import HTTPServer
 
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.cache import ResponseCache
 from bridge.config import GatewayConfig
-from bridge.gateway_client import HolochainGatewayClient
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
 from bridge.models import (
+    Commitment,
     CreateValidationReceiptInput,
     LogEconomicEventInput,
     LogInitialTransferInput,
@@ -38,16 +44,25 @@ def _gov_path(fn_name: str) -> str:
 
 
 class TestGovernanceURLConstruction:
-    def test_base_url_governance_zome(self, client: HolochainGatewayClient, config: GatewayConfig):
-        expected = f"{config.url}/{DNA_HASH}/{APP_ID}/{ZOME_GOV}"
-        assert client._base_url(zome=ZOME_GOV) == expected
+    def test_governance_zome_url(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, config: GatewayConfig
+    ):
+        httpserver.expect_request(_gov_path("get_all_commitments")).respond_with_json([])
+        assert client.get_all_commitments() == []
+        [(request, _)] = httpserver.log
+        assert (
+            request.base_url == f"{config.url}/{DNA_HASH}/{APP_ID}/{ZOME_GOV}/get_all_commitments"
+        )
 
-    def test_base_url_default_is_resource(
-        self, client: HolochainGatewayClient, config: GatewayConfig
+    def test_default_zome_is_resource(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, config: GatewayConfig
     ):
         """Default zome should remain zome_resource for backward compat."""
-        expected = f"{config.url}/{DNA_HASH}/{APP_ID}/zome_resource"
-        assert client._base_url() == expected
+        path = f"/{DNA_HASH}/{APP_ID}/zome_resource/get_all_resource_specifications"
+        httpserver.expect_request(path).respond_with_json({"specifications": []})
+        client._call("get_all_resource_specifications")
+        [(request, _)] = httpserver.log
+        assert request.base_url == f"{config.url}{path}"
 
 
 class TestProposeCommitment:
@@ -300,3 +315,74 @@ class TestDeriveReputationSummary:
         )
         assert result.summary.total_claims == 10
         assert result.claims_included == 10
+
+
+RECEIPT = {
+    "validator": "uhCAkValidator",
+    "validated_item": "uhCkkRes",
+    "validation_type": "resource_approval",
+    "approved": True,
+    "notes": None,
+    "validated_at": 1699000000000000,
+}
+
+
+class TestRawListParsing:
+    """List reads are validated straight from the response bytes."""
+
+    def test_invalid_json_is_gateway_error(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        httpserver.expect_request(_gov_path("get_all_validation_receipts")).respond_with_data(
+            "[{not json", content_type="application/json"
+        )
+
+        with pytest.raises(GatewayError, match="invalid JSON") as exc_info:
+            client.get_all_validation_receipts()
+        assert exc_info.value.status_code == 200
+
+    def test_schema_mismatch_raises_validation_error(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient
+    ):
+        httpserver.expect_request(_gov_path("get_all_validation_receipts")).respond_with_json(
+            [{**RECEIPT, "approved": "maybe"}]
+        )
+
+        with pytest.raises(ValidationError):
+            client.get_all_validation_receipts()
+
+    def test_cache_holds_parsed_models(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(_gov_path("get_all_validation_receipts")).respond_with_json(
+            [RECEIPT]
+        )
+        client = HolochainGatewayClient(config, cache=ResponseCache())
+
+        first = client.get_all_validation_receipts()
+        second = client.get_all_validation_receipts()
+
+        assert second is first
+        assert len(httpserver.log) == 1
+        # A raw _call for the same key must not be served the cached models.
+        assert client._call("get_all_validation_receipts", None, zome=ZOME_GOV) == [RECEIPT]
+        assert len(httpserver.log) == 2
+
+    def test_async_client(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(_gov_path("get_all_commitments")).respond_with_json(
+            [
+                {
+                    "action": "Use",
+                    "provider": "uhCAkA",
+                    "receiver": "uhCAkB",
+                    "due_date": 1700000000000000,
+                    "committed_at": 1699000000000000,
+                }
+            ]
+        )
+
+        async def run() -> list[Commitment]:
+            async with AsyncHolochainGatewayClient(config) as client:
+                return await client.get_all_commitments()
+
+        result = asyncio.run(run())
+        assert isinstance(result[0], Commitment)
+        assert result[0].note is None
@@ -0,0 +1,64 @@
+"""Tests for the memoized Holochain hash codec."""
+
+from __future__ import annotations
+
+import base64
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from bridge import hash_codec
+from bridge.hash_codec import coerce_hash, decode_hash, encode_hash, hash_to_list
+from bridge.models import EconomicResource, GetAllEconomicResourcesOutput
+
+AGENT = [0x84, 0x20, 0x24] + list(range(36))
+
+
+def _reference_encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+class TestHashCodec:
+    @pytest.mark.parametrize("length", [39, 32, 33, 34, 1])
+    def test_matches_base64_reference(self, length: int):
+        # A Holochain type prefix keeps the raw form from starting with "u",
+        # which decode_hash would take for the multibase prefix.
+        raw = (bytes(AGENT[:3]) + os.urandom(length))[:length]
+        encoded = encode_hash(raw)
+        assert encoded == _reference_encode(raw)
+        assert decode_hash(encoded) == raw
+        assert decode_hash("u" + encoded) == raw
+
+    def test_real_hash_is_unpadded_52_chars(self):
+        assert len(encode_hash(bytes(AGENT))) == 52
+        assert coerce_hash(AGENT).startswith("hCAk")
+
+    def test_repeated_hashes_share_one_string(self):
+        hash_codec.cache_clear()
+        first = coerce_hash(list(AGENT))
+        second = coerce_hash(list(AGENT))
+        assert first is second
+        assert encode_hash.cache_info().hits == 1
+
+    def test_round_trip(self):
+        assert hash_to_list(coerce_hash(AGENT)) == AGENT
+        assert hash_to_list("u" + coerce_hash(AGENT)) == AGENT
+
+    def test_accepts_str_and_bytes(self):
+        assert coerce_hash("uhCkkAlready") == "uhCkkAlready"
+        assert coerce_hash(bytes(AGENT)) == coerce_hash(AGENT)
+
+    @pytest.mark.parametrize("bad", [[256], ["a"], 42, None])
+    def test_invalid_values_fail_validation(self, bad: object):
+        with pytest.raises(ValidationError):
+            EconomicResource.model_validate({"quantity": 1, "unit": "unit", "custodian": bad})
+
+
+class TestBulkResponses:
+    def test_custodian_strings_shared_across_resources(self):
+        resource = {"quantity": 1.0, "unit": "unit", "custodian": AGENT}
+        output = GetAllEconomicResourcesOutput.model_validate(
+            {"resources": [dict(resource) for _ in range(100)]}
+        )
+        assert len({id(r.custodian) for r in output.resources}) == 1
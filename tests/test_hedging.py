@@ -0,0 +1,210 @@
+"""Tests for hedged reads."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from collections.abc import Callable, Iterator
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.hedging import HedgePolicy, HedgeStats
+from bridge.pool import GatewayPool
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+FN = "get_latest_economic_resource"
+
+RESOURCE = (
+    '{"quantity": 2.0, "unit": "unit", "custodian": "uhCAkAgent",'
+    ' "current_location": null, "state": "Active"}'
+)
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+def _url(server: HTTPServer) -> str:
+    return server.url_for("").rstrip("/")
+
+
+def _threaded() -> Iterator[HTTPServer]:
+    server = HTTPServer(threaded=True)
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+server_a = pytest.fixture()(_threaded)
+server_b = pytest.fixture()(_threaded)
+
+
+@pytest.fixture()
+def release() -> Iterator[threading.Event]:
+    event = threading.Event()
+    yield event
+    event.set()  # unblock a stalled handler before the server stops
+
+
+def _first_stalls(
+    release: threading.Event, first: Response | None = None, rest: Response | None = None
+) -> Callable[[Request], Response]:
+    """Handler whose first request waits for `release`; later ones answer at once."""
+    counter = itertools.count()
+
+    def handler(request: Request) -> Response:
+        if next(counter) == 0:
+            release.wait(5)
+            return first or Response(RESOURCE, content_type="application/json")
+        return rest or Response(RESOURCE, content_type="application/json")
+
+    return handler
+
+
+def _config(server: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(url=_url(server), timeout=10, app_id=APP_ID, dna_hash=DNA_HASH)
+
+
+class TestHedgePolicy:
+    def test_delay_tracks_recent_p95(self):
+        policy = HedgePolicy(initial_delay=0.5, min_samples=20, min_delay=0.01)
+        assert policy.delay("create_economic_resource") is None
+        assert policy.delay(FN) == 0.5
+        for ms in range(1, 101):
+            policy.observe(FN, ms / 1000)
+        assert policy.delay(FN) == pytest.approx(0.096)
+
+        for _ in range(200):
+            policy.observe(FN, 0.001)
+        assert policy.delay(FN) == 0.01  # floor
+
+    def test_stats(self):
+        policy = HedgePolicy()
+        for _ in range(4):
+            policy.delay(FN)
+        policy.record_hedge(won=True)
+        policy.record_hedge(won=False)
+        stats = policy.stats()
+        assert stats == HedgeStats(requests=4, hedges=2, wins=1)
+        assert (stats.hedge_rate, stats.win_rate) == (0.5, 0.5)
+
+
+class TestSyncHedging:
+    def test_hedge_wins_over_stalled_read(self, server_a: HTTPServer, release: threading.Event):
+        server_a.expect_request(_zome_path(FN)).respond_with_handler(_first_stalls(release))
+        hedging = HedgePolicy(initial_delay=0.05)
+        client = HolochainGatewayClient(_config(server_a), hedging=hedging)
+
+        assert client.get_latest_economic_resource("uhCkkRes").quantity == 2.0
+        assert hedging.stats() == HedgeStats(requests=1, hedges=1, wins=1)
+
+    def test_fast_read_not_hedged(self, server_a: HTTPServer):
+        server_a.expect_request(_zome_path(FN)).respond_with_data(
+            RESOURCE, content_type="application/json"
+        )
+        hedging = HedgePolicy(initial_delay=5.0)
+        client = HolochainGatewayClient(_config(server_a), hedging=hedging)
+
+        for _ in range(3):
+            client.get_latest_economic_resource("uhCkkRes")
+        assert hedging.stats() == HedgeStats(requests=3, hedges=0, wins=0)
+        assert len(server_a.log) == 3
+
+    def test_reads_past_max_in_flight_not_hedged(
+        self, server_a: HTTPServer, release: threading.Event
+    ):
+        server_a.expect_request(_zome_path(FN)).respond_with_handler(_first_stalls(release))
+        hedging = HedgePolicy(initial_delay=0.05, max_in_flight=1)
+        client = HolochainGatewayClient(_config(server_a), hedging=hedging)
+
+        # The first read's stalled primary keeps its slot, so the second read is not hedged.
+        client.get_latest_economic_resource("uhCkkRes")
+        client.get_latest_economic_resource("uhCkkRes")
+        assert hedging.stats() == HedgeStats(requests=2, hedges=1, wins=1)
+        assert len(server_a.log) == 2  # the stalled primary has not been answered yet
+
+    def test_close_stops_hedge_threads(self, server_a: HTTPServer):
+        server_a.expect_request(_zome_path(FN)).respond_with_data(
+            RESOURCE, content_type="application/json"
+        )
+        before = set(threading.enumerate())
+        with HolochainGatewayClient(_config(server_a), hedging=HedgePolicy()) as client:
+            client.get_latest_economic_resource("uhCkkRes")
+            workers = [
+                t for t in set(threading.enumerate()) - before if t.name.startswith("gateway-hedge")
+            ]
+            assert workers
+        for worker in workers:
+            worker.join(5)
+        assert not any(worker.is_alive() for worker in workers)
+
+    def test_both_failing_raises_primary_error(
+        self, server_a: HTTPServer, release: threading.Event
+    ):
+        handler = _first_stalls(
+            release, first=Response("primary", status=504), rest=Response("hedge", status=503)
+        )
+        server_a.expect_request(_zome_path(FN)).respond_with_handler(handler)
+        hedging = HedgePolicy(initial_delay=0.05)
+        client = HolochainGatewayClient(_config(server_a), hedging=hedging)
+        threading.Timer(0.2, release.set).start()
+
+        with pytest.raises(GatewayError) as exc_info:
+            client.get_latest_economic_resource("uhCkkRes")
+        assert exc_info.value.status_code == 504
+        assert hedging.stats() == HedgeStats(requests=1, hedges=1, wins=0)
+
+    def test_hedge_goes_to_another_pool_endpoint(
+        self, server_a: HTTPServer, server_b: HTTPServer, release: threading.Event
+    ):
+        stall_first = _first_stalls(release)  # shared: whichever server is asked first stalls
+        hosts: list[str] = []
+
+        def handler(request: Request) -> Response:
+            hosts.append(request.host)
+            return stall_first(request)
+
+        for server in (server_a, server_b):
+            server.expect_request(_zome_path(FN)).respond_with_handler(handler)
+        pool = GatewayPool([_url(server_a), _url(server_b)])
+        hedging = HedgePolicy(initial_delay=0.05)
+        client = HolochainGatewayClient(_config(server_a), pool=pool, hedging=hedging)
+
+        client.get_latest_economic_resource("uhCkkRes")
+        assert len(hosts) == len(set(hosts)) == 2
+        assert hedging.stats().wins == 1
+
+    def test_writes_never_hedged(self, server_a: HTTPServer):
+        hedging = HedgePolicy(functions={"create_economic_resource"}, initial_delay=0.0)
+        client = HolochainGatewayClient(_config(server_a), hedging=hedging)
+        server_a.expect_request(_zome_path("create_economic_resource")).respond_with_data(
+            "down", status=503
+        )
+        with pytest.raises(GatewayError):
+            client._call("create_economic_resource", {"spec_hash": "x"})
+        assert len(server_a.log) == 1
+        assert hedging.stats().hedges == 0
+
+
+class TestAsyncHedging:
+    def test_loser_cancelled(self, server_a: HTTPServer, release: threading.Event):
+        server_a.expect_request(_zome_path(FN)).respond_with_handler(_first_stalls(release))
+        hedging = HedgePolicy(initial_delay=0.05)
+
+        async def run() -> float:
+            async with AsyncHolochainGatewayClient(_config(server_a), hedging=hedging) as client:
+                resource = await client.get_latest_economic_resource("uhCkkRes")
+                assert not [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+                return resource.quantity
+
+        assert asyncio.run(run()) == 2.0
+        assert hedging.stats() == HedgeStats(requests=1, hedges=1, wins=1)
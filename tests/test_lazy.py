@@ -0,0 +1,156 @@
+"""Tests for lazily validated list results and the gateway methods returning them."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+from pytest_httpserver import HTTPServer
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.discovery import ResourceDiscovery
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.lazy import LazyList
+from bridge.models import EconomicEvent, EconomicResource, ResourceValidation
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+
+RESOURCE = {
+    "quantity": 2.0,
+    "unit": "unit",
+    "custodian": "uhCAkAgent",
+    "current_location": None,
+    "state": "Active",
+}
+EVENT = {
+    "action": "Use",
+    "provider": "uhCAkA",
+    "receiver": "uhCAkB",
+    "resource_inventoried_as": "uhCkkRes",
+    "affects": "uhCkkRes",
+    "resource_quantity": 1.0,
+    "event_time": 1700000000000000,
+}
+
+
+class CountingValidator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, item: dict) -> EconomicResource:
+        self.calls += 1
+        return EconomicResource.model_validate(item)
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"),
+        timeout=5,
+        app_id=APP_ID,
+        dna_hash=DNA_HASH,
+    )
+
+
+def _path(zome: str, fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{zome}/{fn_name}"
+
+
+class TestLazyList:
+    def test_len_validates_nothing(self):
+        validate = CountingValidator()
+        items = LazyList([RESOURCE] * 1000, validate)
+        assert len(items) == 1000 and items
+        assert validate.calls == 0
+
+    def test_elements_validated_once(self):
+        validate = CountingValidator()
+        items = LazyList([RESOURCE, {**RESOURCE, "quantity": 5.0}], validate)
+
+        assert items[1].quantity == 5.0
+        assert items[-1] is items[1]
+        assert validate.calls == 1
+        assert [r.quantity for r in items] == [2.0, 5.0]
+        assert validate.calls == 2
+        assert "2 validated" in repr(items)
+
+    def test_sequence_protocol(self):
+        items = LazyList([RESOURCE] * 3, EconomicResource.model_validate)
+        expected = [EconomicResource.model_validate(RESOURCE)] * 3
+        assert items == expected
+        assert items[1:] == expected[1:]
+        assert items.index(expected[0]) == 0
+        assert LazyList([], EconomicResource.model_validate) == []
+        with pytest.raises(IndexError):
+            items[3]
+        assert items.raw[0] is RESOURCE
+
+    def test_bad_element_fails_on_access(self):
+        items = LazyList([RESOURCE, {"unit": "unit"}], EconomicResource.model_validate)
+        assert len(items) == 2
+        assert items[0].quantity == 2.0
+        with pytest.raises(ValidationError):
+            items[1]
+
+
+class TestTypedListMethods:
+    def test_resources_by_specification(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _path("zome_resource", "get_resources_by_specification")
+        ).respond_with_json([RESOURCE])
+
+        result = HolochainGatewayClient(config).get_resources_by_specification("uhCkkSpec")
+        assert isinstance(result, LazyList)
+        assert isinstance(result[0], EconomicResource)
+
+    def test_non_array_body_is_gateway_error(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(_path("zome_gouvernance", "get_all_claims")).respond_with_json(
+            {"claims": []}
+        )
+
+        with pytest.raises(GatewayError, match="expected a JSON array") as exc_info:
+            HolochainGatewayClient(config).get_all_claims()
+        assert exc_info.value.status_code == 200
+
+    def test_check_availability_only_counts(self, httpserver: HTTPServer, config: GatewayConfig):
+        # Entries that would not validate are still counted: nothing is built.
+        httpserver.expect_request(
+            _path("zome_resource", "get_resources_by_specification")
+        ).respond_with_json([{"opaque": i} for i in range(3)])
+
+        discovery = ResourceDiscovery(HolochainGatewayClient(config))
+        assert discovery.check_availability("uhCkkSpec") == 3
+
+    def test_check_validation_status(self, httpserver: HTTPServer, config: GatewayConfig):
+        validation = {
+            "resource": "uhCkkRes",
+            "validation_scheme": "2-of-3",
+            "required_validators": 2,
+            "current_validators": 1,
+            "status": "pending",
+            "created_at": 1699000000000000,
+            "updated_at": 1700000000000000,
+        }
+        httpserver.expect_request(
+            _path("zome_gouvernance", "check_validation_status")
+        ).respond_with_json(validation)
+
+        result = HolochainGatewayClient(config).check_validation_status("uhCkkVal")
+        assert isinstance(result, ResourceValidation)
+        assert result.status == "pending"
+
+    def test_async_events(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _path("zome_gouvernance", "get_events_for_resource")
+        ).respond_with_json([EVENT, EVENT])
+
+        async def run() -> LazyList[EconomicEvent]:
+            async with AsyncHolochainGatewayClient(config) as client:
+                return await client.get_events_for_resource("uhCkkRes")
+
+        events = asyncio.run(run())
+        assert len(events) == 2
+        assert events[0].resource_quantity == 1.0
@@ -1,7 +1,14 @@
 """Tests for ERP product → Nondominium mapping."""
 
+from dataclasses import replace
+
 from bridge.erp_mock import MockProduct
-from bridge.mapper import product_to_economic_resource, product_to_resource_spec
+from bridge.mapper import (
+    product_to_economic_resource,
+    product_to_resource_spec,
+    resource_fingerprint,
+    spec_fingerprint,
+)
 
 SAMPLE_PRODUCT = MockProduct(
     id=1,
@@ -66,3 +73,27 @@ class TestProductToEconomicResource:
         data = resource.model_dump(mode="json")
         assert "spec_hash" in data
         assert "conforms_to" not in data
+
+
+class TestFingerprints:
+    def test_spec_fingerprint_is_stable(self):
+        a = spec_fingerprint(product_to_resource_spec(SAMPLE_PRODUCT))
+        b = spec_fingerprint(product_to_resource_spec(replace(SAMPLE_PRODUCT)))
+        assert a == b
+
+    def test_spec_fingerprint_tracks_description(self):
+        changed = replace(SAMPLE_PRODUCT, description="FDM 3D printer, upgraded")
+        assert spec_fingerprint(product_to_resource_spec(SAMPLE_PRODUCT)) != spec_fingerprint(
+            product_to_resource_spec(changed)
+        )
+
+    def test_resource_fingerprint_tracks_quantity(self):
+        changed = replace(SAMPLE_PRODUCT, qty_available=5.0)
+        assert resource_fingerprint(
+            product_to_economic_resource(SAMPLE_PRODUCT, "uhCkkSpec")
+        ) != resource_fingerprint(product_to_economic_resource(changed, "uhCkkSpec"))
+
+    def test_resource_fingerprint_ignores_spec_hash(self):
+        assert resource_fingerprint(
+            product_to_economic_resource(SAMPLE_PRODUCT, "uhCkkSpecA")
+        ) == resource_fingerprint(product_to_economic_resource(SAMPLE_PRODUCT, "uhCkkSpecB"))
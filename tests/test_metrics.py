@@ -0,0 +1,123 @@
+"""Tests for per-function gateway call metrics and the Prometheus export."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from bridge.cache import ResponseCache
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.metrics import TRANSPORT_ERROR, Histogram, MetricsRegistry
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"),
+        timeout=5,
+        app_id=APP_ID,
+        dna_hash=DNA_HASH,
+    )
+
+
+class TestHistogram:
+    def test_quantiles_interpolate_within_buckets(self):
+        histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+        for value in (0.5, 0.5, 1.5, 3.0):
+            histogram.observe(value)
+        assert histogram.quantile(0.5) == pytest.approx(1.0)
+        assert histogram.quantile(0.75) == pytest.approx(2.0)
+        assert histogram.quantile(1.0) == pytest.approx(3.0)  # capped at the observed max
+
+    def test_overflow_bucket_uses_max(self):
+        histogram = Histogram(buckets=(1.0,))
+        histogram.observe(10.0)
+        assert histogram.counts == [0, 1]
+        assert histogram.quantile(0.99) <= 10.0
+
+    def test_empty(self):
+        assert Histogram().quantile(0.95) == 0.0
+
+
+class TestMetricsRegistry:
+    def test_snapshot(self):
+        registry = MetricsRegistry()
+        registry.observe(ZOME, "get_all_economic_resources", 0.02, 200, 0, 100)
+        registry.observe(ZOME, "get_all_economic_resources", 0.04, 503, 0, 0)
+        registry.observe(ZOME, "get_all_economic_resources", 0.5, None, 0, 0)
+
+        stats = registry.snapshot()[(ZOME, "get_all_economic_resources")]
+        assert stats.calls == 3
+        assert stats.errors == {"503": 1, TRANSPORT_ERROR: 1}
+        assert stats.error_count == 2
+        assert stats.response_bytes == 100
+        assert stats.mean == pytest.approx(0.56 / 3)
+        assert stats.p50 <= stats.p95 <= stats.p99 <= stats.max == 0.5
+
+    def test_prometheus_export(self):
+        registry = MetricsRegistry()
+        registry.observe("zome_gouvernance", "log_economic_event", 0.3, 200, 120, 80)
+        registry.observe("zome_gouvernance", "log_economic_event", 0.03, 500, 120, 0)
+
+        text = registry.to_prometheus()
+        labels = 'zome="zome_gouvernance",fn="log_economic_event"'
+        assert "# TYPE hc_gateway_calls_total counter" in text
+        assert f"hc_gateway_calls_total{{{labels}}} 2" in text
+        assert f'hc_gateway_errors_total{{{labels},status="500"}} 1' in text
+        assert f"hc_gateway_request_bytes_total{{{labels}}} 240" in text
+        assert f'hc_gateway_call_duration_seconds_bucket{{{labels},le="0.05"}} 1' in text
+        assert f'hc_gateway_call_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"hc_gateway_call_duration_seconds_count{{{labels}}} 2" in text
+        assert text.endswith("\n")
+
+
+class TestInstrumentedClient:
+    def test_records_calls_errors_and_sizes(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_resources_by_specification"),
+        ).respond_with_json([])
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Internal Server Error", status=500)
+
+        metrics = MetricsRegistry()
+        client = HolochainGatewayClient(config, metrics=metrics)
+        client.get_resources_by_specification("uhCkkSpecHash")
+        with pytest.raises(GatewayError):
+            client.get_all_economic_resources()
+
+        snapshot = metrics.snapshot()
+        read = snapshot[(ZOME, "get_resources_by_specification")]
+        assert read.calls == 1
+        assert read.errors == {}
+        assert read.request_bytes > 0
+        assert read.response_bytes == len(b"[]")
+        assert snapshot[(ZOME, "get_all_economic_resources")].errors == {"500": 1}
+
+    def test_transport_failure_recorded(self):
+        config = GatewayConfig(url="http://127.0.0.1:1", timeout=1, dna_hash=DNA_HASH)
+        metrics = MetricsRegistry()
+        with pytest.raises(GatewayError):
+            HolochainGatewayClient(config, metrics=metrics).get_all_economic_resources()
+        stats = metrics.snapshot()[(ZOME, "get_all_economic_resources")]
+        assert stats.errors == {TRANSPORT_ERROR: 1}
+
+    def test_cache_hits_not_counted(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_json({"resources": []})
+
+        metrics = MetricsRegistry()
+        client = HolochainGatewayClient(config, cache=ResponseCache(), metrics=metrics)
+        for _ in range(3):
+            client.get_all_economic_resources()
+        assert metrics.snapshot()[(ZOME, "get_all_economic_resources")].calls == 1
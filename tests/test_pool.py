@@ -0,0 +1,211 @@
+"""Tests for the multi-gateway pool and its use in the gateway clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.models import EconomicResourceInput
+from bridge.pool import GatewayPool, http_probe
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+
+SPEC = {
+    "name": "Prusa MK4",
+    "description": "3D printer",
+    "category": "equipment",
+    "image_url": None,
+    "tags": [],
+    "is_active": True,
+}
+A, B, C = "http://gw-a", "http://gw-b", "http://gw-c"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+def _url(server: HTTPServer) -> str:
+    return server.url_for("").rstrip("/")
+
+
+@pytest.fixture()
+def second_server() -> Iterator[HTTPServer]:
+    server = HTTPServer()
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(url=_url(httpserver), timeout=5, app_id=APP_ID, dna_hash=DNA_HASH)
+
+
+class TestSelection:
+    def test_idle_pool_round_robins(self):
+        pool = GatewayPool([A, B, C])
+        picked = []
+        for _ in range(6):
+            url = pool.acquire(read_only=True)
+            pool.release(url)
+            picked.append(url)
+        assert sorted(picked) == [A, A, B, B, C, C]
+
+    def test_least_outstanding(self):
+        pool = GatewayPool([A, B])
+        first = pool.acquire(read_only=True)
+        second = pool.acquire(read_only=True)
+        assert {first, second} == {A, B}
+        pool.release(A)
+        assert pool.acquire(read_only=True) == A
+
+    def test_writes_pinned(self):
+        pool = GatewayPool([A, B], write_url=C)
+        assert pool.urls == [A, B, C]
+        assert all(pool.acquire(read_only=False) == C for _ in range(3))
+        assert GatewayPool([A, B]).write_url == A
+        with pytest.raises(ValueError):
+            GatewayPool([])
+
+    def test_failing_endpoint_taken_out_then_retried(self):
+        clock = FakeClock()
+        pool = GatewayPool([A, B], failure_threshold=2, reset_timeout=10.0, clock=clock)
+        for _ in range(2):
+            pool.acquire(read_only=True, exclude=[B])
+            pool.release(A, failed=True)
+
+        assert [s.available for s in pool.stats()] == [False, True]
+        assert {pool.acquire(read_only=True) for _ in range(3)} == {B}
+        assert not pool.can_fail_over([B])
+
+        clock.now += 10.0
+        assert pool.can_fail_over([B])
+
+    def test_all_down_still_returns_an_endpoint(self):
+        clock = FakeClock()
+        pool = GatewayPool([A, B], failure_threshold=1, clock=clock)
+        pool.release(pool.acquire(True, exclude=[B]), failed=True)
+        clock.now += 1
+        pool.release(pool.acquire(True, exclude=[A]), failed=True)
+        assert pool.acquire(read_only=True) == A  # due back first
+
+    def test_probe(self):
+        pool = GatewayPool([A, B])
+        pool.probe(lambda url: url == B)
+        assert [s.available for s in pool.stats()] == [False, True]
+        pool.probe(lambda url: True)
+        assert all(s.available for s in pool.stats())
+
+
+class TestClientFailover:
+    def test_reads_fail_over(
+        self, httpserver: HTTPServer, second_server: HTTPServer, config: GatewayConfig
+    ):
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_data("down", status=503)
+        second_server.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_json(SPEC)
+        pool = GatewayPool([_url(httpserver), _url(second_server)])
+        client = HolochainGatewayClient(config, pool=pool)
+
+        for _ in range(4):
+            assert client.get_latest_resource_specification("uhCkkSpec").name == "Prusa MK4"
+        assert len(second_server.log) == 4
+        assert [s.outstanding for s in pool.stats()] == [0, 0]
+        assert pool.stats()[0].failures >= 1
+
+    def test_client_errors_do_not_fail_over(
+        self, httpserver: HTTPServer, second_server: HTTPServer, config: GatewayConfig
+    ):
+        for server in (httpserver, second_server):
+            server.expect_request(
+                _zome_path("get_latest_resource_specification")
+            ).respond_with_data("bad request", status=400)
+        client = HolochainGatewayClient(
+            config, pool=GatewayPool([_url(httpserver), _url(second_server)])
+        )
+
+        with pytest.raises(GatewayError) as exc_info:
+            client.get_latest_resource_specification("uhCkkSpec")
+        assert exc_info.value.status_code == 400
+        assert len(httpserver.log) + len(second_server.log) == 1
+
+    def test_writes_never_fail_over(
+        self, httpserver: HTTPServer, second_server: HTTPServer, config: GatewayConfig
+    ):
+        httpserver.expect_request(_zome_path("create_economic_resource")).respond_with_data(
+            "down", status=503
+        )
+        client = HolochainGatewayClient(
+            config, pool=GatewayPool([_url(second_server)], write_url=_url(httpserver))
+        )
+
+        with pytest.raises(GatewayError):
+            client.create_economic_resource(
+                EconomicResourceInput(spec_hash="uhCkkSpec", quantity=1, unit="unit")
+            )
+        assert len(second_server.log) == 0
+
+    def test_async_reads_fail_over(
+        self, httpserver: HTTPServer, second_server: HTTPServer, config: GatewayConfig
+    ):
+        second_server.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_json(SPEC)
+        pool = GatewayPool(["http://127.0.0.1:1", _url(second_server)])
+
+        async def run() -> list[str]:
+            async with AsyncHolochainGatewayClient(config, pool=pool) as client:
+                specs = await asyncio.gather(
+                    *(client.get_latest_resource_specification("uhCkkSpec") for _ in range(4))
+                )
+                return [s.name for s in specs]
+
+        assert asyncio.run(run()) == ["Prusa MK4"] * 4
+        assert [s.outstanding for s in pool.stats()] == [0, 0]
+
+
+class TestHealthChecks:
+    def test_background_probe(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(_zome_path("get_all_resource_specifications")).respond_with_json(
+            {"specifications": []}
+        )
+        probed = threading.Event()
+        probe = http_probe(config, timeout=1.0)
+
+        def check(url: str) -> bool:
+            healthy = probe(url)
+            probed.set()
+            return healthy
+
+        pool = GatewayPool([_url(httpserver), "http://127.0.0.1:1"])
+        pool.start_health_checks(check, interval=0.01)
+        try:
+            assert probed.wait(5)
+            with pytest.raises(RuntimeError):
+                pool.start_health_checks(check)
+        finally:
+            pool.stop_health_checks()
+
+        assert [s.available for s in pool.stats()] == [True, False]
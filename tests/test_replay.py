@@ -0,0 +1,161 @@
+"""Tests for the record-and-replay transport."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayConnectError, GatewayError, HolochainGatewayClient
+from bridge.replay import Exchange, RecordingTransport, ReplayMiss, ReplayTransport
+from bridge.resilience import RetryPolicy
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+GET_SPEC = "get_latest_resource_specification"
+
+SPEC = {
+    "name": "Prusa MK4",
+    "description": "3D printer",
+    "category": "equipment",
+    "image_url": None,
+    "tags": [],
+    "is_active": True,
+}
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"), timeout=5, app_id=APP_ID, dna_hash=DNA_HASH
+    )
+
+
+@pytest.fixture()
+def offline_config() -> GatewayConfig:
+    """A config whose gateway does not exist: replay must not touch the network."""
+    return GatewayConfig(url="http://127.0.0.1:9", timeout=5, app_id=APP_ID, dna_hash="uhC0kOther")
+
+
+def _record(httpserver: HTTPServer, config: GatewayConfig) -> RecordingTransport:
+    httpserver.expect_request(_zome_path("get_all_resource_specifications")).respond_with_json(
+        {"specifications": []}
+    )
+    httpserver.expect_request(_zome_path(GET_SPEC)).respond_with_json(SPEC)
+    httpserver.expect_request(_zome_path("create_resource_specification")).respond_with_data(
+        "unavailable", status=503
+    )
+    recorder = RecordingTransport()
+    client = HolochainGatewayClient(config, transport=recorder)
+    client.get_all_resource_specifications()
+    client.get_latest_resource_specification("uhCkkSpecAA")
+    client.get_latest_resource_specification("uhCkkSpecBB")
+    with pytest.raises(GatewayError):
+        client._call("create_resource_specification", {"name": "x"})
+    return recorder
+
+
+class TestRecording:
+    def test_records_decoded_exchanges(self, httpserver: HTTPServer, config: GatewayConfig):
+        exchanges = _record(httpserver, config).exchanges
+        assert [e.fn for e in exchanges] == [
+            f"{ZOME}/get_all_resource_specifications",
+            f"{ZOME}/{GET_SPEC}",
+            f"{ZOME}/{GET_SPEC}",
+            f"{ZOME}/create_resource_specification",
+        ]
+        assert exchanges[0].payload is None
+        assert exchanges[3].payload == {"name": "x"}
+        assert json.loads(exchanges[1].body) == SPEC
+        assert exchanges[3].status == 503 and "unavailable" in exchanges[3].body
+        assert all(e.elapsed >= 0 for e in exchanges)
+        assert [e.offset for e in exchanges] == sorted(e.offset for e in exchanges)
+
+    @pytest.mark.parametrize("name", ["session.jsonl", "session.jsonl.gz"])
+    def test_save_load_round_trip(
+        self, httpserver: HTTPServer, config: GatewayConfig, tmp_path: Path, name: str
+    ):
+        recorder = _record(httpserver, config)
+        recorder.save(tmp_path / name)
+        replay = ReplayTransport.load(tmp_path / name)
+        assert sum(len(answers) for answers in replay._answers.values()) == 4
+
+
+class TestReplay:
+    def test_replays_offline_with_scaled_latency(
+        self,
+        httpserver: HTTPServer,
+        config: GatewayConfig,
+        offline_config: GatewayConfig,
+        tmp_path: Path,
+    ):
+        _record(httpserver, config).save(tmp_path / "session.jsonl")
+        sleeps: list[float] = []
+        replay = ReplayTransport.load(
+            tmp_path / "session.jsonl", latency_scale=0.5, sleep=sleeps.append
+        )
+        client = HolochainGatewayClient(offline_config, transport=replay)
+
+        assert client.get_latest_resource_specification("uhCkkSpecBB").name == "Prusa MK4"
+        assert client.get_all_resource_specifications().specifications == []
+        with pytest.raises(GatewayError) as exc_info:
+            client._call("create_resource_specification", {"name": "x"})
+        assert exc_info.value.status_code == 503
+        assert replay.replayed == 3
+        assert len(sleeps) == 3 and all(s >= 0 for s in sleeps)
+
+    def test_latency_beyond_timeout_replays_as_timeout(self, offline_config: GatewayConfig):
+        exchange = Exchange(f"{ZOME}/get_all_resource_specifications", None, 200, "{}", 30.0)
+        sleeps: list[float] = []
+        client = HolochainGatewayClient(
+            offline_config, transport=ReplayTransport([exchange], sleep=sleeps.append)
+        )
+        with pytest.raises(GatewayError) as exc_info:
+            client.get_all_resource_specifications()
+        assert exc_info.value.status_code is None
+        assert sleeps == [5]
+
+    def test_connect_errors_replayed_and_retried(self, offline_config: GatewayConfig):
+        fn = f"{ZOME}/get_all_resource_specifications"
+        replay = ReplayTransport(
+            [
+                Exchange(fn, None, None, "HTTP request failed: refused", 0.0, never_sent=True),
+                Exchange(fn, None, 200, '{"specifications": []}', 0.0),
+            ],
+            latency_scale=0,
+        )
+        client = HolochainGatewayClient(
+            offline_config,
+            transport=replay,
+            retry_policy=RetryPolicy(read_attempts=2, base_delay=0.0),
+        )
+        assert client.get_all_resource_specifications().specifications == []
+        assert replay.replayed == 2
+
+        with pytest.raises(ReplayMiss):
+            client.get_all_resource_specifications()
+
+    def test_loop_cycles_answers(self, offline_config: GatewayConfig):
+        fn = f"{ZOME}/get_all_resource_specifications"
+        replay = ReplayTransport(
+            [Exchange(fn, None, None, "refused", 0.0, never_sent=True)], latency_scale=0, loop=True
+        )
+        client = HolochainGatewayClient(offline_config, transport=replay)
+        for _ in range(3):
+            with pytest.raises(GatewayConnectError):
+                client.get_all_resource_specifications()
+        assert replay.replayed == 3
+
+    def test_unrecorded_payload_misses(self, offline_config: GatewayConfig):
+        replay = ReplayTransport([], latency_scale=0)
+        client = HolochainGatewayClient(offline_config, transport=replay)
+        with pytest.raises(ReplayMiss, match=GET_SPEC):
+            client.get_latest_resource_specification("uhCkkSpecAA")
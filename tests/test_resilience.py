@@ -0,0 +1,282 @@
+"""Tests for gateway retries, backoff and circuit breaking."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.gateway_client import (
+    CircuitOpenError,
+    GatewayConnectError,
+    GatewayError,
+    HolochainGatewayClient,
+)
+from bridge.models import EconomicResourceInput
+from bridge.resilience import CircuitBreaker, RetryPolicy
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+
+NO_WAIT = RetryPolicy(base_delay=0.0)
+RESOURCE_OUTPUT = {
+    "resource_hash": "uhCkkRes",
+    "resource": {"quantity": 1.0, "unit": "unit", "custodian": "uhCAkAgent"},
+}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"),
+        timeout=5,
+        app_id=APP_ID,
+        dna_hash=DNA_HASH,
+    )
+
+
+class TestRetryPolicy:
+    def test_backoff_is_capped_and_jittered(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+        assert policy.delay(0, rng=lambda: 1.0) == pytest.approx(0.1)
+        assert policy.delay(3, rng=lambda: 1.0) == pytest.approx(0.8)
+        assert policy.delay(10, rng=lambda: 1.0) == 1.0
+        assert policy.delay(10, rng=lambda: 0.0) == 0.0
+
+    def test_reads_retry_transient_failures_only(self):
+        policy = RetryPolicy()
+        assert policy.should_retry(None, read_only=True, never_sent=False)
+        assert policy.should_retry(503, read_only=True, never_sent=False)
+        assert not policy.should_retry(500, read_only=True, never_sent=False)
+        assert not policy.should_retry(404, read_only=True, never_sent=False)
+
+    def test_writes_retry_only_when_never_sent(self):
+        policy = RetryPolicy(write_attempts=3)
+        assert policy.attempts(read_only=False) == 3
+        assert policy.should_retry(None, read_only=False, never_sent=True)
+        assert not policy.should_retry(None, read_only=False, never_sent=False)
+        assert not policy.should_retry(503, read_only=False, never_sent=False)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure()
+        assert breaker.retry_after() == 10.0
+
+        clock.now += 10.0
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # only one probe at a time
+
+        breaker.record_failure()  # failed probe re-opens for a full timeout
+        assert not breaker.allow()
+        clock.now += 10.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_abandoned_probe_frees_slot(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure()
+        clock.now += 10.0
+        assert breaker.allow()
+        breaker.abandon_probe()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+
+
+class TestClientRetries:
+    def test_read_retried_after_transient_status(
+        self, httpserver: HTTPServer, config: GatewayConfig
+    ):
+        httpserver.expect_oneshot_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Service Unavailable", status=503)
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_json({"resources": []})
+
+        client = HolochainGatewayClient(config, retry_policy=NO_WAIT)
+        assert client.get_all_economic_resources().resources == []
+        assert len(httpserver.log) == 2
+
+    def test_read_gives_up_after_attempts(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Bad Gateway", status=502)
+
+        client = HolochainGatewayClient(config, retry_policy=NO_WAIT)
+        with pytest.raises(GatewayError) as exc_info:
+            client.get_all_economic_resources()
+        assert exc_info.value.status_code == 502
+        assert len(httpserver.log) == NO_WAIT.read_attempts
+
+    def test_write_not_repeated_after_ambiguous_failure(
+        self, httpserver: HTTPServer, config: GatewayConfig
+    ):
+        httpserver.expect_request(
+            _zome_path("create_economic_resource"),
+        ).respond_with_data("Gateway Timeout", status=504)
+
+        client = HolochainGatewayClient(config, retry_policy=RetryPolicy(write_attempts=3))
+        with pytest.raises(GatewayError):
+            client.create_economic_resource(
+                EconomicResourceInput(spec_hash="uhCkkSpec", quantity=1, unit="unit")
+            )
+        assert len(httpserver.log) == 1
+
+    def test_write_retried_when_never_sent(
+        self, config: GatewayConfig, monkeypatch: pytest.MonkeyPatch
+    ):
+        client = HolochainGatewayClient(
+            config, retry_policy=RetryPolicy(write_attempts=2, base_delay=0.0)
+        )
+        outcomes: list[Any] = [GatewayConnectError("refused"), json.dumps(RESOURCE_OUTPUT).encode()]
+
+        def send(url: str, params: dict[str, str], timeout: float) -> bytes:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(client, "_send", send)
+        result = client.create_economic_resource(
+            EconomicResourceInput(spec_hash="uhCkkSpec", quantity=1, unit="unit")
+        )
+        assert result.resource_hash == "uhCkkRes"
+        assert outcomes == []
+
+    def test_refused_connection_is_connect_error(self):
+        config = GatewayConfig(url="http://127.0.0.1:1", timeout=1, dna_hash=DNA_HASH)
+        with pytest.raises(GatewayConnectError):
+            HolochainGatewayClient(config).get_all_economic_resources()
+
+    def test_async_read_retried(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_oneshot_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Too Many Requests", status=429)
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_json({"resources": []})
+
+        async def run() -> None:
+            async with AsyncHolochainGatewayClient(config, retry_policy=NO_WAIT) as client:
+                await client.get_all_economic_resources()
+
+        asyncio.run(run())
+        assert len(httpserver.log) == 2
+
+
+class TestClientCircuitBreaker:
+    def test_fast_fails_when_gateway_down(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Internal Server Error", status=500)
+
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        client = HolochainGatewayClient(config, circuit_breaker=breaker)
+        for _ in range(2):
+            with pytest.raises(GatewayError):
+                client.get_all_economic_resources()
+        with pytest.raises(CircuitOpenError):
+            client.get_all_economic_resources()
+        assert len(httpserver.log) == 2
+
+    def test_client_errors_do_not_trip(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Bad Request", status=400)
+
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        client = HolochainGatewayClient(config, circuit_breaker=breaker)
+        for _ in range(3):
+            with pytest.raises(GatewayError) as exc_info:
+                client.get_all_economic_resources()
+            assert not isinstance(exc_info.value, CircuitOpenError)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_retries_stop_when_circuit_opens(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_data("Service Unavailable", status=503)
+
+        client = HolochainGatewayClient(
+            config,
+            retry_policy=RetryPolicy(read_attempts=5, base_delay=0.0),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, clock=FakeClock()),
+        )
+        with pytest.raises(CircuitOpenError):
+            client.get_all_economic_resources()
+        assert len(httpserver.log) == 2
+
+    def test_cancelled_probe_does_not_wedge_breaker(
+        self, httpserver: HTTPServer, config: GatewayConfig
+    ):
+        release = threading.Event()
+
+        def stall(request: Request) -> Response:
+            release.wait(5)
+            return Response('{"resources": []}', content_type="application/json")
+
+        httpserver.expect_oneshot_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_handler(stall)
+        httpserver.expect_request(
+            _zome_path("get_all_economic_resources"),
+        ).respond_with_json({"resources": []})
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        breaker.record_failure()
+        clock.now += 10.0
+
+        async def run() -> None:
+            async with AsyncHolochainGatewayClient(config, circuit_breaker=breaker) as client:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(client.get_all_economic_resources(), 0.1)
+                release.set()
+                await client.get_all_economic_resources()  # a new probe is admitted
+
+        try:
+            asyncio.run(run())
+        finally:
+            release.set()
+        assert breaker.state == CircuitBreaker.CLOSED
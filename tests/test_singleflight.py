@@ -0,0 +1,198 @@
+"""Tests for single-flight coalescing of identical in-flight reads."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.models import EconomicResourceInput
+from bridge.singleflight import AsyncSingleFlight, SingleFlight
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+
+RESOURCE = {
+    "quantity": 2.0,
+    "unit": "unit",
+    "custodian": "uhCAkAgent",
+    "current_location": None,
+    "state": "Active",
+}
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+def _slow_json(data: Any, delay: float = 0.2) -> Callable[[Request], Response]:
+    """Handler that holds the request open so concurrent callers overlap."""
+
+    def handler(request: Request) -> Response:
+        time.sleep(delay)
+        return Response(json.dumps(data), content_type="application/json")
+
+    return handler
+
+
+@pytest.fixture()
+def threaded_server() -> Iterator[HTTPServer]:
+    server = HTTPServer(threaded=True)
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+@pytest.fixture()
+def config(threaded_server: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=threaded_server.url_for("").rstrip("/"),
+        timeout=5,
+        app_id=APP_ID,
+        dna_hash=DNA_HASH,
+    )
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = 0
+
+        def fn() -> object:
+            nonlocal calls
+            calls += 1
+            release.wait(5)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flight.do, "key", fn) for _ in range(8)]
+            while flight.leaders + flight.shared < 8:
+                time.sleep(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert (flight.leaders, flight.shared) == (1, 7)
+
+    def test_error_shared_and_key_released(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing() -> None:
+            release.wait(5)
+            raise GatewayError("boom", status_code=502)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flight.do, "key", failing) for _ in range(3)]
+            while flight.leaders + flight.shared < 3:
+                time.sleep(0.01)
+            release.set()
+            for future in futures:
+                with pytest.raises(GatewayError):
+                    future.result()
+
+        assert flight.do("key", lambda: "fresh") == "fresh"
+
+    def test_distinct_keys_not_coalesced(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.leaders == 2
+
+    def test_async_group(self):
+        async def run() -> tuple[list[object], int]:
+            flight = AsyncSingleFlight()
+            calls = 0
+
+            async def fn() -> object:
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.05)
+                return object()
+
+            results = await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+            return results, calls
+
+        results, calls = asyncio.run(run())
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+
+    def test_async_waiter_timeout_leaves_call_running(self):
+        async def run() -> str:
+            flight = AsyncSingleFlight()
+
+            async def fn() -> str:
+                await asyncio.sleep(0.2)
+                return "done"
+
+            leader = asyncio.ensure_future(flight.do("key", fn))
+            await asyncio.sleep(0)
+            with pytest.raises(TimeoutError):
+                await flight.do("key", fn, timeout=0.01)
+            return await leader
+
+        assert asyncio.run(run()) == "done"
+
+
+class TestCoalescedClient:
+    def test_concurrent_identical_reads_one_request(
+        self, threaded_server: HTTPServer, config: GatewayConfig
+    ):
+        threaded_server.expect_request(
+            _zome_path("get_resources_by_specification"),
+        ).respond_with_handler(_slow_json([RESOURCE]))
+        client = HolochainGatewayClient(config, single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(
+                pool.map(lambda _: client.get_resources_by_specification("uhCkkSpec"), range(6))
+            )
+
+        assert len(threaded_server.log) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_writes_never_coalesced(self, threaded_server: HTTPServer, config: GatewayConfig):
+        threaded_server.expect_request(
+            _zome_path("create_economic_resource"),
+        ).respond_with_handler(
+            _slow_json({"resource_hash": "uhCkkRes", "resource": RESOURCE}, delay=0.05)
+        )
+        client = HolochainGatewayClient(config, single_flight=SingleFlight())
+        resource = EconomicResourceInput(spec_hash="uhCkkSpec", quantity=1, unit="unit")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: client.create_economic_resource(resource), range(4)))
+
+        assert len(threaded_server.log) == 4
+
+    def test_async_client_coalesces(self, threaded_server: HTTPServer, config: GatewayConfig):
+        threaded_server.expect_request(
+            _zome_path("get_latest_economic_resource"),
+        ).respond_with_handler(_slow_json(RESOURCE))
+
+        async def run() -> list:
+            async with AsyncHolochainGatewayClient(
+                config, single_flight=AsyncSingleFlight()
+            ) as client:
+                return await asyncio.gather(
+                    *(client.get_latest_economic_resource("uhCkkResA") for _ in range(5))
+                )
+
+        results = asyncio.run(run())
+        assert len(results) == 5
+        assert len(threaded_server.log) == 1
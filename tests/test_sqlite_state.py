@@ -0,0 +1,147 @@
+"""Tests for the SQLite sync state backend and JSON migrator."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from bridge.config import GatewayConfig
+from bridge.erp_mock import MockERPClient
+from bridge.gateway_client import HolochainGatewayClient
+from bridge.sqlite_state import SqliteSyncState, migrate_json_state
+from bridge.sync import NondominiumBridge, SyncState, open_sync_state
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "sync_state.db"
+
+
+class TestSqliteSyncState:
+    def test_empty_state(self, db_path: Path):
+        state = SqliteSyncState(db_path)
+        assert not state.is_synced(1)
+        assert state.get_entry(1) is None
+
+    def test_record_and_retrieve(self, db_path: Path):
+        state = SqliteSyncState(db_path)
+        state.record(1, "specABC", "resXYZ")
+        assert state.is_synced(1)
+        assert state.get_entry(1) == {"spec_hash": "specABC", "resource_hash": "resXYZ"}
+
+    def test_record_upserts(self, db_path: Path):
+        state = SqliteSyncState(db_path)
+        state.record(1, "specA", "resA")
+        state.record(1, "specB", "resB")
+        assert state.get_entry(1) == {"spec_hash": "specB", "resource_hash": "resB"}
+        assert state.as_dict() == {"1": {"spec_hash": "specB", "resource_hash": "resB"}}
+
+    def test_iter_entries_pages_in_product_order(self, db_path: Path):
+        state = SqliteSyncState(db_path, batch_size=2)
+        for product_id in (5, 1, 3, 4, 2):
+            state.record(product_id, f"spec{product_id}", f"res{product_id}")
+
+        seen = []
+        for product_id, entry in state.iter_entries():
+            # Re-recording while iterating must not disturb the scan.
+            state.record(product_id, entry["spec_hash"], "")
+            seen.append(product_id)
+        assert seen == [1, 2, 3, 4, 5]
+        assert all(entry["resource_hash"] == "" for _, entry in state.iter_entries())
+
+    def test_persistence(self, db_path: Path):
+        state = SqliteSyncState(db_path)
+        state.record(42, "specHash", "resHash")
+        state.close()
+
+        state2 = SqliteSyncState(db_path)
+        assert state2.get_entry(42) == {"spec_hash": "specHash", "resource_hash": "resHash"}
+
+    def test_unsaved_records_below_batch_are_not_committed(self, db_path: Path):
+        state = SqliteSyncState(db_path, batch_size=10)
+        state.record(1, "s", "r")
+
+        other = sqlite3.connect(db_path)
+        assert other.execute("SELECT COUNT(*) FROM sync_state").fetchone()[0] == 0
+
+        state.save()
+        assert other.execute("SELECT COUNT(*) FROM sync_state").fetchone()[0] == 1
+
+    def test_batch_commits_automatically(self, db_path: Path):
+        state = SqliteSyncState(db_path, batch_size=3)
+        for i in range(7):
+            state.record(i, f"s{i}", f"r{i}")
+
+        other = sqlite3.connect(db_path)
+        assert other.execute("SELECT COUNT(*) FROM sync_state").fetchone()[0] == 6
+
+    def test_fingerprints_round_trip(self, db_path: Path):
+        state = SqliteSyncState(db_path)
+        state.record(1, "s", "r", spec_fingerprint="sf", resource_fingerprint="rf")
+        assert state.get_entry(1) == {
+            "spec_hash": "s",
+            "resource_hash": "r",
+            "spec_fingerprint": "sf",
+            "resource_fingerprint": "rf",
+        }
+
+    def test_upgrades_database_without_fingerprint_columns(self, db_path: Path):
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            "CREATE TABLE sync_state (product_id INTEGER PRIMARY KEY,"
+            " spec_hash TEXT NOT NULL, resource_hash TEXT NOT NULL);"
+            "INSERT INTO sync_state VALUES (9, 's9', 'r9');"
+        )
+        conn.close()
+
+        state = SqliteSyncState(db_path)
+        assert state.get_entry(9) == {"spec_hash": "s9", "resource_hash": "r9"}
+        state.record(9, "s9", "r9", spec_fingerprint="sf", resource_fingerprint="rf")
+        assert state.get_entry(9)["resource_fingerprint"] == "rf"
+
+    def test_wal_mode(self, db_path: Path):
+        SqliteSyncState(db_path)
+        mode = sqlite3.connect(db_path).execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+
+class TestMigration:
+    def test_migrates_json_entries(self, tmp_path: Path, db_path: Path):
+        json_path = tmp_path / "sync_state.json"
+        json_state = SyncState(json_path)
+        json_state.record(1, "spec1", "res1")
+        json_state.record(2, "spec2", "res2")
+        json_state.save()
+
+        assert migrate_json_state(json_path, db_path) == 2
+
+        state = SqliteSyncState(db_path)
+        assert state.as_dict() == json.loads(json_path.read_text())
+
+    def test_rerun_is_harmless(self, tmp_path: Path, db_path: Path):
+        json_path = tmp_path / "sync_state.json"
+        json_path.write_text(json.dumps({"7": {"spec_hash": "s", "resource_hash": "r"}}))
+
+        migrate_json_state(json_path, db_path)
+        migrate_json_state(json_path, db_path)
+
+        assert SqliteSyncState(db_path).as_dict() == {"7": {"spec_hash": "s", "resource_hash": "r"}}
+
+
+class TestBackendSelection:
+    def test_json_suffix(self, tmp_path: Path):
+        assert isinstance(open_sync_state(tmp_path / "state.json"), SyncState)
+
+    def test_db_suffix(self, tmp_path: Path):
+        assert isinstance(open_sync_state(tmp_path / "state.db"), SqliteSyncState)
+
+    def test_bridge_uses_sqlite_for_db_path(self, db_path: Path):
+        bridge = NondominiumBridge(
+            erp_client=MockERPClient(),
+            gateway_client=HolochainGatewayClient(GatewayConfig()),
+            state_path=db_path,
+        )
+        assert isinstance(bridge.state, SqliteSyncState)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import base64
 import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
 
 from bridge.config import GatewayConfig
-from bridge.erp_mock import MockERPClient
+from bridge.erp_mock import MOCK_PRODUCTS, MockERPClient, MockProduct
 from bridge.gateway_client import HolochainGatewayClient
 from bridge.sync import NondominiumBridge, SyncResult, SyncState
 
@@ -135,6 +141,15 @@ class TestSyncState:
         assert state_path.exists()
         assert json.loads(state_path.read_text()) == {}
 
+    def test_iter_entries(self, state_path: Path):
+        state = SyncState(state_path)
+        state.record(2, "specB", "resB")
+        state.record(1, "specA", "resA")
+        assert list(state.iter_entries()) == [
+            (2, {"spec_hash": "specB", "resource_hash": "resB"}),
+            (1, {"spec_hash": "specA", "resource_hash": "resA"}),
+        ]
+
 
 # --- SyncResult tests ---
 
@@ -150,6 +165,7 @@ class TestSyncResult:
     def test_total_processed(self):
         r = SyncResult(specs_created=2, skipped=1, errors=["e1"])
         assert r.total_processed == 4  # 2 + 1 + 1
+        assert SyncResult(withdrawn=2, resources_retired=3).total_processed == 2
 
 
 # --- Full sync pipeline tests ---
@@ -251,3 +267,468 @@ class TestSyncPipeline:
         assert result.resources_created == 3  # resource failed for first
         assert len(result.errors) == 1
         assert "resource creation failed" in result.errors[0]
+
+
+# --- Delta sync tests ---
+
+
+def _synced_bridge(httpserver: HTTPServer, bridge: NondominiumBridge) -> NondominiumBridge:
+    for p in bridge.erp.get_available_products():
+        _register_product_handlers(httpserver, p.id, p.name, p.category)
+    bridge.sync_inventory()
+    httpserver.clear()
+    return bridge
+
+
+def _change_product(bridge: NondominiumBridge, product_id: int, **changes: object) -> None:
+    erp = bridge.erp
+    assert isinstance(erp, MockERPClient)
+    product = erp.get_product_by_id(product_id)
+    assert product is not None
+    erp.upsert_product(replace(product, **changes))
+
+
+class TestDeltaSync:
+    def test_full_sync_records_fingerprints(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+        entry = bridge.state.get_entry(1)
+        assert entry is not None
+        assert "spec_fingerprint" in entry
+        assert "resource_fingerprint" in entry
+
+    def test_unchanged_catalog_makes_no_calls(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert result.skipped == 4
+        assert result.resources_created == 0
+        assert len(httpserver.log) == 0
+
+    def test_quantity_change_replaces_resource_only(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+        old_entry = bridge.state.get_entry(3)
+        _change_product(bridge, 3, qty_available=4.0)
+
+        httpserver.expect_ordered_request(
+            _zome_path("create_economic_resource"),
+        ).respond_with_json(_mock_resource_response(50))
+        httpserver.expect_ordered_request(
+            _zome_path("update_resource_state"),
+        ).respond_with_json(None)
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert result.specs_created == 0
+        assert result.resources_created == 1
+        assert result.updated == 1
+        assert result.resources_retired == 1
+        assert result.skipped == 3
+        assert result.errors == []
+
+        retire_payload = json.loads(base64.b64decode(httpserver.log[1][0].args["payload"]))
+        assert retire_payload["new_state"] == "Retired"
+
+        new_entry = bridge.state.get_entry(3)
+        assert old_entry is not None and new_entry is not None
+        assert new_entry["spec_hash"] == old_entry["spec_hash"]
+        assert new_entry["resource_hash"] == _encoded_hash(150)
+        assert new_entry["resource_fingerprint"] != old_entry["resource_fingerprint"]
+
+    def test_description_change_republishes_spec(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+        _change_product(bridge, 1, description="Upgraded to MK4S")
+
+        _register_product_handlers(httpserver, 60, "Prusa MK4 3D Printer", "equipment")
+        httpserver.expect_ordered_request(
+            _zome_path("update_resource_state"),
+        ).respond_with_json(None)
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert result.specs_created == 1
+        assert result.resources_created == 1
+        assert result.updated == 0
+        assert result.resources_retired == 1
+        entry = bridge.state.get_entry(1)
+        assert entry is not None
+        assert entry["spec_hash"] == _encoded_hash(60)
+
+    def test_changed_products_only_on_rerun(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+        _change_product(bridge, 4, qty_available=7.0)
+        httpserver.expect_request(_zome_path("create_economic_resource")).respond_with_json(
+            _mock_resource_response(70)
+        )
+        httpserver.expect_request(_zome_path("update_resource_state")).respond_with_json(None)
+        bridge.sync_inventory(delta=True)
+        httpserver.clear()
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert result.skipped == 4
+        assert len(httpserver.log) == 0
+
+    def test_legacy_entries_adopt_baseline(self, httpserver: HTTPServer, state_path: Path):
+        legacy = SyncState(state_path)
+        for p in MOCK_PRODUCTS:
+            legacy.record(p.id, f"spec{p.id}", f"res{p.id}")
+        legacy.save()
+        bridge = NondominiumBridge(
+            erp_client=MockERPClient(),
+            gateway_client=HolochainGatewayClient(
+                GatewayConfig(url=httpserver.url_for("").rstrip("/"), dna_hash=DNA_HASH)
+            ),
+            state_path=state_path,
+        )
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert result.skipped == 4
+        assert len(httpserver.log) == 0
+        entry = bridge.state.get_entry(2)
+        assert entry is not None
+        assert entry["resource_hash"] == "res2"
+        assert "resource_fingerprint" in entry
+
+    def test_retire_failure_keeps_new_resource(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+        _change_product(bridge, 2, qty_available=3.0)
+        httpserver.expect_ordered_request(
+            _zome_path("create_economic_resource"),
+        ).respond_with_json(_mock_resource_response(80))
+        httpserver.expect_ordered_request(
+            _zome_path("update_resource_state"),
+        ).respond_with_data("Error", status=500)
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert result.resources_created == 1
+        assert result.resources_retired == 0
+        assert len(result.errors) == 1
+        assert "retiring superseded resource" in result.errors[0]
+        entry = bridge.state.get_entry(2)
+        assert entry is not None
+        assert entry["resource_hash"] == _encoded_hash(180)
+
+    def test_out_of_stock_retires_resource(self, httpserver: HTTPServer, bridge: NondominiumBridge):
+        _synced_bridge(httpserver, bridge)
+        old_entry = bridge.state.get_entry(3)
+        assert old_entry is not None
+        _change_product(bridge, 3, qty_available=0.0)
+        httpserver.expect_request(_zome_path("update_resource_state")).respond_with_json(None)
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert (result.resources_retired, result.withdrawn) == (1, 1)
+        assert result.resources_created == 0
+        assert result.errors == []
+        assert result.total_processed == 4  # 3 unchanged + 1 withdrawn
+        assert len(httpserver.log) == 1
+        retire_payload = json.loads(base64.b64decode(httpserver.log[0][0].args["payload"]))
+        assert retire_payload["new_state"] == "Retired"
+        entry = bridge.state.get_entry(3)
+        assert entry is not None
+        assert entry["resource_hash"] == ""
+        assert entry["spec_hash"] == old_entry["spec_hash"]
+
+        httpserver.clear()
+        assert bridge.sync_inventory(delta=True).skipped == 4  # nothing left to retire
+        assert len(httpserver.log) == 0
+
+        # Back in stock: a new resource under the existing spec, nothing to retire.
+        _change_product(bridge, 3, qty_available=5.0)
+        httpserver.expect_request(_zome_path("create_economic_resource")).respond_with_json(
+            _mock_resource_response(90)
+        )
+        result = bridge.sync_inventory(delta=True)
+        assert (result.specs_created, result.updated, result.resources_retired) == (0, 1, 0)
+        assert [request.path for request, _ in httpserver.log] == [
+            _zome_path("create_economic_resource")
+        ]
+        entry = bridge.state.get_entry(3)
+        assert entry is not None
+        assert entry["resource_hash"] == _encoded_hash(190)
+        assert entry["spec_hash"] == old_entry["spec_hash"]
+
+    def test_removed_product_retires_resource(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+        erp = bridge.erp
+        assert isinstance(erp, MockERPClient)
+        erp.remove_product(2)
+        httpserver.expect_request(_zome_path("update_resource_state")).respond_with_json(None)
+
+        result = bridge.sync_inventory(delta=True)
+
+        assert (result.resources_retired, result.withdrawn) == (1, 1)
+        assert result.skipped == 3
+        assert result.total_processed == 4
+        assert len(httpserver.log) == 1
+        entry = bridge.state.get_entry(2)
+        assert entry is not None and entry["resource_hash"] == ""
+
+    def test_plain_sync_ignores_out_of_stock(
+        self, httpserver: HTTPServer, bridge: NondominiumBridge
+    ):
+        _synced_bridge(httpserver, bridge)
+        _change_product(bridge, 3, qty_available=0.0)
+
+        result = bridge.sync_inventory()
+
+        assert result.skipped == 3
+        assert len(httpserver.log) == 0
+
+
+# --- Concurrent sync tests ---
+
+
+@pytest.fixture()
+def threaded_server() -> Iterator[HTTPServer]:
+    server = HTTPServer(threaded=True)
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+class _RecordingGateway:
+    """Threaded fake gateway that answers spec/resource creation for any product."""
+
+    def __init__(self, fail_spec_for: str | None = None) -> None:
+        self.fail_spec_for = fail_spec_for
+        self.calls: list[tuple[str, int]] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, fn_name: str, product_id: int) -> None:
+        with self._lock:
+            self.calls.append((fn_name, product_id))
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    @staticmethod
+    def _payload(request: Request) -> dict:
+        return json.loads(base64.b64decode(request.args["payload"]))
+
+    def spec(self, request: Request) -> Response:
+        payload = self._payload(request)
+        product = next(p for p in MOCK_PRODUCTS if p.name == payload["name"])
+        self._enter("spec", product.id)
+        try:
+            time.sleep(0.05)
+            if payload["name"] == self.fail_spec_for:
+                return Response("Internal Server Error", status=500)
+            body = _mock_spec_response(product.id, product.name, product.category)
+            return Response(json.dumps(body), content_type="application/json")
+        finally:
+            self._exit()
+
+    def resource(self, request: Request) -> Response:
+        product_id = self._payload(request)["spec_hash"][3]
+        self._enter("resource", product_id)
+        try:
+            time.sleep(0.05)
+            body = _mock_resource_response(product_id)
+            return Response(json.dumps(body), content_type="application/json")
+        finally:
+            self._exit()
+
+    def register(self, server: HTTPServer) -> None:
+        server.expect_request(_zome_path("create_resource_specification")).respond_with_handler(
+            self.spec
+        )
+        server.expect_request(_zome_path("create_economic_resource")).respond_with_handler(
+            self.resource
+        )
+
+
+def _encoded_hash(seed: int) -> str:
+    """The base64url string the client produces for _fake_action_hash(seed)."""
+    return base64.urlsafe_b64encode(bytes(_fake_action_hash(seed))).rstrip(b"=").decode()
+
+
+def _threaded_bridge(server: HTTPServer, state_path: Path, workers: int) -> NondominiumBridge:
+    config = GatewayConfig(
+        url=server.url_for("").rstrip("/"), timeout=5, app_id=APP_ID, dna_hash=DNA_HASH
+    )
+    return NondominiumBridge(
+        erp_client=MockERPClient(),
+        gateway_client=HolochainGatewayClient(config),
+        state_path=state_path,
+        workers=workers,
+    )
+
+
+class TestConcurrentSync:
+    def test_all_products_synced(self, threaded_server: HTTPServer, state_path: Path):
+        gateway = _RecordingGateway()
+        gateway.register(threaded_server)
+        bridge = _threaded_bridge(threaded_server, state_path, workers=4)
+
+        result = bridge.sync_inventory()
+
+        assert result.specs_created == 4
+        assert result.resources_created == 4
+        assert result.errors == []
+        assert gateway.max_in_flight > 1
+        for p in MOCK_PRODUCTS:
+            entry = bridge.state.get_entry(p.id)
+            assert entry is not None
+            assert entry["spec_hash"] == _encoded_hash(p.id)
+            assert entry["resource_hash"] == _encoded_hash(p.id + 100)
+
+    def test_spec_precedes_resource_per_product(
+        self, threaded_server: HTTPServer, state_path: Path
+    ):
+        gateway = _RecordingGateway()
+        gateway.register(threaded_server)
+        bridge = _threaded_bridge(threaded_server, state_path, workers=4)
+
+        bridge.sync_inventory()
+
+        for p in MOCK_PRODUCTS:
+            assert gateway.calls.index(("spec", p.id)) < gateway.calls.index(("resource", p.id))
+
+    def test_per_item_errors_in_catalog_order(self, threaded_server: HTTPServer, state_path: Path):
+        gateway = _RecordingGateway(fail_spec_for=MOCK_PRODUCTS[1].name)
+        gateway.register(threaded_server)
+        bridge = _threaded_bridge(threaded_server, state_path, workers=3)
+
+        result = bridge.sync_inventory()
+
+        assert result.specs_created == 3
+        assert result.resources_created == 3
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith(f"Product {MOCK_PRODUCTS[1].id} ")
+        assert not bridge.state.is_synced(MOCK_PRODUCTS[1].id)
+
+    def test_idempotent_rerun(self, threaded_server: HTTPServer, state_path: Path):
+        gateway = _RecordingGateway()
+        gateway.register(threaded_server)
+        bridge = _threaded_bridge(threaded_server, state_path, workers=4)
+        bridge.sync_inventory()
+        calls_after_first = len(gateway.calls)
+
+        result = bridge.sync_inventory()
+
+        assert result.skipped == 4
+        assert result.specs_created == 0
+        assert len(gateway.calls) == calls_after_first
+
+    def test_workers_override_per_call(self, threaded_server: HTTPServer, state_path: Path):
+        gateway = _RecordingGateway()
+        gateway.register(threaded_server)
+        bridge = _threaded_bridge(threaded_server, state_path, workers=4)
+
+        result = bridge.sync_inventory(workers=1)
+
+        assert result.resources_created == 4
+        assert gateway.max_in_flight == 1
+
+
+# --- Streaming tests ---
+
+
+class _StreamingERP(MockERPClient):
+    """ERP client that generates products lazily and counts how many were pulled."""
+
+    def __init__(self, count: int) -> None:
+        super().__init__()
+        self.count = count
+        self.pulled = 0
+
+    def iter_products(self, available_only: bool = False) -> Iterator[MockProduct]:
+        template = MOCK_PRODUCTS[0]
+        for i in range(1, self.count + 1):
+            self.pulled += 1
+            yield replace(template, id=i, name=f"Streamed {i}")
+
+    def get_available_products(self) -> list[MockProduct]:
+        raise AssertionError("sync must not materialize the catalog")
+
+
+class _FailingERP(MockERPClient):
+    def iter_products(self, available_only: bool = False) -> Iterator[MockProduct]:
+        yield MOCK_PRODUCTS[0]
+        raise RuntimeError("ERP connection lost")
+
+
+class TestStreamingSync:
+    def test_first_resources_before_fetch_finishes(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, state_path: Path
+    ):
+        erp = _StreamingERP(count=50)
+        pulled_at_first_call: list[int] = []
+
+        def spec_handler(request: Request) -> Response:
+            pulled_at_first_call.append(erp.pulled)
+            body = _mock_spec_response(1, "Streamed", "equipment")
+            return Response(json.dumps(body), content_type="application/json")
+
+        httpserver.expect_request(_zome_path("create_resource_specification")).respond_with_handler(
+            spec_handler
+        )
+        httpserver.expect_request(_zome_path("create_economic_resource")).respond_with_json(
+            _mock_resource_response(1)
+        )
+        bridge = NondominiumBridge(
+            erp_client=erp, gateway_client=client, state_path=state_path, prefetch=5
+        )
+
+        result = bridge.sync_inventory()
+
+        assert result.resources_created == 50
+        assert pulled_at_first_call[0] < 50
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_producer_error_propagates(
+        self,
+        httpserver: HTTPServer,
+        client: HolochainGatewayClient,
+        state_path: Path,
+        workers: int,
+    ):
+        _register_product_handlers(httpserver, 1, MOCK_PRODUCTS[0].name, "equipment")
+        bridge = NondominiumBridge(
+            erp_client=_FailingERP(), gateway_client=client, state_path=state_path, workers=workers
+        )
+
+        with pytest.raises(RuntimeError, match="ERP connection lost"):
+            bridge.sync_inventory()
+        # The product published before the failure is saved, so no rerun recreates it.
+        assert SyncState(state_path).get_entry(MOCK_PRODUCTS[0].id) is not None
+
+    def test_prefetch_disabled_streams_inline(
+        self, httpserver: HTTPServer, client: HolochainGatewayClient, state_path: Path
+    ):
+        erp = _StreamingERP(count=3)
+        httpserver.expect_request(_zome_path("create_resource_specification")).respond_with_json(
+            _mock_spec_response(1, "Streamed", "equipment")
+        )
+        httpserver.expect_request(_zome_path("create_economic_resource")).respond_with_json(
+            _mock_resource_response(1)
+        )
+        bridge = NondominiumBridge(
+            erp_client=erp, gateway_client=client, state_path=state_path, prefetch=0
+        )
+
+        assert bridge.sync_inventory().resources_created == 3
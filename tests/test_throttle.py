@@ -0,0 +1,201 @@
+"""Tests for the rate limiter, the adaptive concurrency limiter and their use in the clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from bridge.async_gateway_client import AsyncHolochainGatewayClient
+from bridge.config import GatewayConfig
+from bridge.gateway_client import GatewayError, HolochainGatewayClient
+from bridge.throttle import AdaptiveConcurrencyLimiter, RateLimiter
+
+DNA_HASH = "uhC0kTestDnaHash"
+APP_ID = "nondominium"
+ZOME = "zome_resource"
+
+SPEC = {
+    "name": "Prusa MK4",
+    "description": "3D printer",
+    "category": "equipment",
+    "image_url": None,
+    "tags": [],
+    "is_active": True,
+}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _zome_path(fn_name: str) -> str:
+    return f"/{DNA_HASH}/{APP_ID}/{ZOME}/{fn_name}"
+
+
+@pytest.fixture()
+def config(httpserver: HTTPServer) -> GatewayConfig:
+    return GatewayConfig(
+        url=httpserver.url_for("").rstrip("/"), timeout=5, app_id=APP_ID, dna_hash=DNA_HASH
+    )
+
+
+class TestRateLimiter:
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10.0, burst=2, clock=clock)
+        waits = [limiter.reserve(ZOME, "get_x") for _ in range(4)]
+        assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+        clock.now += 1.0
+        assert limiter.reserve(ZOME, "get_x") == 0.0
+
+    def test_buckets_per_function(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=1.0, rates={"get_fast": 100.0}, clock=clock)
+        assert limiter.reserve(ZOME, "get_x") == 0.0
+        assert limiter.reserve(ZOME, "get_x") == pytest.approx(1.0)
+        assert limiter.reserve("zome_gouvernance", "get_x") == 0.0
+        assert [limiter.reserve(ZOME, "get_fast") for _ in range(100)] == [0.0] * 100
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_grows_while_saturated_and_healthy(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4, clock=clock)
+        for _ in range(20):
+            tickets = [limiter.acquire() for _ in range(limiter.limit)]
+            for ticket in tickets:
+                limiter.release(ticket)
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_idle_window_does_not_grow(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, clock=FakeClock())
+        for _ in range(50):
+            limiter.release(limiter.acquire())
+        assert limiter.limit == 8
+
+    def test_overload_shrinks_once_per_window(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff=0.5, clock=clock)
+        tickets = [limiter.acquire() for _ in range(10)]
+        clock.now += 0.1
+        for ticket in tickets:
+            limiter.release(ticket, overloaded=True)
+        assert limiter.limit == 5
+
+        clock.now += 0.1
+        limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 2
+        for _ in range(5):
+            clock.now += 0.1
+            limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 1  # min_limit
+
+    def test_slow_request_counts_as_overload(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, latency_target=1.0, clock=clock)
+        ticket = limiter.acquire()
+        clock.now += 1.5
+        limiter.release(ticket)
+        assert limiter.limit == 2
+
+    def test_threads_wait_for_a_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        ticket = limiter.acquire()
+        acquired = threading.Event()
+
+        def worker() -> None:
+            limiter.release(limiter.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release(ticket)
+        assert acquired.wait(5)
+        thread.join()
+
+    def test_async_waiters_and_cancellation(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+
+        async def run() -> None:
+            ticket = await limiter.acquire_async()
+            cancelled = asyncio.create_task(limiter.acquire_async())
+            queued = asyncio.create_task(limiter.acquire_async())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            limiter.release(ticket)
+            limiter.release(await asyncio.wait_for(queued, 5))
+            assert cancelled.cancelled()
+
+        asyncio.run(run())
+        assert limiter.in_flight == 0
+
+
+class TestClientThrottling:
+    def test_rate_limited_calls_are_spaced(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_json(SPEC)
+        client = HolochainGatewayClient(config, rate_limiter=RateLimiter(rate=20.0, burst=1))
+
+        start = time.perf_counter()
+        for _ in range(3):
+            client.get_latest_resource_specification("uhCkkSpec")
+        assert time.perf_counter() - start >= 0.09
+
+    def test_gateway_errors_shrink_the_window(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_data("overloaded", status=503)
+        httpserver.expect_request(
+            _zome_path("get_resource_specification_with_rules")
+        ).respond_with_data("bad request", status=400)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        client = HolochainGatewayClient(config, concurrency_limiter=limiter)
+
+        with pytest.raises(GatewayError):
+            client.get_resource_specification_with_rules("uhCkkSpec")
+        assert limiter.limit == 8
+        with pytest.raises(GatewayError):
+            client.get_latest_resource_specification("uhCkkSpec")
+        assert limiter.limit == 5
+        assert limiter.in_flight == 0
+
+    def test_async_calls_bounded_by_window(self, httpserver: HTTPServer, config: GatewayConfig):
+        httpserver.expect_request(
+            _zome_path("get_latest_resource_specification")
+        ).respond_with_json(SPEC)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        peak = 0
+
+        async def run() -> None:
+            nonlocal peak
+            async with AsyncHolochainGatewayClient(config, concurrency_limiter=limiter) as client:
+
+                async def call() -> None:
+                    nonlocal peak
+                    task = asyncio.ensure_future(
+                        client.get_latest_resource_specification("uhCkkSpec")
+                    )
+                    while not task.done():
+                        peak = max(peak, limiter.in_flight)
+                        await asyncio.sleep(0)
+                    await task
+
+                await asyncio.gather(*(call() for _ in range(8)))
+
+        asyncio.run(run())
+        assert 0 < peak <= 2
+        assert limiter.in_flight == 0